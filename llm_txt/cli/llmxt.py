@@ -459,8 +459,8 @@ def crawl(ctx, url, max_pages, max_depth, out, full_out):
             respect_robots=True
         )
 
-        crawler = WebCrawlerSync(crawl_config)
-        result = crawler.crawl(url)
+        with WebCrawlerSync(crawl_config) as crawler:
+            result = crawler.crawl(url)
 
         if not result.pages:
             raise click.ClickException("No pages could be crawled")
@@ -607,7 +607,11 @@ def login(ctx):
         if not client_id:
             client_id = click.prompt('Enter GitHub App Client ID')
 
-        success = asyncio.run(auth.device_flow_login(client_id))
+        async def run_login():
+            async with auth:
+                return await auth.device_flow_login(client_id)
+
+        success = asyncio.run(run_login())
 
         if success:
             click.echo("Successfully authenticated!")
@@ -628,7 +632,12 @@ def whoami(ctx):
 
     try:
         auth = GitHubAuth()
-        user = asyncio.run(auth.get_user())
+
+        async def fetch_user():
+            async with auth:
+                return await auth.get_user()
+
+        user = asyncio.run(fetch_user())
 
         if user:
             if ctx.obj.get('json'):
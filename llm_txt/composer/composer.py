@@ -1,10 +1,13 @@
 """Composer for generating LLM-friendly text summaries."""
 
 import os
+import asyncio
 import logging
 import re
 import hashlib
-from typing import Dict, List, Optional, Set, Tuple, Union
+import heapq
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 import cohere
 from dotenv import load_dotenv
 
@@ -24,6 +27,162 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Max characters of documentation sent to Cohere in a single request
+_SUMMARY_CHUNK_CHARS = 50000
+
+# Markdown ATX headers, as text lines
+_HEADER_RE = re.compile(r'^(#+)\s*(.*)$')
+# Code fences and line-leading headers, scanned together during validation
+# so headers inside fenced code can be skipped; str and bytes variants
+_FENCE_OR_HEADER_RE = re.compile(r'(```)|^(#{1,6})[ \t]', re.MULTILINE)
+_FENCE_OR_HEADER_BYTES_RE = re.compile(rb'(```)|^(#{1,6})[ \t]', re.MULTILINE)
+
+_SYSTEM_PROMPT_TMPL = """<role>
+You are a senior technical documentation specialist with expertise in creating LLM-optimized reference materials. You excel at analyzing complex documentation and synthesizing it into clean, structured formats.
+</role>
+
+<task>
+Transform the provided documentation into a comprehensive technical reference optimized for LLMs and developers.
+</task>
+
+<requirements>
+1. Extract installation instructions, setup procedures, and dependencies
+2. Identify core APIs, methods, and configuration options
+3. Preserve clean, runnable code examples without artifacts
+4. Organize content by practical importance (setup → basic usage → advanced)
+5. Remove all non-technical content (marketing, changelogs, navigation)
+6. Maintain technical accuracy while improving clarity
+7. Target approximately {target_kb} KB of content
+</requirements>
+
+<output_format>
+# [Project/Library Name]
+
+## Installation
+
+### Prerequisites
+- Required dependencies and system requirements
+- Version compatibility information
+
+### Install with pip
+```bash
+pip install [package-name]
+```
+
+### Install from source
+```bash
+git clone [repository]
+cd [directory]
+pip install -e .
+```
+
+## Quick Start
+
+Brief description of what this library does and its primary use case.
+
+```python
+# Minimal working example
+from library import MainClass
+client = MainClass(api_key="...")
+result = client.method()
+```
+
+## Core API
+
+### [Primary Class/Function]
+
+**Purpose**: One-line description
+**Parameters**:
+- `param_name` (type): Description
+- `optional_param` (type, optional): Description
+
+**Example**:
+```python
+# Clean, complete example
+result = function(param="value")
+```
+
+## Configuration
+
+### Environment Variables
+- `ENV_VAR_NAME`: Description (default: value)
+
+### Configuration Options
+```python
+config = {{
+    "option": "value",
+    "timeout": 30
+}}
+```
+
+## Common Patterns
+
+### [Use Case 1]
+```python
+# Complete example for common use case
+```
+
+### [Use Case 2]
+```python
+# Another practical example
+```
+
+## Advanced Usage
+
+### Performance Optimization
+- Technique 1: Description
+- Technique 2: Description
+
+### Error Handling
+```python
+try:
+    result = client.method()
+except SpecificError as e:
+    # Handle error
+```
+
+## Troubleshooting
+
+### Common Issues
+- **Issue**: Solution
+- **Error Message**: What it means and how to fix
+
+## API Reference
+
+### Methods
+- `method_name(params)`: Description
+- `another_method(params)`: Description
+
+### Models Available
+- `model-name`: Capabilities and use cases
+</output_format>
+
+<content_rules>
+- REMOVE: All changelog entries, release notes, announcements, dates
+- REMOVE: Marketing language, company information, promotional content
+- REMOVE: Navigation elements, UI components, buttons, links to social media
+- REMOVE: Malformed code with line numbers (1|, 2|, ---|---)
+- CLEAN: Code blocks must be properly formatted with language tags
+- PRESERVE: Technical accuracy, parameter names, API signatures
+- FOCUS: Practical implementation details developers need
+- STRUCTURE: Maintain consistent header hierarchy without skipping levels
+</content_rules>
+
+<quality_checks>
+Before finalizing:
+1. Verify all code examples are complete and runnable
+2. Ensure installation instructions are clear and complete
+3. Check that API documentation includes all essential parameters
+4. Confirm no marketing or changelog content remains
+5. Validate markdown formatting is clean and consistent
+</quality_checks>"""
+
+
+@lru_cache(maxsize=8)
+def _build_system_prompt(target_kb: int) -> str:
+    """Render the summarization system prompt for a target size."""
+    return _SYSTEM_PROMPT_TMPL.format(target_kb=target_kb)
+
 
 class LLMTxtComposer:
     """Composes llm.txt content from crawled pages using Cohere."""
@@ -113,18 +272,44 @@ class LLMTxtComposer:
         if not pages:
             return ""
         
-        # Sort pages by importance (depth, content length, etc.)
-        sorted_pages = self._prioritize_pages(pages)
-        
-        # Build content within size limit
-        content_parts = []
-        total_size = 0
         max_size_bytes = self.max_kb * 1024
-        
-        # Add header
         header = self._generate_header(pages)
-        content_parts.append(header)
-        total_size += len(header.encode('utf-8'))
+        
+        full_content = None
+        
+        # Small crawls: when the raw text is well under budget, format every
+        # page and measure the joined result once instead of per page
+        estimated_size = sum(len(getattr(page, 'markdown', None) or page.content) for page in pages)
+        if estimated_size * 1.2 < max_size_bytes:
+            candidate = "\n\n".join(
+                [header] + [self._format_page_content(page, is_full_version=False)
+                            for page in self._prioritize_pages(pages)]
+            )
+            if len(candidate.encode('utf-8')) <= max_size_bytes:
+                full_content = candidate
+        
+        if full_content is None:
+            full_content = self._fill_size_budget(pages, header, max_size_bytes)
+        
+        # Post-process the content
+        full_content = self._post_process_content(full_content)
+        
+        # Use Cohere to summarize if available and content is too large
+        if self.client and len(full_content.encode('utf-8')) > max_size_bytes:
+            logger.info("Content exceeds size limit, using AI to summarize")
+            summarized = await self._ai_summarize(full_content, target_kb=self.max_kb)
+            # Post-process the AI output too
+            return self._post_process_content(summarized)
+        
+        return full_content
+    
+    def _fill_size_budget(self, pages: Union[List[PageContent], List['Page']], header: str, max_size_bytes: int) -> str:
+        """Join the highest-priority pages that fit within the byte budget."""
+        # Rank pages by importance lazily; the loop stops at the size budget
+        sorted_pages = self._iter_budget_candidates(pages)
+        
+        content_parts = [header]
+        total_size = len(header.encode('utf-8'))
         
         # Add page content
         for page in sorted_pages:
@@ -142,20 +327,7 @@ class LLMTxtComposer:
             content_parts.append(page_content)
             total_size += page_size
         
-        # Join all content
-        full_content = "\n\n".join(content_parts)
-        
-        # Post-process the content
-        full_content = self._post_process_content(full_content)
-        
-        # Use Cohere to summarize if available and content is too large
-        if self.client and len(full_content.encode('utf-8')) > max_size_bytes:
-            logger.info("Content exceeds size limit, using AI to summarize")
-            summarized = await self._ai_summarize(full_content, target_kb=self.max_kb)
-            # Post-process the AI output too
-            return self._post_process_content(summarized)
-        
-        return full_content
+        return "\n\n".join(content_parts)
     
     async def compose_llms_full_txt(self, pages: List[PageContent]) -> str:
         """Compose a full version with all content."""
@@ -178,15 +350,37 @@ class LLMTxtComposer:
         
         return "\n\n".join(content_parts)
     
-    def _prioritize_pages(self, pages: Union[List[PageContent], List['Page']]) -> Union[List[PageContent], List['Page']]:
-        """Sort pages by importance for inclusion - HuggingFace style."""
+    def _iter_budget_candidates(self, pages: Union[List[PageContent], List['Page']]) -> Iterator[Union[PageContent, 'Page']]:
+        """Yield pages best-first, ranking only the top-K unless more are needed."""
+        # Assume ~5 KB per formatted page when estimating how many fit the budget
+        estimated_k = max(20, int(self.max_kb * 1024 / 5000))
+        top_pages = self._prioritize_pages(pages, limit=estimated_k)
+        yield from top_pages
+
+        if len(top_pages) == estimated_k:
+            # Pages were smaller than estimated; continue down the full ranking
+            yield from self._prioritize_pages(pages)[estimated_k:]
+
+    def _prioritize_pages(
+        self,
+        pages: Union[List[PageContent], List['Page']],
+        limit: Optional[int] = None
+    ) -> Union[List[PageContent], List['Page']]:
+        """Sort pages by importance for inclusion - HuggingFace style.
+
+        When ``limit`` is given only the top ``limit`` pages are returned,
+        selected with a heap instead of a full sort.
+        """
         def page_score(page: Union[PageContent, 'Page']) -> float:
             score = 0.0
 
-            title_lower = page.title.lower() if page.title else ""
+            # Read each attribute once; scoring below works on locals
+            title = page.title
+            content = page.content
+            title_lower = title.lower() if title else ""
             # Handle both PageContent (has url) and Page (has url or path)
             url_lower = str(getattr(page, 'url', getattr(page, 'path', ''))).lower()
-            content_lower = page.content[:1000].lower()  # Check first 1000 chars
+            content_lower = content[:1000].lower()  # Check first 1000 chars
             
             # HIGHEST PRIORITY: Installation and setup (like HF)
             install_keywords = ['install', 'installation', 'setup', 'getting-started', 
@@ -220,7 +414,7 @@ class LLMTxtComposer:
             
             # BOOST: Code-heavy pages
             code_indicators = ['```', '<code>', 'import ', 'from ', 'def ', 'class ']
-            code_count = sum(1 for indicator in code_indicators if indicator in page.content)
+            code_count = sum(1 for indicator in code_indicators if indicator in content)
             score += min(code_count * 2, 10)  # Cap at 10 points
             
             # PENALTY: Non-technical content
@@ -256,7 +450,7 @@ class LLMTxtComposer:
                     score -= 5
             
             # Content length scoring
-            content_length = len(page.content)
+            content_length = len(content)
             if 1000 < content_length < 30000:  # Optimal range
                 score += 5
             elif content_length > 100000:  # Too long, probably aggregated
@@ -266,7 +460,14 @@ class LLMTxtComposer:
         
         # Deduplicate pages before sorting
         unique_pages = self._deduplicate_pages(pages)
-        return sorted(unique_pages, key=page_score, reverse=True)
+
+        # Score each page once; the index breaks ties so pages are never compared
+        scored = [(page_score(page), i, page) for i, page in enumerate(unique_pages)]
+        if limit is not None and limit < len(scored):
+            ranked = heapq.nlargest(limit, scored, key=lambda t: (t[0], -t[1]))
+        else:
+            ranked = sorted(scored, key=lambda t: (-t[0], t[1]))
+        return [t[2] for t in ranked]
     
     def _generate_header(self, pages: List[PageContent], is_full_version: bool = False) -> str:
         """Generate minimal header for the llm.txt file."""
@@ -379,179 +580,90 @@ class LLMTxtComposer:
     
     def _truncate_content(self, content: str, max_bytes: int) -> str:
         """Truncate content to fit within byte limit."""
-        if len(content.encode('utf-8')) <= max_bytes:
+        content_bytes = content.encode('utf-8')
+        if len(content_bytes) <= max_bytes:
             return content
         
-        # Find a good truncation point
-        lines = content.split('\n')
-        truncated_lines = []
-        current_size = 0
-        
-        for line in lines:
-            line_size = len((line + '\n').encode('utf-8'))
-            if current_size + line_size > max_bytes - 100:  # Leave some buffer
-                break
-            truncated_lines.append(line)
-            current_size += line_size
-        
-        truncated = '\n'.join(truncated_lines)
+        # Cut at the last line break inside the budget (leave some buffer);
+        # a newline byte is always a UTF-8 character boundary
+        cut = content_bytes.rfind(b'\n', 0, max(max_bytes - 100, 0))
+        truncated = content_bytes[:cut].decode('utf-8') if cut > 0 else ''
         truncated += "\n\n[... content truncated due to size limits ...]"
         
         return truncated
     
     async def _ai_summarize(self, content: str, target_kb: int) -> str:
-        """Use Cohere to summarize content to target size."""
+        """Use Cohere to summarize content to target size.
+
+        Large inputs are split at H2 boundaries and summarized concurrently,
+        then a final reduce call merges the partial summaries.
+        """
         if not self.client:
             # Fallback to simple truncation
             max_bytes = target_kb * 1024
             return self._truncate_content(content, max_bytes)
         
         try:
-            system_prompt = f"""<role>
-You are a senior technical documentation specialist with expertise in creating LLM-optimized reference materials. You excel at analyzing complex documentation and synthesizing it into clean, structured formats.
-</role>
-
-<task>
-Transform the provided documentation into a comprehensive technical reference optimized for LLMs and developers.
-</task>
-
-<requirements>
-1. Extract installation instructions, setup procedures, and dependencies
-2. Identify core APIs, methods, and configuration options
-3. Preserve clean, runnable code examples without artifacts
-4. Organize content by practical importance (setup → basic usage → advanced)
-5. Remove all non-technical content (marketing, changelogs, navigation)
-6. Maintain technical accuracy while improving clarity
-7. Target approximately {target_kb} KB of content
-</requirements>
-
-<output_format>
-# [Project/Library Name]
-
-## Installation
-
-### Prerequisites
-- Required dependencies and system requirements
-- Version compatibility information
-
-### Install with pip
-```bash
-pip install [package-name]
-```
-
-### Install from source
-```bash
-git clone [repository]
-cd [directory]
-pip install -e .
-```
-
-## Quick Start
-
-Brief description of what this library does and its primary use case.
-
-```python
-# Minimal working example
-from library import MainClass
-client = MainClass(api_key="...")
-result = client.method()
-```
-
-## Core API
-
-### [Primary Class/Function]
-
-**Purpose**: One-line description
-**Parameters**:
-- `param_name` (type): Description
-- `optional_param` (type, optional): Description
-
-**Example**:
-```python
-# Clean, complete example
-result = function(param="value")
-```
-
-## Configuration
-
-### Environment Variables
-- `ENV_VAR_NAME`: Description (default: value)
-
-### Configuration Options
-```python
-config = {{
-    "option": "value",
-    "timeout": 30
-}}
-```
-
-## Common Patterns
-
-### [Use Case 1]
-```python
-# Complete example for common use case
-```
-
-### [Use Case 2]
-```python
-# Another practical example
-```
-
-## Advanced Usage
-
-### Performance Optimization
-- Technique 1: Description
-- Technique 2: Description
-
-### Error Handling
-```python
-try:
-    result = client.method()
-except SpecificError as e:
-    # Handle error
-```
-
-## Troubleshooting
-
-### Common Issues
-- **Issue**: Solution
-- **Error Message**: What it means and how to fix
-
-## API Reference
-
-### Methods
-- `method_name(params)`: Description
-- `another_method(params)`: Description
+            chunks = self._split_for_summary(content)
+            if len(chunks) == 1:
+                summary = await self._summarize_chunk(chunks[0], target_kb)
+            else:
+                chunk_kb = max(1, target_kb // len(chunks))
+                partials = await asyncio.gather(
+                    *[self._summarize_chunk(chunk, chunk_kb) for chunk in chunks],
+                    return_exceptions=True
+                )
+                summaries = [p for p in partials if isinstance(p, str) and p.strip()]
+                for p in partials:
+                    if isinstance(p, Exception):
+                        logger.warning(f"Chunk summarization failed: {p}")
+                if not summaries:
+                    raise RuntimeError("All chunk summarizations failed")
+                logger.info(f"Merging {len(summaries)} partial summaries from {len(chunks)} chunks")
+                summary = await self._summarize_chunk("\n\n".join(summaries), target_kb)
 
-### Models Available
-- `model-name`: Capabilities and use cases
-</output_format>
+            logger.info(f"AI summarization completed. Original: {len(content)}chars, Summary: {len(summary)}chars")
+            return summary
+            
+        except Exception as e:
+            logger.error(f"AI summarization failed: {e}")
+            # Fallback to truncation
+            max_bytes = target_kb * 1024
+            return self._truncate_content(content, max_bytes)
 
-<content_rules>
-- REMOVE: All changelog entries, release notes, announcements, dates
-- REMOVE: Marketing language, company information, promotional content
-- REMOVE: Navigation elements, UI components, buttons, links to social media
-- REMOVE: Malformed code with line numbers (1|, 2|, ---|---)
-- CLEAN: Code blocks must be properly formatted with language tags
-- PRESERVE: Technical accuracy, parameter names, API signatures
-- FOCUS: Practical implementation details developers need
-- STRUCTURE: Maintain consistent header hierarchy without skipping levels
-</content_rules>
+    def _split_for_summary(self, content: str) -> List[str]:
+        """Split content into chunks of at most _SUMMARY_CHUNK_CHARS at H2 boundaries."""
+        if len(content) <= _SUMMARY_CHUNK_CHARS:
+            return [content]
+
+        chunks = []
+        current = ""
+        for section in re.split(r'\n(?=## )', content):
+            # Oversized sections are sliced so nothing is silently dropped
+            while len(section) > _SUMMARY_CHUNK_CHARS:
+                if current:
+                    chunks.append(current)
+                    current = ""
+                chunks.append(section[:_SUMMARY_CHUNK_CHARS])
+                section = section[_SUMMARY_CHUNK_CHARS:]
+            if current and len(current) + len(section) + 1 > _SUMMARY_CHUNK_CHARS:
+                chunks.append(current)
+                current = section
+            else:
+                current = f"{current}\n{section}" if current else section
+        if current:
+            chunks.append(current)
+        return chunks
 
-<quality_checks>
-Before finalizing:
-1. Verify all code examples are complete and runnable
-2. Ensure installation instructions are clear and complete
-3. Check that API documentation includes all essential parameters
-4. Confirm no marketing or changelog content remains
-5. Validate markdown formatting is clean and consistent
-</quality_checks>"""
-            
-            user_message = f"""<documents>
+    async def _summarize_chunk(self, content: str, target_kb: int) -> str:
+        """Summarize a single chunk with Cohere without blocking the event loop."""
+        system_prompt = _build_system_prompt(target_kb)
+        
+        user_message = f"""<documents>
 <document>
 <source>Technical Documentation</source>
 <content>
-{content[:50000]}
+{content}
 </content>
 </document>
 </documents>
@@ -559,28 +671,20 @@ Before finalizing:
 <instruction>
 Analyze the documentation above and create a structured technical reference following the specified format. Focus on extracting practical, actionable information that developers need.
 </instruction>"""
-            
-            response = self.client.chat(
-                model="command-r-plus-08-2024",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.0,
-                seed=42,  # For deterministic output
-                max_tokens=4000
-            )
-            
-            summary = response.message.content[0].text
-            logger.info(f"AI summarization completed. Original: {len(content)}chars, Summary: {len(summary)}chars")
-            
-            return summary
-            
-        except Exception as e:
-            logger.error(f"AI summarization failed: {e}")
-            # Fallback to truncation
-            max_bytes = target_kb * 1024
-            return self._truncate_content(content, max_bytes)
+        
+        response = await asyncio.to_thread(
+            self.client.chat,
+            model="command-r-plus-08-2024",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message}
+            ],
+            temperature=0.0,
+            seed=42,  # For deterministic output
+            max_tokens=4000
+        )
+        
+        return response.message.content[0].text
     
     def _deduplicate_pages(self, pages: List[PageContent]) -> List[PageContent]:
         """Remove duplicate content based on content hash."""
@@ -612,11 +716,10 @@ Analyze the documentation above and create a structured technical reference foll
         processed_lines = []
         header_stack = []
         
-        header_re = re.compile(r'^(#+)\s*(.*)$')
         for line in lines:
             # Track and fix header hierarchy robustly
             if line.startswith('#'):
-                m = header_re.match(line)
+                m = _HEADER_RE.match(line)
                 if m:
                     level = len(m.group(1))
                     text = m.group(2) or ""
@@ -643,29 +746,49 @@ Analyze the documentation above and create a structured technical reference foll
         return content.strip()
 
     # Quality validation added to support JobManager usage
-    def _validate_output_quality(self, content: str):
+    def _validate_output_quality(self, content: Union[str, bytes]):
         """Lightweight sanity checks for composed content.
 
-        Returns a tuple (is_valid, issues).
+        Accepts text or UTF-8 bytes. Returns a tuple (is_valid, issues).
         Keeps checks conservative to avoid false negatives.
         """
         issues: list[str] = []
-        text = content or ""
+        content = content or ""
 
-        if not text.strip():
+        if not content.strip():
             issues.append("Empty content")
+            return (False, issues)
 
         # Check unbalanced fenced code blocks (```)
-        fences = text.count("```")
-        if fences % 2 == 1:
+        fence = "```" if isinstance(content, str) else b"```"
+        if content.count(fence) % 2 == 1:
             issues.append("Unclosed fenced code block")
 
-        # Check for excessive size (very rough guard, independent of budgeting)
-        if len(text) > (self.max_kb * 1024 * 2):
+        # Check for excessive size (very rough guard, independent of budgeting).
+        # Measured in UTF-8 bytes; ASCII text needs no encoding to know that
+        if isinstance(content, str) and not content.isascii():
+            size = len(content.encode('utf-8'))
+        else:
+            size = len(content)
+        if size > (self.max_kb * 1024 * 2):
             issues.append("Output exceeds 2x configured max_kb")
 
-        # Basic header structure heuristic (optional)
-        # Not strictly required; skip strict enforcement to keep valid
-        # developer docs that start without a title.
+        # Header levels should not be skipped below a section (e.g. ## followed
+        # by ####). A title followed directly by ### is common in developer
+        # docs and accepted, as is a missing title. Fenced code is ignored.
+        scanner = _FENCE_OR_HEADER_RE if isinstance(content, str) else _FENCE_OR_HEADER_BYTES_RE
+        in_code = False
+        prev_level = 0
+        for m in scanner.finditer(content):
+            if m.group(1):
+                in_code = not in_code
+                continue
+            if in_code:
+                continue
+            level = len(m.group(2))
+            if prev_level >= 2 and level > prev_level + 1:
+                issues.append("Header hierarchy skips levels")
+                break
+            prev_level = level
 
         return (len(issues) == 0, issues)
@@ -3,20 +3,155 @@
 import asyncio
 import logging
 import time
-from typing import List, Set, Optional, Dict, Any
+from collections import deque
+from typing import Deque, List, Set, Optional, Dict, Any
 import re
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, urldefrag, urlencode, urljoin, urlparse, urlunparse
 import aiohttp
 from aiohttp import ClientError, ClientTimeout
-from bs4 import BeautifulSoup
 import html2text
+import lxml.etree
+import lxml.html
 
+from .markdown import count_words, tree_to_markdown
 from .models import CrawlConfig, PageContent, CrawlResult
 from .robots import RobotsChecker
 from .sitemap import SitemapParser
 
 logger = logging.getLogger(__name__)
 
+# aiohttp transparently decodes brotli responses when a brotli module is installed
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+# Pages are handed to lxml as UTF-8 bytes; str input with an XML encoding
+# declaration (common on XHTML docs) is rejected by lxml
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+
+# Compiled main content lookups in priority order (CSS: main, article, [role="main"],
+# .main-content, .content, .documentation, #main, #content, #documentation)
+_MAIN_CONTENT_XPATHS = tuple(
+    lxml.etree.XPath(expression) for expression in
+    ['//main', '//article', '//*[@role="main"]']
+    + [f'//*[contains(concat(" ", normalize-space(@class), " "), " {name} ")]'
+       for name in ('main-content', 'content', 'documentation')]
+    + [f'//*[@id="{name}"]' for name in ('main', 'content', 'documentation')]
+)
+
+# URL path suffixes that are never HTML pages (str.endswith takes the tuple)
+_NON_HTML_EXTS = (
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.zip', '.tar', '.gz', '.rar', '.7z',
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg',
+    '.mp3', '.mp4', '.avi', '.mov', '.wav',
+    '.css', '.js', '.json', '.xml', '.txt'
+)
+
+# lang attribute of the <html> start tag
+_HTML_LANG_RE = re.compile(r'<html\b[^>]*?\slang\s*=\s*["\']?([^"\'\s>]*)', re.IGNORECASE)
+
+# Runs of slashes inside a URL path
+_SLASHES_RE = re.compile(r'/{2,}')
+
+# The document title where the HTML parser places it
+_TITLE_XPATH = lxml.etree.XPath('string(/html/head/title[1])')
+
+# Locale-like first path segment: 'fr', 'zh-tw', 'pt_br', ...
+_LOCALE_RE = re.compile(r"[a-z]{2}([-_][a-z]{2,4})?")
+
+_LOWERCASE = "translate({}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+# Boilerplate removed before content extraction: unwanted tags, plus any
+# element whose class or id contains one of the unwanted tokens
+_UNWANTED_TAGS = ('script', 'style', 'nav', 'footer', 'aside', 'header')
+_UNWANTED_TOKENS = ('nav', 'navigation', 'menu', 'sidebar', 'footer', 'header', 'breadcrumb')
+_CLEANUP_XPATH = lxml.etree.XPath(
+    '|'.join(f'//{tag}' for tag in _UNWANTED_TAGS)
+    + '|//*['
+    + ' or '.join(
+        f"contains({_LOWERCASE.format(attr)}, '{token}')"
+        for attr in ('@class', '@id')
+        for token in _UNWANTED_TOKENS
+    )
+    + ']'
+)
+
+
+def _parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse an HTML document into an lxml tree."""
+    return lxml.html.document_fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+
+
+async def _read_text(response: aiohttp.ClientResponse, max_bytes: int) -> Optional[str]:
+    """Stream a response body and decode it with the declared charset.
+
+    Returns None as soon as the body is known to exceed ``max_bytes``.
+    Unlike ``response.text()`` this never falls back to charset sniffing.
+    """
+    if response.content_length is not None and response.content_length > max_bytes:
+        return None
+    
+    body = bytearray()
+    async for chunk in response.content.iter_chunked(64 * 1024):
+        body.extend(chunk)
+        if len(body) > max_bytes:
+            return None
+    
+    try:
+        return body.decode(response.charset or 'utf-8', errors='replace')
+    except LookupError:
+        # Unknown charset name in Content-Type
+        return body.decode('utf-8', errors='replace')
+
+
+def _canonicalize(url: str) -> str:
+    """Normalize a URL so different spellings of the same page compare equal.
+
+    Lowercases scheme and host, drops the fragment, sorts the query string,
+    collapses repeated slashes and removes a trailing slash (except at root).
+    """
+    parsed = urlparse(url)
+    path = _SLASHES_RE.sub('/', parsed.path)
+    if len(path) > 1:
+        path = path.rstrip('/')
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path or '/', parsed.params, query, ''))
+
+
+def _dedupe_urls(urls: Set[str]) -> Set[str]:
+    """Keep one URL per canonical form.
+
+    The kept URL keeps its original trailing slash and query order (with
+    lowercase host, single slashes and no fragment) rather than the
+    canonical spelling, so sites that insist on e.g. trailing slashes are not
+    answered with a redirect for every page.
+    """
+    kept: Dict[str, str] = {}
+    for url in urls:
+        parsed = urlparse(urldefrag(url)[0])
+        url = parsed._replace(
+            scheme=parsed.scheme.lower(),
+            netloc=parsed.netloc.lower(),
+            path=_SLASHES_RE.sub('/', parsed.path)
+        ).geturl()
+        key = _canonicalize(url)
+        if key not in kept or url < kept[key]:
+            kept[key] = url
+    return set(kept.values())
+
+
+def _text_content(element: lxml.html.HtmlElement) -> str:
+    """Space-joined, stripped text of an element (like BeautifulSoup's get_text)."""
+    return ' '.join(text.strip() for text in element.itertext() if text.strip())
+
 
 class AsyncWebCrawler:
     """Async web crawler for extracting content from documentation sites."""
@@ -24,33 +159,83 @@ class AsyncWebCrawler:
     def __init__(self, config: Optional[CrawlConfig] = None, progress_callback=None) -> None:
         self.config = config or CrawlConfig()
         self.progress_callback = progress_callback
-        self.robots_checker = RobotsChecker(self.config.user_agent)
-        self.sitemap_parser = SitemapParser(self.config.user_agent)
+        # Language filters only apply when English is requested
+        self._english = bool(self.config.language) and self.config.language.lower().startswith('en')
+        self.robots_checker = RobotsChecker(
+            self.config.user_agent,
+            cache_dir=self.config.robots_cache_dir,
+            cache_ttl=self.config.robots_cache_ttl
+        )
+        self.sitemap_parser = SitemapParser(
+            self.config.user_agent, cache_dir=self.config.sitemap_cache_dir
+        )
+        # Bounds in-flight fetches; created per crawl inside the running loop
+        self._sem: Optional[asyncio.Semaphore] = None
+        # Per-host robots.txt Crawl-delay and monotonic time of the last request to each host
+        self._crawl_delays: Dict[str, float] = {}
+        self._last_fetch_time: Dict[str, float] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
         self.headers = {
             "User-Agent": self.config.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.5",
-            "Accept-Encoding": "gzip, deflate",
+            "Accept-Encoding": _ACCEPT_ENCODING,
         }
         
-        # Initialize HTML to markdown converter
-        self.html2text = html2text.HTML2Text()
-        self.html2text.ignore_links = False
-        self.html2text.ignore_images = True
-        self.html2text.ignore_emphasis = False
-        self.html2text.body_width = 0
-        self.html2text.unicode_snob = True
+        # Pool of html2text converters, the fallback for markup the lxml
+        # renderer does not handle; HTML2Text keeps per-document state, so
+        # each conversion borrows an instance for exclusive use
+        self._h2t_pool: Deque[html2text.HTML2Text] = deque()
+    
+    @staticmethod
+    def _make_html2text() -> html2text.HTML2Text:
+        """Create a configured HTML to markdown converter."""
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.ignore_images = True
+        converter.ignore_emphasis = False
+        converter.body_width = 0
+        converter.unicode_snob = True
+        return converter
+
+    def _html2text_markdown(self, element: lxml.html.HtmlElement) -> str:
+        """Convert an element to markdown with a pooled html2text converter."""
+        converter = self._h2t_pool.popleft() if self._h2t_pool else self._make_html2text()
+        try:
+            return converter.handle(lxml.html.tostring(element, encoding='unicode')).strip()
+        finally:
+            # Clear parser position/buffers before the next document
+            converter.reset()
+            self._h2t_pool.append(converter)
     
     async def crawl(self, start_url: str) -> CrawlResult:
         """Crawl a website starting from the given URL."""
         start_time = time.time()
         logger.info(f"Starting async crawl from {start_url}")
         
-        # Create session with timeout
+        # Create session with timeout and a connection pool sized to the fetch
+        # concurrency; DNS answers and idle keep-alive connections are reused
+        # across the whole crawl
         timeout = ClientTimeout(total=self.config.timeout)
-        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout) as session:
-            # Discover URLs from sitemap (still sync for now)
-            discovered_urls = self.sitemap_parser.discover_urls(start_url)
+        connector = aiohttp.TCPConnector(
+            limit=self.config.max_concurrency,
+            limit_per_host=self.config.per_host_limit,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+            enable_cleanup_closed=True
+        )
+        self._sem = asyncio.Semaphore(self.config.max_concurrency)
+        async with aiohttp.ClientSession(
+            headers=self.headers, timeout=timeout, connector=connector, trust_env=True
+        ) as session:
+            # Sitemap discovery and the robots.txt load run concurrently over
+            # the crawl session. Afterwards can_fetch is an in-memory lookup
+            # for this host.
+            discovery = [self.sitemap_parser.discover_urls(start_url, session)]
+            if self.config.respect_robots:
+                discovery.append(self.robots_checker.prefetch(start_url, session))
+            discovered_urls = (await asyncio.gather(*discovery))[0]
             
             # If sitemap failed, use fallback
             if not discovered_urls:
@@ -59,10 +244,19 @@ class AsyncWebCrawler:
             
             # Always include start URL
             discovered_urls.add(start_url)
+            
+            # Collapse spellings of the same page (host case, fragments, query
+            # order, slashes) so each page is fetched once
+            discovered_urls = _dedupe_urls(discovered_urls)
             logger.info(f"Total URLs discovered: {len(discovered_urls)}")
             
             # Filter and organize URLs
             urls_to_crawl = self._organize_urls_by_depth(start_url, discovered_urls)
+            
+            # Load robots.txt for any other origin (e.g. http vs https) up front,
+            # concurrently, so the crawl loop never blocks on it
+            if self.config.respect_robots:
+                await self._prefetch_robots(session, start_url, urls_to_crawl)
 
             # Emit an initial progress update so consumers know total discovered early
             if self.progress_callback:
@@ -77,48 +271,60 @@ class AsyncWebCrawler:
             failed_urls = []
             blocked_urls = []
             
-            for depth in range(min(self.config.max_depth + 1, len(urls_to_crawl))):
-                if len(pages) >= self.config.max_pages:
+            # Queue every URL shallowest-first; workers pull from it without
+            # waiting for a whole depth to finish, so slow pages don't stall the crawl
+            queue: asyncio.Queue = asyncio.Queue()
+            for depth in sorted(urls_to_crawl):
+                if depth > self.config.max_depth:
                     break
-                
-                depth_urls = urls_to_crawl.get(depth, [])
-                logger.info(f"Crawling depth {depth}: {len(depth_urls)} URLs")
-                
-                # Process URLs at this depth with limited concurrency
-                tasks = []
-                for url in depth_urls:
-                    if len(pages) >= self.config.max_pages:
-                        break
-                    
+                for url in urls_to_crawl[depth]:
                     # Check robots.txt
                     if self.config.respect_robots and not self.robots_checker.can_fetch(url):
                         logger.info(f"Blocked by robots.txt: {url}")
                         blocked_urls.append(url)
                         continue
+                    queue.put_nowait((url, depth))
+            logger.info(f"Crawling {queue.qsize()} URLs with up to {self.config.max_concurrency} workers")
+            
+            async def worker() -> None:
+                while len(pages) < self.config.max_pages:
+                    try:
+                        url, depth = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
                     
-                    # Add to tasks for concurrent processing
-                    tasks.append(self._fetch_page(session, url, depth))
-                
-                # Process tasks with concurrency limit
-                if tasks:
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                    try:
+                        await self._respect_crawl_delay(url)
+                        result = await self._fetch_page(session, url, depth)
+                    except Exception as e:
+                        logger.error(f"Error crawling page {url}: {e}")
+                        failed_urls.append(url)
+                        continue
+                    finally:
+                        queue.task_done()
                     
-                    for result in results:
-                        if isinstance(result, Exception):
-                            logger.error(f"Error crawling page: {result}")
-                            failed_urls.append(str(result))
-                        elif result:
-                            pages.append(result)
-                            if self.progress_callback:
-                                self.progress_callback(result.url, len(pages), len(discovered_urls))
-                        
-                        if len(pages) >= self.config.max_pages:
-                            break
-                
-                # Small delay between depths
-                if depth < self.config.max_depth:
-                    await asyncio.sleep(self.config.request_delay)
+                    if result and len(pages) < self.config.max_pages:
+                        pages.append(result)
+                        if self.progress_callback:
+                            self.progress_callback(result.url, len(pages), len(discovered_urls))
+            
+            workers = [
+                asyncio.ensure_future(worker())
+                for _ in range(min(self.config.max_concurrency, queue.qsize()))
+            ]
+            try:
+                # A worker returns once the queue is drained or max_pages is reached
+                for finished in asyncio.as_completed(workers):
+                    await finished
+                    if len(pages) >= self.config.max_pages:
+                        break
+            finally:
+                # Drop fetches still in flight once the page budget is reached
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
         
+        self.robots_checker.close()
         duration = time.time() - start_time
         
         return CrawlResult(
@@ -130,8 +336,31 @@ class AsyncWebCrawler:
             duration=duration
         )
     
+    async def _prefetch_robots(
+        self, session: aiohttp.ClientSession, start_url: str, urls_to_crawl: Dict[int, List[str]]
+    ) -> None:
+        """Load robots.txt once per origin not already cached from the start URL."""
+        start = urlparse(start_url)
+        origins: Dict[tuple, str] = {}
+        for depth_urls in urls_to_crawl.values():
+            for url in depth_urls:
+                parsed = urlparse(url)
+                origin = (parsed.scheme, parsed.netloc)
+                if origin != (start.scheme, start.netloc):
+                    origins.setdefault(origin, url)
+        
+        if origins:
+            await asyncio.gather(*[
+                self.robots_checker.prefetch(url, session) for url in origins.values()
+            ])
+    
     async def _fetch_page(self, session: aiohttp.ClientSession, url: str, depth: int) -> Optional[PageContent]:
         """Fetch and extract content from a single page."""
+        async with self._sem:
+            return await self._fetch_page_unbounded(session, url, depth)
+    
+    async def _fetch_page_unbounded(self, session: aiohttp.ClientSession, url: str, depth: int) -> Optional[PageContent]:
+        """Fetch a page without acquiring the concurrency semaphore."""
         try:
             async with session.get(url, allow_redirects=self.config.follow_redirects) as response:
                 response.raise_for_status()
@@ -142,43 +371,55 @@ class AsyncWebCrawler:
                     logger.debug(f"Skipping non-HTML content: {url} ({content_type})")
                     return None
                 
-                # Read content
-                html = await response.text()
-                
-                # Parse HTML
-                soup = BeautifulSoup(html, 'lxml')
+                # Read content, bailing out on oversized pages
+                html = await _read_text(response, self.config.max_page_bytes)
+                if html is None:
+                    logger.info(f"Skipping page larger than {self.config.max_page_bytes} bytes: {url}")
+                    return None
 
-                # Language filter: prefer English pages
-                if self.config.language and self.config.language.startswith('en'):
-                    lang_attr = (soup.html.get('lang') if soup.html else None) or ''
+                # Language filter: prefer English pages. Only the <html> start
+                # tag is inspected so discarded pages are never parsed.
+                if self._english:
+                    lang_match = _HTML_LANG_RE.search(html, 0, 8192)
+                    lang_attr = lang_match.group(1) if lang_match else ''
                     header_lang = response.headers.get('Content-Language', '')
                     page_lang = (lang_attr or header_lang).lower()
                     if page_lang and not page_lang.startswith('en'):
                         logger.info(f"Skipping non-English page {url} (lang={page_lang})")
                         return None
                 
-                # Extract title
-                title_elem = soup.find('title')
-                title = title_elem.get_text().strip() if title_elem else ""
+                # Parse once; every extraction step below works on this tree
+                tree = _parse_html(html)
                 
-                # Clean soup
-                self._clean_soup(soup)
+                # Extract title: a direct head/title lookup, scanning the
+                # document only when the title sits somewhere unusual
+                title = (_TITLE_XPATH(tree) or tree.findtext('.//title') or '').strip()
                 
-                # Extract main content
-                content_html = self._extract_main_content(soup)
+                # Clean tree
+                self._clean_tree(tree)
                 
-                # Convert to markdown
-                markdown = self.html2text.handle(str(content_html)).strip()
+                # Extract main content
+                main = self._extract_main_content(tree)
                 
-                # Extract plain text
-                content_text = soup.get_text(separator=' ', strip=True)
+                # Convert to markdown straight from the tree; the same pass
+                # collects the plain text and word count
+                rendered = tree_to_markdown(main)
+                if rendered is not None:
+                    markdown = rendered.markdown
+                    content_text = rendered.text
+                    word_count = rendered.word_count
+                else:
+                    # Markup outside the documentation subset (tables, ...)
+                    markdown = self._html2text_markdown(main)
+                    content_text = _text_content(main)
+                    word_count = count_words(content_text)
                 
-                # Extract links
-                links = self._extract_links(soup, url)
+                # Extract links (resolves hrefs in place, so after markdown conversion)
+                links = self._extract_links(tree, url)
                 
                 # Metadata
                 metadata = {
-                    'word_count': len(content_text.split()),
+                    'word_count': word_count,
                     'char_count': len(content_text),
                     'markdown_length': len(markdown),
                     'final_url': str(response.url)
@@ -229,15 +470,12 @@ class AsyncWebCrawler:
             logger.info(f"Discovering URLs from page content at {start_url}")
             
             async with session.get(start_url) as response:
+                html = None
                 if response.status == 200:
-                    html = await response.text()
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
+                    html = await _read_text(response, self.config.max_page_bytes)
+                if html:
                     # Find documentation links
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        absolute_url = urljoin(start_url, href)
-                        
+                    for absolute_url in self._extract_links(_parse_html(html), start_url):
                         parsed_url = urlparse(absolute_url)
                         if parsed_url.netloc == parsed_base.netloc:
                             url_lower = absolute_url.lower()
@@ -245,7 +483,7 @@ class AsyncWebCrawler:
                                           'manual', 'help', 'example', 'getting-started']
                             
                             if any(keyword in url_lower for keyword in doc_keywords):
-                                if not self._should_skip_url_for_language(urlparse(absolute_url).path):
+                                if not self._should_skip_url_for_language(parsed_url.path):
                                     discovered_urls.add(absolute_url)
                     
                     logger.info(f"Discovered {len(discovered_urls)} URLs through fallback")
@@ -255,30 +493,54 @@ class AsyncWebCrawler:
         
         return discovered_urls
     
+    async def _respect_crawl_delay(self, url: str) -> None:
+        """Space out requests to a host whose robots.txt sets a Crawl-delay.
+
+        Concurrency is otherwise bounded by ``max_concurrency`` and
+        ``per_host_limit`` alone; ``request_delay`` is not applied per request,
+        as that would serialize the workers on the single crawled host.
+        """
+        if not self.config.respect_robots:
+            return
+        host = urlparse(url).netloc
+        delay = self._crawl_delays.get(host)
+        if delay is None:
+            delay = self.robots_checker.get_crawl_delay(url) or 0.0
+            self._crawl_delays[host] = delay
+        
+        if delay > 0:
+            # Requests to one host are spaced out in turn; other hosts proceed in parallel
+            lock = self._host_locks.setdefault(host, asyncio.Lock())
+            async with lock:
+                wait = delay - (time.monotonic() - self._last_fetch_time.get(host, float('-inf')))
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_fetch_time[host] = time.monotonic()
+    
     def _organize_urls_by_depth(self, start_url: str, urls: Set[str]) -> Dict[int, List[str]]:
         """Organize URLs by their depth from the start URL."""
         parsed_start = urlparse(start_url)
         start_path_parts = [p for p in parsed_start.path.split('/') if p]
+        # Hosts are case-insensitive, and _dedupe_urls lowercases them
+        start_netloc = parsed_start.netloc.lower()
         
         depth_urls: Dict[int, List[str]] = {}
         
         for url in urls:
-            if self._is_non_html_url(url):
-                continue
-            
+            # Parse once; the checks below share the result
             parsed_url = urlparse(url)
-            if parsed_url.netloc != parsed_start.netloc:
+            if parsed_url.netloc.lower() != start_netloc:
                 continue
-            # Language filter: skip obvious non-English locales in path if configured
-            if self._should_skip_url_for_language(parsed_url.path):
+            if parsed_url.path.lower().endswith(_NON_HTML_EXTS):
                 continue
             
             path_parts = [p for p in parsed_url.path.split('/') if p]
-            depth = max(0, len(path_parts) - len(start_path_parts))
+            # Language filter: skip obvious non-English locales in path if configured
+            if self._should_skip_segments_for_language(path_parts):
+                continue
             
-            if depth not in depth_urls:
-                depth_urls[depth] = []
-            depth_urls[depth].append(url)
+            depth = max(0, len(path_parts) - len(start_path_parts))
+            depth_urls.setdefault(depth, []).append(url)
         
         # Sort URLs within each depth
         for depth in depth_urls:
@@ -288,80 +550,52 @@ class AsyncWebCrawler:
     
     def _is_non_html_url(self, url: str) -> bool:
         """Check if URL is likely not an HTML page."""
-        non_html_extensions = {
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.zip', '.tar', '.gz', '.rar', '.7z',
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg',
-            '.mp3', '.mp4', '.avi', '.mov', '.wav',
-            '.css', '.js', '.json', '.xml', '.txt'
-        }
-        
-        parsed = urlparse(url)
-        path_lower = parsed.path.lower()
-        
-        return any(path_lower.endswith(ext) for ext in non_html_extensions)
+        return urlparse(url).path.lower().endswith(_NON_HTML_EXTS)
     
-    def _clean_soup(self, soup: BeautifulSoup) -> None:
-        """Remove unwanted elements from the parsed HTML."""
-        unwanted_tags = ['script', 'style', 'nav', 'footer', 'aside', 'header']
-        unwanted_classes = ['nav', 'navigation', 'menu', 'sidebar', 'footer', 'header', 'breadcrumb']
-        unwanted_ids = ['nav', 'navigation', 'menu', 'sidebar', 'footer', 'header', 'breadcrumb']
-        
-        # Remove by tag
-        for tag_name in unwanted_tags:
-            for element in soup.find_all(tag_name):
-                element.decompose()
-        
-        # Remove by class
-        for class_name in unwanted_classes:
-            for element in soup.find_all(class_=lambda x: x and class_name in ' '.join(x).lower()):
-                element.decompose()
-        
-        # Remove by id
-        for id_name in unwanted_ids:
-            for element in soup.find_all(id=lambda x: x and id_name in x.lower()):
-                element.decompose()
+    def _clean_tree(self, tree: lxml.html.HtmlElement) -> None:
+        """Remove unwanted elements from the parsed HTML in a single XPath pass."""
+        for element in _CLEANUP_XPATH(tree):
+            # The document root cannot be dropped
+            if element.getparent() is not None:
+                element.drop_tree()
     
-    def _extract_main_content(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _extract_main_content(self, tree: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
         """Extract the main content area from the page."""
         # Try to find main content areas
-        main_selectors = [
-            'main', 'article', '[role="main"]',
-            '.main-content', '.content', '.documentation',
-            '#main', '#content', '#documentation'
-        ]
-        
-        for selector in main_selectors:
-            content = soup.select_one(selector)
+        for xpath in _MAIN_CONTENT_XPATHS:
+            content = xpath(tree)
             if content:
-                return content
+                return content[0]
         
         # Fallback to body
-        return soup.find('body') or soup
+        body = tree.find('body')
+        return body if body is not None else tree
     
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract all links from the page."""
-        links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            absolute_url = urljoin(base_url, href)
-            links.append(absolute_url)
-        return links
+    def _extract_links(self, tree: lxml.html.HtmlElement, base_url: str) -> List[str]:
+        """Extract all anchor links from the page, resolved against base_url."""
+        tree.make_links_absolute(base_url, resolve_base_href=True)
+        return [
+            link for element, attribute, link, _ in tree.iterlinks()
+            if element.tag == 'a' and attribute == 'href'
+        ]
 
     def _should_skip_url_for_language(self, path: str) -> bool:
         """Heuristically skip non-English locale paths when language is set to 'en'.
 
         Looks at early path segments like '/zh', '/zh-TW', '/fr', '/ja', '/pt-br', etc.
         """
-        if not self.config.language or self.config.language.lower().startswith('en') is False:
+        return self._should_skip_segments_for_language([seg for seg in path.split('/') if seg])
+
+    def _should_skip_segments_for_language(self, segments: List[str]) -> bool:
+        """Same as _should_skip_url_for_language for an already-split, non-empty-segment path."""
+        if not self._english:
             # Only enforce when requesting English
             return False
-        segments = [seg.lower() for seg in path.split('/') if seg]
         if not segments:
             return False
-        locale = segments[0]
+        locale = segments[0].lower()
         # Match i18n locale patterns
-        if re.fullmatch(r"[a-z]{2}([-_][a-z]{2,4})?", locale):
+        if _LOCALE_RE.fullmatch(locale):
             # Allow 'en', 'en-us', 'en_gb'
             if locale.startswith('en'):
                 return False
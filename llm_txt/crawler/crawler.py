@@ -1,21 +1,236 @@
 """Main web crawler implementation."""
 
 import asyncio
+import hashlib
+import heapq
+import json
 import logging
+import os
+import re
 import time
-from typing import List, Set, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Set, Optional, Dict, Any, Callable
 from urllib.parse import urljoin, urlparse, urlencode
 import aiohttp
 from aiohttp import ClientError, ClientTimeout
-from bs4 import BeautifulSoup
 import html2text
+import lxml.etree
+import lxml.html
 
+from .markdown import count_words, tree_to_markdown
 from .models import CrawlConfig, PageContent, CrawlResult
 from .robots import RobotsChecker
 from .sitemap import SitemapParser
 
 logger = logging.getLogger(__name__)
 
+# Non-blocking DNS via c-ares when aiodns is installed; otherwise aiohttp
+# resolves through getaddrinfo in a thread pool
+try:
+    import aiodns  # noqa: F401
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
+
+# URL path suffixes that are never HTML pages, as one anchored regex
+_NON_HTML_RE = re.compile(
+    r'\.(?:pdf|docx?|xlsx?|pptx?|zip|tar|gz|rar|7z|jpe?g|png|gif|bmp|svg'
+    r'|mp[34]|avi|mov|wav|css|js|json|xml|txt)$',
+    re.IGNORECASE
+)
+
+# Scheme, host[:port] and path of an absolute http(s) URL
+_URL_RE = re.compile(r'^https?://([^/?#]+)([^?#]*)', re.IGNORECASE)
+
+# Elements removed before content extraction: script, style, nav, footer,
+# sidebar, ... tags plus any element whose class or id contains one of the
+# tokens (case-insensitive). Compiled once so cleaning is a single C-level pass.
+_UNWANTED_TAGS = ('script', 'style', 'nav', 'footer', 'aside', 'header')
+_UNWANTED_TOKENS = ('nav', 'navigation', 'menu', 'sidebar', 'footer', 'header', 'breadcrumb')
+_LOWERCASE = "translate({}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_CLEANUP_XPATH = lxml.etree.XPath('|'.join(
+    [f'//{tag}' for tag in _UNWANTED_TAGS]
+    + ['//*[' + ' or '.join(
+        f"contains({_LOWERCASE.format(attr)}, '{token}')"
+        for attr in ('@class', '@id') for token in _UNWANTED_TOKENS
+    ) + ']']
+))
+
+# Main content containers in priority order: main, [role="main"], .main,
+# .content, .main-content, .page-content, .post-content, .entry-content,
+# .article-content, article, .documentation. One compiled union finds every
+# candidate in a single pass; _main_content_rank restores the priority.
+_MAIN_CONTENT_CLASSES = (
+    'main', 'content', 'main-content', 'page-content', 'post-content',
+    'entry-content', 'article-content'
+)
+_MAIN_CONTENT_XPATH = lxml.etree.XPath(' | '.join(
+    ['//main', '//*[@role="main"]', '//article']
+    + [f'//*[contains(concat(" ", normalize-space(@class), " "), " {name} ")]'
+       for name in _MAIN_CONTENT_CLASSES + ('documentation',)]
+))
+
+# Fallback discovery: common documentation paths, and keywords marking doc links
+_COMMON_DOC_PATHS = (
+    '/docs', '/documentation', '/api', '/reference',
+    '/guide', '/tutorial', '/getting-started', '/quickstart',
+    '/api-reference', '/api-docs', '/developer', '/developers',
+    '/help', '/manual', '/user-guide', '/examples'
+)
+_DOC_KEYWORDS = (
+    'doc', 'api', 'guide', 'tutorial', 'reference',
+    'manual', 'help', 'example', 'getting-started'
+)
+
+# Every anchor href in a document, as plain strings
+_HREF_XPATH = lxml.etree.XPath('//a/@href', smart_strings=False)
+
+# The same URLs are parsed by several filters; parse results are immutable
+_urlparse = lru_cache(maxsize=4096)(urlparse)
+
+# Fallback HTML to markdown converter, one per process (see _get_html2text)
+_html2text_converter: Optional[html2text.HTML2Text] = None
+
+
+async def _stream_body(
+    response: aiohttp.ClientResponse, max_bytes: int, consume: Callable[[bytes], Any]
+) -> bool:
+    """Pass a response body to consume() chunk by chunk as it arrives.
+    
+    Returns False, without reading further, once the body exceeds max_bytes.
+    """
+    if response.content_length is not None and response.content_length > max_bytes:
+        return False
+    
+    total = 0
+    async for chunk in response.content.iter_any():
+        total += len(chunk)
+        if total > max_bytes:
+            return False
+        consume(chunk)
+    return True
+
+
+async def _read_capped(response: aiohttp.ClientResponse, max_bytes: int) -> Optional[bytes]:
+    """Read a response body, or return None once it exceeds max_bytes."""
+    body = bytearray()
+    if not await _stream_body(response, max_bytes, body.extend):
+        return None
+    return bytes(body)
+
+
+def _clean_tree(tree: lxml.html.HtmlElement) -> None:
+    """Remove unwanted elements from the parsed HTML in one XPath pass."""
+    for element in _CLEANUP_XPATH(tree):
+        # The document root cannot be dropped
+        if element.getparent() is not None:
+            element.drop_tree()
+
+
+def _main_content_rank(element: lxml.html.HtmlElement) -> int:
+    """Position of the first main-content selector the element matches."""
+    if element.tag == 'main':
+        return 0
+    if element.get('role') == 'main':
+        return 1
+    classes = (element.get('class') or '').split()
+    for rank, name in enumerate(_MAIN_CONTENT_CLASSES, start=2):
+        if name in classes:
+            return rank
+    if element.tag == 'article':
+        return len(_MAIN_CONTENT_CLASSES) + 2
+    return len(_MAIN_CONTENT_CLASSES) + 3
+
+
+def _extract_main_content(tree: lxml.html.HtmlElement) -> lxml.html.HtmlElement:
+    """Extract the main content from the page."""
+    # Try to find main content containers; min() keeps document order among
+    # equally ranked candidates, like a per-selector select_one()
+    candidates = _MAIN_CONTENT_XPATH(tree)
+    if candidates:
+        return min(candidates, key=_main_content_rank)
+    
+    # If no main content found, use body
+    body = tree.find('body')
+    return body if body is not None else tree
+
+
+def _extract_links(tree: lxml.html.HtmlElement, base_url: str) -> List[str]:
+    """Extract and resolve links from the page."""
+    links: Set[str] = set()
+    
+    for href in _HREF_XPATH(tree):
+        href = href.strip()
+        # Skip empty and same-page fragment links
+        if not href or href[0] == '#':
+            continue
+        if not href.startswith(('http://', 'https://')):
+            href = urljoin(base_url, href)
+            # Only include HTTP(S) links
+            if not href.startswith(('http://', 'https://')):
+                continue
+        links.add(href)
+    
+    return list(links)
+
+
+def _get_html2text() -> html2text.HTML2Text:
+    """Return this process's fallback HTML to markdown converter, creating it on first use."""
+    global _html2text_converter
+    if _html2text_converter is None:
+        _html2text_converter = html2text.HTML2Text()
+        _html2text_converter.ignore_links = False
+        _html2text_converter.ignore_images = True
+        _html2text_converter.ignore_emphasis = False
+        _html2text_converter.body_width = 0  # No line wrapping
+        _html2text_converter.unicode_snob = True
+    return _html2text_converter
+
+
+def _parse_page(content: bytes, url: str) -> Dict[str, Any]:
+    """Parse a page's HTML and extract its title, markdown, plain text and links.
+    
+    Module-level and free of crawler state so it can run in a worker process.
+    """
+    return _extract_page(lxml.html.document_fromstring(content), url)
+
+
+def _extract_page(tree: lxml.html.HtmlElement, url: str) -> Dict[str, Any]:
+    """Extract title, markdown, plain text, word count and links from a parsed page."""
+    # Extract title
+    title = (tree.findtext('.//title') or '').strip()
+    
+    # Remove unwanted elements
+    _clean_tree(tree)
+    
+    # Extract main content
+    content_html = _extract_main_content(tree)
+    
+    # Convert to markdown straight from the tree, collecting the plain text
+    # of the main content in the same pass
+    rendered = tree_to_markdown(content_html)
+    if rendered is not None:
+        markdown = rendered.markdown
+        content_text = rendered.text
+        word_count = rendered.word_count
+    else:
+        # Markup outside the documentation subset (tables, ...)
+        markdown = _get_html2text().handle(lxml.html.tostring(content_html, encoding='unicode')).strip()
+        content_text = ' '.join(text.strip() for text in content_html.itertext() if text.strip())
+        word_count = count_words(content_text)
+    
+    # Find links
+    links = _extract_links(tree, url)
+    
+    return {
+        'title': title,
+        'markdown': markdown,
+        'content': content_text,
+        'word_count': word_count,
+        'links': links
+    }
+
 
 class WebCrawler:
     """Web crawler for extracting content from documentation sites."""
@@ -23,8 +238,14 @@ class WebCrawler:
     def __init__(self, config: Optional[CrawlConfig] = None, progress_callback=None) -> None:
         self.config = config or CrawlConfig()
         self.progress_callback = progress_callback  # Callback for progress updates
-        self.robots_checker = RobotsChecker(self.config.user_agent)
-        self.sitemap_parser = SitemapParser(self.config.user_agent)
+        self.robots_checker = RobotsChecker(
+            self.config.user_agent,
+            cache_dir=self.config.robots_cache_dir,
+            cache_ttl=self.config.robots_cache_ttl
+        )
+        self.sitemap_parser = SitemapParser(
+            self.config.user_agent, cache_dir=self.config.sitemap_cache_dir
+        )
         self.headers = {
             "User-Agent": self.config.user_agent,
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -33,14 +254,17 @@ class WebCrawler:
             "Connection": "keep-alive"
         }
         self.session: Optional[aiohttp.ClientSession] = None
+        # Per-host crawl delay and monotonic time of the last request to each host
+        self._crawl_delays: Dict[str, float] = {}
+        self._last_fetch_time: Dict[str, float] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Worker processes for HTML parsing; created per crawl when configured
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         
-        # Initialize HTML to markdown converter
-        self.html2text = html2text.HTML2Text()
-        self.html2text.ignore_links = False
-        self.html2text.ignore_images = True
-        self.html2text.ignore_emphasis = False
-        self.html2text.body_width = 0  # No line wrapping
-        self.html2text.unicode_snob = True
+        # Validators and extracted content from the previous run, by URL
+        # (only used when config.cache_path is set)
+        self._http_cache: Dict[str, Dict[str, Any]] = {}
     
     async def crawl(self, start_url: str) -> CrawlResult:
         """Crawl a website starting from the given URL."""
@@ -48,22 +272,76 @@ class WebCrawler:
         
         logger.info(f"Starting crawl from {start_url}")
         
-        # Create session for this crawl
+        # Create session for this crawl; pooled connections are kept alive
+        # well past the crawl delay so TCP/TLS handshakes are not repeated
         timeout = ClientTimeout(total=self.config.timeout)
-        self.session = aiohttp.ClientSession(headers=self.headers, timeout=timeout)
+        connector = aiohttp.TCPConnector(
+            resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+            limit=self.config.max_concurrency * 2,
+            limit_per_host=self.config.per_host_limit,
+            keepalive_timeout=120,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            force_close=False
+        )
+        self.session = aiohttp.ClientSession(headers=self.headers, timeout=timeout, connector=connector)
+        # Locks belong to the running event loop; crawl_sync starts a new one per call
+        self._host_locks = {}
+        
+        # Parsing is CPU-bound; a process pool lets it scale past one core
+        if self.config.parse_processes > 0:
+            self._parse_pool = ProcessPoolExecutor(max_workers=self.config.parse_processes)
+        
+        if self.config.cache_path:
+            self._http_cache = await asyncio.to_thread(self._load_http_cache, self.config.cache_path)
         
         try:
             result = await self._crawl_internal(start_url)
+            if self.config.cache_path:
+                await asyncio.to_thread(self._save_http_cache, self.config.cache_path)
             return result
         finally:
             if self.session:
                 await self.session.close()
+            self.robots_checker.close()
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown()
+                self._parse_pool = None
+    
+    def crawl_sync(self, start_url: str) -> CrawlResult:
+        """Crawl a website from synchronous code (runs its own event loop)."""
+        return asyncio.run(self.crawl(start_url))
     
     async def _crawl_internal(self, start_url: str) -> CrawlResult:
         """Internal crawl implementation."""
+        start_time = time.time()
+        
+        # Sitemap discovery runs alongside fetching the start page, all over
+        # the crawl session
+        async def fetch_start_page() -> Optional[PageContent]:
+            if not self.config.respect_robots:
+                await self._respect_crawl_delay(start_url)
+                return await self._fetch_page(start_url, 0)
+            
+            # The first request to a host needs no spacing, so the start page
+            # is fetched speculatively while robots.txt loads and dropped if
+            # robots.txt turns out to disallow it
+            robots_task = asyncio.ensure_future(self.robots_checker.prefetch(start_url, self.session))
+            try:
+                page = await self._fetch_page(start_url, 0)
+            finally:
+                await robots_task
+            self._last_fetch_time[_urlparse(start_url).netloc] = time.monotonic()
+            
+            if not self.robots_checker.can_fetch(start_url):
+                self._http_cache.pop(start_url, None)
+                return None
+            return page
         
-        # Discover URLs from sitemap
-        discovered_urls = self.sitemap_parser.discover_urls(start_url)
+        discovered_urls, start_page = await asyncio.gather(
+            self.sitemap_parser.discover_urls(start_url, self.session),
+            fetch_start_page()
+        )
         
         # If sitemap failed or returned no URLs, use fallback strategy
         if not discovered_urls:
@@ -78,12 +356,24 @@ class WebCrawler:
         # Filter URLs and organize by depth
         urls_to_crawl = self._organize_urls_by_depth(start_url, discovered_urls)
         
-        # Crawl pages
-        start_time = time.time()
-        pages = []
+        # Load robots.txt once per origin up front, concurrently, so the
+        # crawl loop only does in-memory lookups
+        if self.config.respect_robots:
+            await self._prefetch_robots(urls_to_crawl)
+        
+        # Crawl pages, starting from the already fetched start page
+        pages = [start_page] if start_page is not None else []
         failed_urls = []
         blocked_urls = []
         
+        # Fetches run concurrently; the semaphore bounds how many are in flight
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        
+        async def bounded_fetch(url: str, depth: int) -> Optional[PageContent]:
+            async with semaphore:
+                await self._respect_crawl_delay(url)
+                return await self._fetch_page(url, depth)
+        
         for depth in range(min(self.config.max_depth + 1, len(urls_to_crawl))):
             if len(pages) >= self.config.max_pages:
                 break
@@ -91,27 +381,34 @@ class WebCrawler:
             depth_urls = urls_to_crawl.get(depth, [])
             logger.info(f"Crawling depth {depth}: {len(depth_urls)} URLs")
             
+            # Check robots.txt
+            allowed_urls = []
             for url in depth_urls:
-                if len(pages) >= self.config.max_pages:
-                    break
-                
-                # Check robots.txt
+                if start_page is not None and url == start_url:
+                    continue
                 if self.config.respect_robots and not self.robots_checker.can_fetch(url):
                     logger.info(f"Blocked by robots.txt: {url}")
                     blocked_urls.append(url)
                     continue
+                allowed_urls.append(url)
+            
+            # Fetch in batches sized to the remaining page budget, so failed
+            # pages are backfilled without overshooting max_pages
+            while allowed_urls and len(pages) < self.config.max_pages:
+                batch_size = self.config.max_pages - len(pages)
+                batch, allowed_urls = allowed_urls[:batch_size], allowed_urls[batch_size:]
                 
-                # Fetch page
-                page_content = await self._fetch_page(url, depth)
-                if page_content:
-                    pages.append(page_content)
-                    logger.debug(f"Successfully crawled: {url}")
-                else:
-                    failed_urls.append(url)
-                    logger.warning(f"Failed to crawl: {url}")
-                
-                # Respect crawl delay
-                self._respect_crawl_delay(url)
+                results = await asyncio.gather(
+                    *[bounded_fetch(url, depth) for url in batch],
+                    return_exceptions=True
+                )
+                for url, page_content in zip(batch, results):
+                    if isinstance(page_content, PageContent):
+                        pages.append(page_content)
+                        logger.debug(f"Successfully crawled: {url}")
+                    else:
+                        failed_urls.append(url)
+                        logger.warning(f"Failed to crawl: {url}")
         
         duration = time.time() - start_time
         
@@ -124,60 +421,75 @@ class WebCrawler:
             duration=duration
         )
     
+    async def _prefetch_robots(self, urls_to_crawl: Dict[int, List[str]]) -> None:
+        """Load robots.txt for every origin among the URLs to crawl."""
+        origins: Dict[tuple, str] = {}
+        for depth_urls in urls_to_crawl.values():
+            for url in depth_urls:
+                parsed = _urlparse(url)
+                origins.setdefault((parsed.scheme, parsed.netloc), url)
+        
+        await asyncio.gather(*[
+            self.robots_checker.prefetch(url, self.session) for url in origins.values()
+        ])
+    
     def _organize_urls_by_depth(self, start_url: str, urls: Set[str]) -> Dict[int, List[str]]:
         """Organize URLs by their depth from the start URL."""
-        start_parsed = urlparse(start_url)
+        start_parsed = _urlparse(start_url)
         start_path_parts = [p for p in start_parsed.path.split('/') if p]
         
         depth_urls: Dict[int, List[str]] = {}
         
         for url in urls:
             # Only include URLs from the same domain
-            parsed = urlparse(url)
-            if parsed.netloc != start_parsed.netloc:
+            match = _URL_RE.match(url)
+            if not match or match.group(1) != start_parsed.netloc:
                 continue
             
             # Skip non-HTML URLs
-            if self._is_non_html_url(url):
+            path = match.group(2)
+            if _NON_HTML_RE.search(path):
                 continue
             
             # Calculate depth based on path difference
-            path_parts = [p for p in parsed.path.split('/') if p]
+            path_parts = [p for p in path.split('/') if p]
             depth = max(0, len(path_parts) - len(start_path_parts))
             
-            if depth not in depth_urls:
-                depth_urls[depth] = []
-            depth_urls[depth].append(url)
-        
-        # Sort URLs within each depth
-        for depth in depth_urls:
-            depth_urls[depth].sort()
+            depth_urls.setdefault(depth, []).append(url)
         
-        return depth_urls
+        # At most max_pages URLs are crawled from any depth, so keep only the
+        # first max_pages of each depth in sorted order (O(N log K), not a full sort)
+        return {
+            depth: heapq.nsmallest(self.config.max_pages, bucket)
+            for depth, bucket in depth_urls.items()
+        }
     
     def _is_non_html_url(self, url: str) -> bool:
         """Check if URL is likely not an HTML page."""
-        non_html_extensions = {
-            '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
-            '.zip', '.tar', '.gz', '.rar', '.7z',
-            '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg',
-            '.mp3', '.mp4', '.avi', '.mov', '.wav',
-            '.css', '.js', '.json', '.xml', '.txt'
-        }
-        
-        parsed = urlparse(url)
-        path_lower = parsed.path.lower()
-        
-        return any(path_lower.endswith(ext) for ext in non_html_extensions)
+        return _NON_HTML_RE.search(_urlparse(url).path) is not None
     
     async def _fetch_page(self, url: str, depth: int) -> Optional[PageContent]:
         """Fetch and extract content from a single page."""
+        # Conditional GET against the previous run's validators
+        cached = self._http_cache.get(url)
+        request_headers = {}
+        if cached:
+            if cached.get('etag'):
+                request_headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                request_headers['If-Modified-Since'] = cached['last_modified']
+        
         try:
             async with self.session.get(
                 url,
+                headers=request_headers,
                 timeout=self.config.timeout,
                 allow_redirects=self.config.follow_redirects
             ) as response:
+                if response.status == 304 and cached:
+                    logger.debug(f"Not modified since last crawl: {url}")
+                    return self._page_from_cache(cached, url, depth)
+                
                 response.raise_for_status()
                 
                 # Check content type
@@ -186,40 +498,61 @@ class WebCrawler:
                     logger.debug(f"Skipping non-HTML content: {url} ({content_type})")
                     return None
                 
-                # Read content
-                content = await response.read()
-                
-                # Parse HTML
-                soup = BeautifulSoup(content, 'lxml')
-                
-                # Extract title
-                title_elem = soup.find('title')
-                title = title_elem.get_text().strip() if title_elem else ""
-                
-                # Remove unwanted elements
-                self._clean_soup(soup)
-                
-                # Extract main content
-                content_html = self._extract_main_content(soup)
-                
-                # Convert to markdown
-                markdown = self.html2text.handle(str(content_html)).strip()
+                # Body hash, so unchanged pages can reuse the cached extraction
+                hasher = hashlib.sha1() if self.config.cache_path else None
+                too_large = f"Skipping page larger than {self.config.max_page_bytes} bytes: {url}"
                 
-                # Extract plain text for content
-                content_text = soup.get_text(separator=' ', strip=True)
+                if self._parse_pool is None:
+                    # Feed chunks to an incremental parser as they arrive, so
+                    # parsing overlaps the download
+                    try:
+                        parser = lxml.html.HTMLParser(encoding=response.charset)
+                    except LookupError:
+                        # Unknown charset name in Content-Type; let lxml detect it
+                        parser = lxml.html.HTMLParser()
+                    
+                    def consume(chunk: bytes) -> None:
+                        parser.feed(chunk)
+                        if hasher:
+                            hasher.update(chunk)
+                    
+                    if not await _stream_body(response, self.config.max_page_bytes, consume):
+                        logger.info(too_large)
+                        return None
+                    tree = parser.close()
+                    
+                    digest = hasher.hexdigest() if hasher else None
+                    if cached and digest == cached.get('sha1'):
+                        return self._page_from_cache(cached, url, depth)
+                    parsed = _extract_page(tree, url)
+                else:
+                    # Worker processes get the raw bytes and parse them there
+                    content = await _read_capped(response, self.config.max_page_bytes)
+                    if content is None:
+                        logger.info(too_large)
+                        return None
+                    
+                    digest = hashlib.sha1(content).hexdigest() if hasher else None
+                    if cached and digest == cached.get('sha1'):
+                        return self._page_from_cache(cached, url, depth)
+                    
+                    loop = asyncio.get_running_loop()
+                    parsed = await loop.run_in_executor(self._parse_pool, _parse_page, content, url)
                 
-                # Find links
-                links = self._extract_links(soup, url)
+                title = parsed['title']
+                markdown = parsed['markdown']
+                content_text = parsed['content']
+                links = parsed['links']
                 
                 # Create metadata
                 metadata = {
-                    'word_count': len(content_text.split()),
+                    'word_count': parsed['word_count'],
                     'char_count': len(content_text),
                     'markdown_length': len(markdown),
                     'final_url': str(response.url)
                 }
                 
-                return PageContent(
+                page = PageContent(
                     url=url,
                     title=title,
                     content=content_text,
@@ -231,6 +564,24 @@ class WebCrawler:
                     links=links,
                     metadata=metadata
                 )
+                
+                if self.config.cache_path:
+                    self._http_cache[url] = {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                        'sha1': digest,
+                        'page': {
+                            'title': title,
+                            'content': content_text,
+                            'markdown': markdown,
+                            'status_code': response.status,
+                            'content_type': content_type,
+                            'links': links,
+                            'metadata': metadata
+                        }
+                    }
+                
+                return page
             
         except (ClientError, Exception) as e:
             logger.warning(f"Network error fetching {url}: {e}")
@@ -239,7 +590,33 @@ class WebCrawler:
             logger.error(f"Unexpected error fetching {url}: {e}")
             return None
     
-    def _fallback_url_discovery(self, start_url: str) -> Set[str]:
+    def _page_from_cache(self, cached: Dict[str, Any], url: str, depth: int) -> PageContent:
+        """Rebuild a PageContent from a cache entry written by a previous crawl."""
+        return PageContent(url=url, depth=depth, timestamp=time.time(), **cached['page'])
+    
+    @staticmethod
+    def _load_http_cache(path: str) -> Dict[str, Dict[str, Any]]:
+        """Load the conditional-GET cache, starting empty if it is missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable crawl cache {path}: {e}")
+            return {}
+    
+    def _save_http_cache(self, path: str) -> None:
+        """Write the conditional-GET cache atomically."""
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._http_cache, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write crawl cache {path}: {e}")
+    
+    async def _fallback_url_discovery(self, start_url: str) -> Set[str]:
         """Fallback URL discovery when sitemap is not available.
         
         This method:
@@ -254,29 +631,27 @@ class WebCrawler:
             parsed_base = urlparse(start_url)
             base_domain = f"{parsed_base.scheme}://{parsed_base.netloc}"
             
-            # Common documentation paths to try
-            common_doc_paths = [
-                '/docs', '/documentation', '/api', '/reference', 
-                '/guide', '/tutorial', '/getting-started', '/quickstart',
-                '/api-reference', '/api-docs', '/developer', '/developers',
-                '/help', '/manual', '/user-guide', '/examples'
-            ]
-            
-            # Add common paths
-            for path in common_doc_paths:
+            # Add common documentation paths to try
+            for path in _COMMON_DOC_PATHS:
                 potential_url = urljoin(base_domain, path)
                 discovered_urls.add(potential_url)
             
             # Fetch the start page and extract links
             logger.info(f"Attempting to discover URLs from page content at {start_url}")
-            response = self.session.get(start_url, timeout=self.config.timeout)
+            async with self.session.get(start_url) as response:
+                html = b''
+                if response.status == 200:
+                    # Same size cap as page fetches; an oversized start page yields no links
+                    html = await _read_capped(response, self.config.max_page_bytes)
+                    if html is None:
+                        logger.info(f"Skipping start page larger than {self.config.max_page_bytes} bytes: {start_url}")
+                        html = b''
             
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
+            if html.strip():
+                tree = lxml.html.document_fromstring(html)
                 
                 # Find all links
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
+                for href in tree.xpath('//a/@href'):
                     absolute_url = urljoin(start_url, href)
                     
                     # Only include URLs from the same domain
@@ -284,14 +659,11 @@ class WebCrawler:
                     if parsed_url.netloc == parsed_base.netloc:
                         # Filter for documentation-related URLs
                         url_lower = absolute_url.lower()
-                        doc_keywords = ['doc', 'api', 'guide', 'tutorial', 'reference', 
-                                      'manual', 'help', 'example', 'getting-started']
-                        
-                        if any(keyword in url_lower for keyword in doc_keywords):
+                        if any(keyword in url_lower for keyword in _DOC_KEYWORDS):
                             discovered_urls.add(absolute_url)
                             
                         # Also add URLs that are direct children of common doc paths
-                        for doc_path in common_doc_paths:
+                        for doc_path in _COMMON_DOC_PATHS:
                             if doc_path in parsed_url.path:
                                 discovered_urls.add(absolute_url)
                 
@@ -307,75 +679,23 @@ class WebCrawler:
         
         return discovered_urls
     
-    def _clean_soup(self, soup: BeautifulSoup) -> None:
-        """Remove unwanted elements from the parsed HTML."""
-        # Remove script, style, nav, footer, sidebar elements
-        unwanted_tags = ['script', 'style', 'nav', 'footer', 'aside', 'header']
-        unwanted_classes = ['nav', 'navigation', 'menu', 'sidebar', 'footer', 'header', 'breadcrumb']
-        unwanted_ids = ['nav', 'navigation', 'menu', 'sidebar', 'footer', 'header', 'breadcrumb']
-        
-        # Remove by tag name
-        for tag_name in unwanted_tags:
-            for element in soup.find_all(tag_name):
-                element.decompose()
-        
-        # Remove by class
-        for class_name in unwanted_classes:
-            for element in soup.find_all(class_=lambda x: x and class_name in ' '.join(x).lower()):
-                element.decompose()
-        
-        # Remove by id
-        for id_name in unwanted_ids:
-            for element in soup.find_all(id=lambda x: x and id_name in x.lower()):
-                element.decompose()
-    
-    def _extract_main_content(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Extract the main content from the page."""
-        # Try to find main content containers
-        main_selectors = [
-            'main',
-            '[role="main"]',
-            '.main',
-            '.content',
-            '.main-content',
-            '.page-content',
-            '.post-content',
-            '.entry-content',
-            '.article-content',
-            'article',
-            '.documentation'
-        ]
-        
-        for selector in main_selectors:
-            main_content = soup.select_one(selector)
-            if main_content:
-                return main_content
-        
-        # If no main content found, use body
-        body = soup.find('body')
-        return body if body else soup
-    
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        """Extract and resolve links from the page."""
-        links = []
-        
-        for link_elem in soup.find_all('a', href=True):
-            href = link_elem['href'].strip()
-            if href:
-                absolute_url = urljoin(base_url, href)
-                # Only include HTTP(S) links
-                if absolute_url.startswith(('http://', 'https://')):
-                    links.append(absolute_url)
-        
-        return list(set(links))  # Remove duplicates
-    
-    def _respect_crawl_delay(self, url: str) -> None:
-        """Respect crawl delay from robots.txt or configuration."""
-        if self.config.respect_robots:
-            robots_delay = self.robots_checker.get_crawl_delay(url)
-            delay = max(self.config.request_delay, robots_delay or 0)
-        else:
-            delay = self.config.request_delay
+    async def _respect_crawl_delay(self, url: str) -> None:
+        """Respect crawl delay from robots.txt or configuration, per host."""
+        host = _urlparse(url).netloc
+        delay = self._crawl_delays.get(host)
+        if delay is None:
+            if self.config.respect_robots:
+                robots_delay = self.robots_checker.get_crawl_delay(url)
+                delay = max(self.config.request_delay, robots_delay or 0)
+            else:
+                delay = self.config.request_delay
+            self._crawl_delays[host] = delay
         
         if delay > 0:
-            time.sleep(delay)
\ No newline at end of file
+            # Requests to one host are spaced out in turn; other hosts proceed in parallel
+            lock = self._host_locks.setdefault(host, asyncio.Lock())
+            async with lock:
+                wait = delay - (time.monotonic() - self._last_fetch_time.get(host, float('-inf')))
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_fetch_time[host] = time.monotonic()
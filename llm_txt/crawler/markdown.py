@@ -0,0 +1,213 @@
+"""Markdown rendering of parsed HTML for the documentation subset."""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional
+
+import lxml.html
+
+# Block containers: rendered content is separated by blank lines
+_BLOCK_TAGS = frozenset([
+    'html', 'body', 'main', 'article', 'section', 'div', 'p', 'header', 'footer',
+    'nav', 'aside', 'figure', 'figcaption', 'details', 'summary', 'center', 'address', 'li'
+])
+
+# Elements whose content never reaches the markdown output
+_SKIP_TAGS = frozenset([
+    'img', 'picture', 'source', 'svg', 'script', 'style', 'noscript', 'template',
+    'button', 'input', 'select', 'textarea', 'form', 'iframe', 'video', 'audio',
+    'canvas', 'meta', 'link'
+])
+
+# Markup this renderer does not handle; callers fall back to html2text
+_UNSUPPORTED_TAGS = frozenset([
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'td', 'th', 'caption', 'colgroup', 'col',
+    'dl', 'dt', 'dd', 'math'
+])
+
+_HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+
+_WS_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\S+')
+_LANGUAGE_RE = re.compile(r'(?:^|\s)(?:language|lang)-([\w+-]+)')
+_LINE_INDENT_RE = re.compile(r'\n[ \t]+(?![ \t]|(?:[*]|\d+\.) )')
+_TRAILING_WS_RE = re.compile(r'[ \t]+\n')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_CODE_PLACEHOLDER_RE = re.compile(r'\x00(\d+)\x00')
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-separated words without building a list of them."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+@dataclass
+class RenderedContent:
+    """Markdown and plain text produced by one render pass."""
+    markdown: str
+    text: str
+    word_count: int
+
+
+class _Unsupported(Exception):
+    """Raised when the element tree contains markup the renderer cannot handle."""
+
+
+class _Renderer:
+    """Single-pass renderer from an lxml element tree to markdown."""
+
+    def __init__(self) -> None:
+        # Code blocks are kept aside so whitespace normalization skips them
+        self.code_blocks: List[str] = []
+        # Plain text and word count, tallied as text nodes are visited
+        self.text_parts: List[str] = []
+        self.word_count = 0
+
+    def render(self, element: lxml.html.HtmlElement) -> str:
+        text = self._element(element, list_depth=0)
+
+        # Normalize whitespace around line breaks (list indentation is kept)
+        text = _TRAILING_WS_RE.sub('\n', text)
+        text = _LINE_INDENT_RE.sub('\n', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text).strip()
+
+        return _CODE_PLACEHOLDER_RE.sub(lambda m: self.code_blocks[int(m.group(1))], text)
+
+    def _text(self, raw: str) -> str:
+        """Record a text node for the plain-text output and return it whitespace-collapsed."""
+        stripped = raw.strip()
+        if stripped:
+            self.text_parts.append(stripped)
+            self.word_count += count_words(stripped)
+        return _WS_RE.sub(' ', raw)
+
+    def _children(self, element: lxml.html.HtmlElement, list_depth: int) -> str:
+        parts = []
+        if element.text:
+            parts.append(self._text(element.text))
+        for child in element:
+            parts.append(self._element(child, list_depth))
+            if child.tail:
+                parts.append(self._text(child.tail))
+        return ''.join(parts)
+
+    def _element(self, element: lxml.html.HtmlElement, list_depth: int) -> str:
+        tag = element.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions
+            return ''
+        tag = tag.lower()
+
+        if tag in _SKIP_TAGS:
+            return ''
+        if tag in _UNSUPPORTED_TAGS:
+            raise _Unsupported(tag)
+
+        if tag in _HEADING_LEVELS:
+            inner = self._children(element, list_depth).strip()
+            return f"\n\n{'#' * _HEADING_LEVELS[tag]} {inner}\n\n" if inner else ''
+
+        if tag in ('ul', 'ol'):
+            return self._list(element, list_depth)
+
+        if tag == 'pre':
+            return self._code_block(element)
+
+        if tag == 'code':
+            code = element.text_content()
+            return f"`{self._text(code)}`" if code.strip() else ''
+
+        if tag == 'a':
+            inner = self._children(element, list_depth).strip()
+            href = element.get('href')
+            if inner and href:
+                return f"[{inner}]({href})"
+            return inner
+
+        if tag in ('strong', 'b'):
+            inner = self._children(element, list_depth).strip()
+            return f"**{inner}**" if inner else ''
+
+        if tag in ('em', 'i'):
+            inner = self._children(element, list_depth).strip()
+            return f"_{inner}_" if inner else ''
+
+        if tag == 'br':
+            return '\n'
+
+        if tag == 'hr':
+            return '\n\n* * *\n\n'
+
+        if tag == 'blockquote':
+            inner = self._children(element, list_depth).strip()
+            inner = _BLANK_LINES_RE.sub('\n\n', inner)
+            quoted = '\n'.join(f"> {line}" if line else '>' for line in inner.split('\n'))
+            return f"\n\n{quoted}\n\n"
+
+        inner = self._children(element, list_depth)
+        if tag in _BLOCK_TAGS:
+            return f"\n\n{inner.strip()}\n\n"
+
+        # Inline and unknown (e.g. custom) elements are transparent
+        return inner
+
+    def _list(self, element: lxml.html.HtmlElement, list_depth: int) -> str:
+        ordered = element.tag.lower() == 'ol'
+        try:
+            number = int(element.get('start', 1))
+        except ValueError:
+            number = 1
+
+        indent = '  ' * (list_depth + 1)
+        items = []
+        for child in element:
+            if not isinstance(child.tag, str) or child.tag.lower() != 'li':
+                # Stray content directly inside the list
+                stray = self._element(child, list_depth).strip()
+                if stray:
+                    items.append(f"{indent}{stray}")
+                continue
+
+            # Nested blocks inside an item stay on consecutive lines
+            body = self._children(child, list_depth + 1).strip()
+            body = re.sub(r'\n\s*\n', '\n', body)
+            marker = f"{number}." if ordered else '*'
+            items.append(f"{indent}{marker} {body}")
+            number += 1
+
+        return '\n\n' + '\n'.join(items) + '\n\n' if items else ''
+
+    def _code_block(self, element: lxml.html.HtmlElement) -> str:
+        code = element.text_content().strip('\n')
+        if not code.strip():
+            return ''
+        self._text(code)
+
+        language = ''
+        for candidate in [element] + list(element.iter('code')):
+            match = _LANGUAGE_RE.search(candidate.get('class', ''))
+            if match:
+                language = match.group(1)
+                break
+
+        self.code_blocks.append(f"```{language}\n{code}\n```")
+        return f"\n\n\x00{len(self.code_blocks) - 1}\x00\n\n"
+
+
+def tree_to_markdown(element: lxml.html.HtmlElement) -> Optional[RenderedContent]:
+    """Render an lxml element as markdown, collecting its plain text on the way.
+
+    Returns None when the element contains markup outside the supported
+    documentation subset (tables, definition lists, ...), so the caller
+    can fall back to a general-purpose converter.
+    """
+    renderer = _Renderer()
+    try:
+        markdown = renderer.render(element)
+    except _Unsupported:
+        return None
+    return RenderedContent(
+        markdown=markdown,
+        text=' '.join(renderer.text_parts),
+        word_count=renderer.word_count
+    )
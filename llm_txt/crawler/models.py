@@ -6,7 +6,7 @@ from urllib.parse import urljoin
 import time
 
 
-@dataclass
+@dataclass(frozen=True)
 class CrawlConfig:
     """Configuration for web crawling."""
     
@@ -17,6 +17,24 @@ class CrawlConfig:
     respect_robots: bool = True
     timeout: int = 30
     follow_redirects: bool = True
+    # Maximum number of page fetches in flight at once
+    max_concurrency: int = 16
+    # Maximum simultaneous connections to a single host
+    per_host_limit: int = 8
+    # Pages with larger bodies are skipped without being fully downloaded
+    max_page_bytes: int = 5 * 1024 * 1024
+    # Worker processes for HTML parsing (WebCrawler); 0 parses on the event loop
+    parse_processes: int = 0
+    # JSON file of ETag/Last-Modified validators and extracted pages kept
+    # between runs (WebCrawler); unchanged pages are then not re-downloaded
+    cache_path: Optional[str] = None
+    # Directory where robots.txt results are kept between runs, and how long
+    # (seconds) a cached robots.txt, in memory or on disk, stays valid
+    robots_cache_dir: Optional[str] = None
+    robots_cache_ttl: float = 3600
+    # Directory where parsed sitemap URLs and their validators are kept
+    # between runs; unchanged sitemaps are then not downloaded again
+    sitemap_cache_dir: Optional[str] = None
     # Preferred language (used to filter locale-specific pages)
     # Example: "en" to prefer English content only
     language: Optional[str] = "en"
@@ -26,6 +44,12 @@ class CrawlConfig:
 class PageContent:
     """Represents extracted content from a web page."""
     
+    # Crawls hold many pages; slots avoid a per-instance __dict__
+    __slots__ = (
+        'url', 'title', 'content', 'markdown', 'depth', 'timestamp',
+        'status_code', 'content_type', 'links', 'metadata'
+    )
+    
     url: str
     title: str
     content: str
@@ -46,6 +70,10 @@ class PageContent:
 class CrawlResult:
     """Result of a crawling operation."""
     
+    __slots__ = (
+        'pages', 'failed_urls', 'blocked_urls', 'total_pages', 'success_rate', 'duration'
+    )
+    
     pages: List[PageContent]
     failed_urls: List[str]
     blocked_urls: List[str]
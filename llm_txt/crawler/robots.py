@@ -1,33 +1,83 @@
 """Robots.txt checker for respecting crawling policies."""
 
+import asyncio
 import logging
-from typing import Optional, Dict
-from urllib.parse import urljoin, urlparse
+import os
+import re
+import time
+from typing import Optional, Dict, Tuple
+from urllib.parse import urljoin, urlsplit
 from urllib.robotparser import RobotFileParser
+import aiohttp
 import requests
+from aiohttp import ClientError, ClientTimeout
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 logger = logging.getLogger(__name__)
 
+_ROBOTS_TIMEOUT = ClientTimeout(total=10)
+_CACHE_FILENAME_RE = re.compile(r'[^A-Za-z0-9.-]')
+# Marks an origin with no fresh cache entry (None is a valid cached result)
+_NOT_CACHED = object()
+
 
 class RobotsChecker:
-    """Handles robots.txt checking and caching."""
+    """Handles robots.txt checking and caching.
+    
+    Results, including a missing robots.txt, are cached per origin for
+    cache_ttl seconds. With cache_dir set they are also stored there, one
+    file per origin, so later processes skip the download while the file's
+    mtime is within the TTL.
+    """
+    
+    MAX_CACHE_ENTRIES = 1024
     
-    def __init__(self, user_agent: str = "llm-txt-generator/0.1.0") -> None:
+    def __init__(
+        self,
+        user_agent: str = "llm-txt-generator/0.1.0",
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = 3600
+    ) -> None:
         self.user_agent = user_agent
-        self._cache: Dict[str, RobotFileParser] = {}
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        # (scheme, netloc) -> (load time, parser or None when allowed by default)
+        self._cache: Dict[Tuple[str, str], Tuple[float, Optional[RobotFileParser]]] = {}
+        
+        # One pooled session for every host, so redirects and repeat visits
+        # reuse connections instead of paying a new TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": self.user_agent})
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def close(self) -> None:
+        """Close pooled connections (the checker stays usable afterwards)."""
+        self.session.close()
+    
+    async def prefetch(self, url: str, session: Optional[aiohttp.ClientSession] = None) -> None:
+        """Load and cache robots.txt for the URL's host if not cached yet.
+        
+        Pass the crawler's session to share its connection pool; afterwards
+        can_fetch and get_crawl_delay for this host are in-memory lookups.
+        """
+        origin = self._origin(url)
+        if self._lookup(origin) is not _NOT_CACHED:
+            return
+        
+        if session is None:
+            async with aiohttp.ClientSession(headers={"User-Agent": self.user_agent}) as own_session:
+                parser = await self._load_robots_txt_async(own_session, origin)
+        else:
+            parser = await self._load_robots_txt_async(session, origin)
+        self._remember(origin, parser)
     
     def can_fetch(self, url: str) -> bool:
         """Check if URL can be fetched according to robots.txt."""
         try:
-            parsed_url = urlparse(url)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            
-            # Get or create robots parser for this domain
-            if base_url not in self._cache:
-                self._cache[base_url] = self._load_robots_txt(base_url)
-            
-            robots_parser = self._cache[base_url]
+            robots_parser = self._get_parser(url)
             if robots_parser is None:
                 # No robots.txt found, assume allowed
                 return True
@@ -42,13 +92,7 @@ class RobotsChecker:
     def get_crawl_delay(self, url: str) -> Optional[float]:
         """Get crawl delay from robots.txt if specified."""
         try:
-            parsed_url = urlparse(url)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            
-            if base_url not in self._cache:
-                self._cache[base_url] = self._load_robots_txt(base_url)
-            
-            robots_parser = self._cache[base_url]
+            robots_parser = self._get_parser(url)
             if robots_parser is None:
                 return None
             
@@ -59,32 +103,104 @@ class RobotsChecker:
             logger.warning(f"Error getting crawl delay for {url}: {e}")
             return None
     
-    def _load_robots_txt(self, base_url: str) -> Optional[RobotFileParser]:
+    def _get_parser(self, url: str) -> Optional[RobotFileParser]:
+        """Return the cached robots parser for the URL's host, loading it once."""
+        origin = self._origin(url)
+        
+        # Get or create robots parser for this domain
+        robots_parser = self._lookup(origin)
+        if robots_parser is _NOT_CACHED:
+            robots_parser = self._load_robots_txt(origin)
+            self._remember(origin, robots_parser)
+        
+        return robots_parser
+    
+    @staticmethod
+    def _origin(url: str) -> Tuple[str, str]:
+        parsed_url = urlsplit(url)
+        return parsed_url.scheme, parsed_url.netloc
+    
+    def _lookup(self, origin: Tuple[str, str]):
+        """Return the fresh parser cached in memory or on disk, or _NOT_CACHED."""
+        entry = self._cache.get(origin)
+        if entry is not None:
+            loaded_at, robots_parser = entry
+            if time.time() - loaded_at < self.cache_ttl:
+                return robots_parser
+            del self._cache[origin]
+        
+        path = self._cache_file(origin)
+        if path is None:
+            return _NOT_CACHED
+        try:
+            loaded_at = os.path.getmtime(path)
+            if time.time() - loaded_at >= self.cache_ttl:
+                return _NOT_CACHED
+            with open(path, encoding='utf-8') as f:
+                robots_parser = self._build_parser(origin, f.read())
+        except OSError:
+            return _NOT_CACHED
+        
+        self._cache[origin] = (loaded_at, robots_parser)
+        return robots_parser
+    
+    def _remember(self, origin: Tuple[str, str], robots_parser: Optional[RobotFileParser]) -> None:
+        """Cache a result in memory, evicting the oldest entry when full."""
+        if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._cache[origin] = (time.time(), robots_parser)
+    
+    def _cache_file(self, origin: Tuple[str, str]) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        name = _CACHE_FILENAME_RE.sub('_', f"{origin[0]}_{origin[1]}")
+        return os.path.join(self.cache_dir, f"{name}.txt")
+    
+    def _store(self, origin: Tuple[str, str], text: str) -> None:
+        """Persist robots.txt content for an origin; an empty file records a missing robots.txt."""
+        path = self._cache_file(origin)
+        if path is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write robots.txt cache {path}: {e}")
+    
+    @staticmethod
+    def _build_parser(origin: Tuple[str, str], text: str) -> Optional[RobotFileParser]:
+        """Parse robots.txt content; an empty file allows everything, like a missing one."""
+        if not text.strip():
+            return None
+        robots_parser = RobotFileParser()
+        robots_parser.set_url(f"{origin[0]}://{origin[1]}/robots.txt")
+        robots_parser.parse(text.splitlines())
+        return robots_parser
+    
+    def _load_robots_txt(self, origin: Tuple[str, str]) -> Optional[RobotFileParser]:
         """Load and parse robots.txt for a domain."""
+        base_url = f"{origin[0]}://{origin[1]}"
         robots_url = urljoin(base_url, "/robots.txt")
         
         try:
             logger.debug(f"Fetching robots.txt from {robots_url}")
-            response = requests.get(
-                robots_url,
-                timeout=10,
-                headers={"User-Agent": self.user_agent}
-            )
+            response = self.session.get(robots_url, timeout=10)
             
             if response.status_code == 200:
-                robots_parser = RobotFileParser()
-                robots_parser.set_url(robots_url)
-                robots_parser.read()
-                
-                # Manual parsing since set_url + read doesn't work with string content
-                lines = response.text.splitlines()
-                robots_parser.parse(lines)
+                # Parse the fetched body directly; RobotFileParser.read()
+                # would download robots.txt a second time with urllib
+                text = response.text
+                self._store(origin, text)
                 
                 logger.debug(f"Successfully loaded robots.txt for {base_url}")
-                return robots_parser
+                return self._build_parser(origin, text)
             
             elif response.status_code == 404:
                 logger.debug(f"No robots.txt found for {base_url}")
+                self._store(origin, '')
                 return None
             
             else:
@@ -96,4 +212,37 @@ class RobotsChecker:
             return None
         except Exception as e:
             logger.error(f"Unexpected error loading robots.txt from {robots_url}: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    async def _load_robots_txt_async(
+        self, session: aiohttp.ClientSession, origin: Tuple[str, str]
+    ) -> Optional[RobotFileParser]:
+        """Load and parse robots.txt for a domain over an aiohttp session."""
+        base_url = f"{origin[0]}://{origin[1]}"
+        robots_url = urljoin(base_url, "/robots.txt")
+        
+        try:
+            logger.debug(f"Fetching robots.txt from {robots_url}")
+            async with session.get(robots_url, timeout=_ROBOTS_TIMEOUT) as response:
+                if response.status == 200:
+                    text = await response.text()
+                    self._store(origin, text)
+                    
+                    logger.debug(f"Successfully loaded robots.txt for {base_url}")
+                    return self._build_parser(origin, text)
+                
+                elif response.status == 404:
+                    logger.debug(f"No robots.txt found for {base_url}")
+                    self._store(origin, '')
+                    return None
+                
+                else:
+                    logger.warning(f"Failed to fetch robots.txt from {robots_url}: {response.status}")
+                    return None
+                
+        except (ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Network error fetching robots.txt from {robots_url}: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error loading robots.txt from {robots_url}: {e}")
+            return None
@@ -1,172 +1,327 @@
 """Sitemap discovery and parsing for efficient crawling."""
 
+import asyncio
+import hashlib
+import json
 import logging
-import xml.etree.ElementTree as ET
-from typing import List, Set, Optional
-from urllib.parse import urljoin, urlparse
+import os
+from typing import Any, Dict, List, Set, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
 from datetime import datetime
-import requests
-from requests.exceptions import RequestException
+import aiohttp
+from aiohttp import ClientError, ClientTimeout
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
+_ROBOTS_TIMEOUT = ClientTimeout(total=10)
+_SITEMAP_TIMEOUT = ClientTimeout(total=30)
+_SITEMAP_CHUNK_SIZE = 64 * 1024
+# Sitemap downloads in flight at once against a single host
+_SITEMAP_FETCHES_PER_HOST = 8
+# Conventional sitemap locations, probed even when robots.txt declares others
+_CONVENTIONAL_SITEMAP_PATHS = ("/sitemap.xml", "/sitemap_index.xml")
+# Further common locations, probed only when robots.txt declares no sitemap
+_EXTRA_SITEMAP_PATHS = ("/sitemaps.xml", "/sitemap/sitemap.xml")
+
 
 class SitemapParser:
-    """Discovers and parses XML sitemaps to find URLs to crawl."""
+    """Discovers and parses XML sitemaps to find URLs to crawl.
+    
+    With cache_dir set, the URLs parsed from each sitemap are stored there
+    together with its ETag/Last-Modified validators. Later runs revalidate
+    with a conditional GET and reuse the stored URLs on 304 Not Modified.
+    """
     
-    def __init__(self, user_agent: str = "llm-txt-generator/0.1.0") -> None:
+    def __init__(
+        self,
+        user_agent: str = "llm-txt-generator/0.1.0",
+        cache_dir: Optional[str] = None
+    ) -> None:
         self.user_agent = user_agent
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.user_agent})
+        self.cache_dir = cache_dir
     
-    def discover_urls(self, base_url: str) -> Set[str]:
-        """Discover URLs from sitemap(s) at the given base URL."""
+    async def discover_urls(
+        self, base_url: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> Set[str]:
+        """Discover URLs from sitemap(s) at the given base URL.
+        
+        Pass the crawler's session to share its connection pool; without
+        one a short-lived session is opened for the discovery.
+        """
+        if session is None:
+            async with aiohttp.ClientSession(headers={"User-Agent": self.user_agent}) as own_session:
+                return await self.discover_urls(base_url, own_session)
+        
         urls: Set[str] = set()
         
         # Try common sitemap locations
-        sitemap_urls = self._find_sitemaps(base_url)
+        sitemap_urls = await self._find_sitemaps(session, base_url)
         
-        for sitemap_url in sitemap_urls:
-            try:
-                sitemap_urls_found = self._parse_sitemap(sitemap_url)
+        # Sitemaps and sitemap-index children are fetched concurrently, with
+        # a per-host bound so a large index does not hammer one server; each
+        # sitemap is fetched once, so indexes that reference each other terminate
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        visited: Set[str] = set()
+        results = await asyncio.gather(
+            *[
+                self._parse_sitemap(session, sitemap_url, host_limits, visited)
+                for sitemap_url in sitemap_urls
+            ],
+            return_exceptions=True
+        )
+        for sitemap_url, sitemap_urls_found in zip(sitemap_urls, results):
+            if isinstance(sitemap_urls_found, Exception):
+                logger.warning(f"Failed to parse sitemap {sitemap_url}: {sitemap_urls_found}")
+                continue
+            if sitemap_urls_found:
                 urls.update(sitemap_urls_found)
                 logger.info(f"Found {len(sitemap_urls_found)} URLs in sitemap: {sitemap_url}")
-            except Exception as e:
-                logger.warning(f"Failed to parse sitemap {sitemap_url}: {e}")
         
         return urls
     
-    def _find_sitemaps(self, base_url: str) -> List[str]:
-        """Find sitemap URLs for a domain."""
-        sitemaps = []
+    def discover_urls_sync(self, base_url: str) -> Set[str]:
+        """Discover sitemap URLs from synchronous code (runs its own event loop)."""
+        return asyncio.run(self.discover_urls(base_url))
+    
+    async def _find_sitemaps(self, session: aiohttp.ClientSession, base_url: str) -> List[str]:
+        """Find sitemap URLs for a domain.
         
+        Returns the sitemaps declared in robots.txt followed by the
+        conventional /sitemap.xml and /sitemap_index.xml, plus further common
+        locations when robots.txt declares none. Candidates are returned
+        unprobed; fetching them treats a 404 as absence, which saves a HEAD
+        round trip per candidate.
+        """
         # Check robots.txt for sitemap declarations
-        robots_sitemaps = self._get_sitemaps_from_robots(base_url)
-        sitemaps.extend(robots_sitemaps)
+        robots_sitemaps = await self._get_sitemaps_from_robots(session, base_url)
         
         # Try common sitemap locations
-        common_paths = [
-            "/sitemap.xml",
-            "/sitemap_index.xml",
-            "/sitemaps.xml",
-            "/sitemap/sitemap.xml"
-        ]
-        
-        for path in common_paths:
-            sitemap_url = urljoin(base_url, path)
-            if sitemap_url not in sitemaps and self._url_exists(sitemap_url):
-                sitemaps.append(sitemap_url)
+        common_paths = _CONVENTIONAL_SITEMAP_PATHS
+        if not robots_sitemaps:
+            common_paths += _EXTRA_SITEMAP_PATHS
         
-        return sitemaps
+        candidates = robots_sitemaps + [urljoin(base_url, path) for path in common_paths]
+        return list(dict.fromkeys(candidates))
     
-    def _get_sitemaps_from_robots(self, base_url: str) -> List[str]:
+    async def _get_sitemaps_from_robots(self, session: aiohttp.ClientSession, base_url: str) -> List[str]:
         """Extract sitemap URLs from robots.txt."""
         sitemaps = []
         robots_url = urljoin(base_url, "/robots.txt")
         
         try:
-            response = self.session.get(robots_url, timeout=10)
-            if response.status_code == 200:
-                for line in response.text.splitlines():
-                    line = line.strip()
-                    if line.lower().startswith("sitemap:"):
-                        sitemap_url = line.split(":", 1)[1].strip()
-                        sitemaps.append(sitemap_url)
-        except RequestException as e:
+            async with session.get(robots_url, timeout=_ROBOTS_TIMEOUT) as response:
+                if response.status == 200:
+                    text = await response.text()
+                    for line in text.splitlines():
+                        line = line.strip()
+                        if line.lower().startswith("sitemap:"):
+                            sitemap_url = line.split(":", 1)[1].strip()
+                            sitemaps.append(sitemap_url)
+        except (ClientError, asyncio.TimeoutError, UnicodeDecodeError) as e:
             logger.debug(f"Could not fetch robots.txt from {robots_url}: {e}")
         
         return sitemaps
     
-    def _url_exists(self, url: str) -> bool:
-        """Check if a URL exists (returns 200)."""
-        try:
-            response = self.session.head(url, timeout=10)
-            return response.status_code == 200
-        except RequestException:
-            return False
-    
-    def _parse_sitemap(self, sitemap_url: str) -> Set[str]:
+    async def _parse_sitemap(
+        self,
+        session: aiohttp.ClientSession,
+        sitemap_url: str,
+        host_limits: Dict[str, asyncio.Semaphore],
+        visited: Set[str]
+    ) -> Set[str]:
         """Parse an XML sitemap and extract URLs."""
         urls: Set[str] = set()
+        if sitemap_url in visited:
+            logger.debug(f"Skipping already fetched sitemap {sitemap_url}")
+            return urls
+        visited.add(sitemap_url)
+        host = urlsplit(sitemap_url).netloc
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(_SITEMAP_FETCHES_PER_HOST)
         
         try:
-            response = self.session.get(sitemap_url, timeout=30)
-            response.raise_for_status()
+            cached = await asyncio.to_thread(self._load_cached, sitemap_url) if self.cache_dir else None
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            # The host slot is held for the download only, never while
+            # waiting on child sitemaps
+            async with host_limits[host], session.get(
+                sitemap_url, headers=headers, timeout=_SITEMAP_TIMEOUT
+            ) as response:
+                if response.status == 304 and cached:
+                    logger.debug(f"Sitemap not modified, using cached URLs: {sitemap_url}")
+                    parsed = (cached['is_index'], set(cached['page_urls']), cached['sitemap_urls'])
+                else:
+                    if response.status in (404, 410):
+                        logger.debug(f"No sitemap at {sitemap_url}")
+                        return urls
+                    if response.status >= 400:
+                        logger.warning(f"Sitemap {sitemap_url} returned HTTP {response.status}")
+                        return urls
+                    
+                    # Check if the response is actually XML
+                    content_type = response.headers.get('content-type', '').lower()
+                    parsed = None if 'html' in content_type else await self._stream_sitemap(response)
+                    
+                    validators = {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified')
+                    }
+                    if parsed is not None and self.cache_dir and any(validators.values()):
+                        await asyncio.to_thread(self._store_cached, sitemap_url, validators, parsed)
             
-            # Check if the response is actually XML
-            content_type = response.headers.get('content-type', '').lower()
-            if 'html' in content_type or response.text.strip().startswith('<!DOCTYPE') or response.text.strip().startswith('<html'):
+            if parsed is None:
                 logger.warning(f"Sitemap URL {sitemap_url} returned HTML instead of XML. Sitemap may be blocked or unavailable.")
                 return urls
             
-            # Parse XML
-            root = ET.fromstring(response.content)
-            
             # Handle different sitemap formats
-            if self._is_sitemap_index(root):
-                # This is a sitemap index, parse each referenced sitemap
-                sitemap_urls = self._parse_sitemap_index(root)
-                for sub_sitemap_url in sitemap_urls:
-                    sub_urls = self._parse_sitemap(sub_sitemap_url)
+            is_index, page_urls, sitemap_urls = parsed
+            if is_index:
+                # This is a sitemap index; fetch the referenced sitemaps concurrently
+                results = await asyncio.gather(
+                    *[
+                        self._parse_sitemap(session, sub_sitemap_url, host_limits, visited)
+                        for sub_sitemap_url in sitemap_urls
+                    ]
+                )
+                for sub_urls in results:
                     urls.update(sub_urls)
             else:
                 # This is a regular sitemap with URLs
-                urls.update(self._parse_url_sitemap(root))
+                urls.update(page_urls)
                 
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             # Check if this might be an HTML page
             if sitemap_url:
                 logger.warning(f"Failed to parse sitemap at {sitemap_url} - may be blocked or returning HTML")
-        except RequestException as e:
+        except (ClientError, asyncio.TimeoutError) as e:
             logger.error(f"Network error fetching sitemap {sitemap_url}: {e}")
         except Exception as e:
             logger.error(f"Unexpected error parsing sitemap {sitemap_url}: {e}")
         
         return urls
     
-    def _is_sitemap_index(self, root: ET.Element) -> bool:
-        """Check if this is a sitemap index file."""
-        # Check for sitemapindex root element
-        if root.tag.endswith("sitemapindex"):
-            return True
-        
-        # Check for sitemap children
-        for child in root:
-            if child.tag.endswith("sitemap"):
-                return True
-        
-        return False
+    def _cache_file(self, sitemap_url: str) -> str:
+        name = hashlib.sha1(sitemap_url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
     
-    def _parse_sitemap_index(self, root: ET.Element) -> List[str]:
-        """Parse a sitemap index and return sitemap URLs."""
-        sitemap_urls = []
+    def _load_cached(self, sitemap_url: str) -> Optional[Dict[str, Any]]:
+        """Load the stored URLs and validators for a sitemap, if any."""
+        try:
+            with open(self._cache_file(sitemap_url), encoding='utf-8') as f:
+                cached = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable sitemap cache for {sitemap_url}: {e}")
+            return None
+        return cached if isinstance(cached, dict) and cached.get('url') == sitemap_url else None
+    
+    def _store_cached(
+        self,
+        sitemap_url: str,
+        validators: Dict[str, Optional[str]],
+        parsed: Tuple[bool, Set[str], List[str]]
+    ) -> None:
+        """Write a sitemap's URLs and validators to the cache directory."""
+        is_index, page_urls, sitemap_urls = parsed
+        path = self._cache_file(sitemap_url)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'url': sitemap_url,
+                    **validators,
+                    'is_index': is_index,
+                    'page_urls': sorted(page_urls),
+                    'sitemap_urls': sitemap_urls
+                }, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write sitemap cache {path}: {e}")
+    
+    async def _stream_sitemap(
+        self, response: aiohttp.ClientResponse
+    ) -> Optional[Tuple[bool, Set[str], List[str]]]:
+        """Parse a sitemap body incrementally as it downloads.
         
-        for sitemap in root:
-            if sitemap.tag.endswith("sitemap"):
-                for child in sitemap:
-                    if child.tag.endswith("loc"):
-                        sitemap_urls.append(child.text.strip())
+        Returns whether the document is a sitemap index, its page URLs and
+        its sub-sitemap URLs, or None when the body is an HTML page. Entries
+        are dropped from the tree once read, so memory use does not grow
+        with the size of the sitemap.
+        """
+        # Only completed <url>/<sitemap> entries are reported (in any
+        # namespace); lxml skips every other element without a Python call
+        parser = etree.XMLPullParser(
+            events=('end',), tag=('{*}url', '{*}sitemap'), resolve_entities=False
+        )
+        root = None
+        is_index = False
+        page_urls: Set[str] = set()
+        sitemap_urls: List[str] = []
         
-        return sitemap_urls
-    
-    def _parse_url_sitemap(self, root: ET.Element) -> Set[str]:
-        """Parse a URL sitemap and return page URLs."""
-        urls: Set[str] = set()
+        def handle_events() -> None:
+            nonlocal root, is_index
+            for _, elem in parser.read_events():
+                if root is None:
+                    root = elem.getparent()
+                    if root is None:
+                        continue
+                    # The root element alone says whether this is an index
+                    root_name = _local_name(root)
+                    is_index = root_name == "sitemapindex"
+                    if not is_index and root_name != "urlset":
+                        logger.debug(f"Unexpected sitemap root element <{root_name}>")
+                if elem.getparent() is not root:
+                    continue
+                
+                # A complete <sitemap> (index) or <url> entry directly under the root
+                if (_local_name(elem) == "sitemap") == is_index:
+                    for loc in elem.iterchildren('{*}loc'):
+                        if not loc.text:
+                            continue
+                        url = loc.text.strip()
+                        if is_index:
+                            sitemap_urls.append(url)
+                        elif self._is_valid_url(url):
+                            page_urls.add(url)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del root[0]
         
-        for url_elem in root:
-            if url_elem.tag.endswith("url"):
-                for child in url_elem:
-                    if child.tag.endswith("loc"):
-                        url = child.text.strip()
-                        if self._is_valid_url(url):
-                            urls.add(url)
+        first_chunk = True
+        async for chunk in response.content.iter_chunked(_SITEMAP_CHUNK_SIZE):
+            if first_chunk:
+                head = chunk.lstrip()[:16].lower()
+                if head.startswith(b'<!doctype') or head.startswith(b'<html'):
+                    return None
+                first_chunk = False
+            parser.feed(chunk)
+            handle_events()
         
-        return urls
+        # Raises XMLSyntaxError for an empty or truncated document
+        parser.close()
+        handle_events()
+        
+        return is_index, page_urls, sitemap_urls
     
     def _is_valid_url(self, url: str) -> bool:
         """Basic URL validation."""
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
             return parsed.scheme in ("http", "https") and parsed.netloc
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+
+def _local_name(elem) -> str:
+    """Tag name without its XML namespace."""
+    tag = elem.tag
+    return tag.rpartition('}')[2] if isinstance(tag, str) else ''
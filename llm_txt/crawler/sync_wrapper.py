@@ -2,32 +2,47 @@
 
 import asyncio
 from typing import Optional
-from .async_crawler import WebCrawler as AsyncWebCrawler
+from .crawler import WebCrawler
 from .models import CrawlConfig, CrawlResult
 
 
 class WebCrawlerSync:
-    """Synchronous wrapper for WebCrawler to use in CLI."""
+    """Synchronous wrapper for WebCrawler to use in CLI.
+
+    All crawls made through one wrapper run on the same event loop, which
+    is closed by close() or on leaving a ``with`` block.
+    """
 
     def __init__(self, config: Optional[CrawlConfig] = None):
-        self.async_crawler = AsyncWebCrawler(config)
+        self.async_crawler = WebCrawler(config)
         self.config = config
+        # asyncio.Runner (Python 3.11+) also handles Ctrl-C and context
+        # variables; older versions drive a plain event loop
+        if hasattr(asyncio, 'Runner'):
+            self._runner = asyncio.Runner()
+            self._loop = None
+        else:
+            self._runner = None
+            self._loop = asyncio.new_event_loop()
 
     def crawl(self, start_url: str) -> CrawlResult:
         """Synchronously crawl a website."""
-        # Create new event loop if needed
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We're already in an async context, create a new loop
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    return loop.run_until_complete(self.async_crawler.crawl(start_url))
-                finally:
-                    loop.close()
-            else:
-                return loop.run_until_complete(self.async_crawler.crawl(start_url))
-        except RuntimeError:
-            # No event loop exists, create one
-            return asyncio.run(self.async_crawler.crawl(start_url))
\ No newline at end of file
+        coro = self.async_crawler.crawl(start_url)
+        if self._runner is not None:
+            return self._runner.run(coro)
+        return self._loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Shut down the event loop used for crawling."""
+        if self._runner is not None:
+            self._runner.close()
+        elif not self._loop.is_closed():
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+
+    def __enter__(self) -> 'WebCrawlerSync':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
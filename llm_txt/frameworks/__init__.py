@@ -1,5 +1,8 @@
 """Framework detection and adapters for documentation repositories."""
 
+from functools import lru_cache
+from typing import Type
+
 from .detector import FrameworkDetector
 from .base import FrameworkAdapter
 from .adapters import (
@@ -22,15 +25,24 @@ __all__ = [
 ]
 
 
+_ADAPTER_CLASSES = {
+    'docusaurus': DocusaurusAdapter,
+    'mkdocs': MkDocsAdapter,
+    'sphinx': SphinxAdapter,
+    'starlight': StarlightAdapter,
+    'generic': GenericAdapter
+}
+
+
+@lru_cache(maxsize=None)
+def _shared_adapter(adapter_class: Type[FrameworkAdapter]) -> FrameworkAdapter:
+    return adapter_class()
+
+
 def get_framework_adapter(name: str) -> FrameworkAdapter:
-    """Get framework adapter by name."""
-    adapters = {
-        'docusaurus': DocusaurusAdapter,
-        'mkdocs': MkDocsAdapter,
-        'sphinx': SphinxAdapter,
-        'starlight': StarlightAdapter,
-        'generic': GenericAdapter
-    }
-
-    adapter_class = adapters.get(name.lower(), GenericAdapter)
-    return adapter_class()
\ No newline at end of file
+    """Get framework adapter by name.
+
+    Adapters are shared per process, so per-repository caches such as the
+    parsed mkdocs.yml are reused across calls.
+    """
+    return _shared_adapter(_ADAPTER_CLASSES.get(name.lower(), GenericAdapter))
@@ -1,11 +1,64 @@
 """Framework-specific adapters for various documentation systems."""
 
 import json
+import os
+import re
 import yaml
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from .base import FrameworkAdapter
+from typing import Dict, List, Optional, Tuple
+
+from .base import FrameworkAdapter, load_yaml
+
+# Patterns used while scanning framework config and page files
+_EXPORT_RE = re.compile(r'(?:module\.exports|export\s+default)\s*=\s*({[\s\S]+});?')
+_DOCS_PATH_RE = re.compile(r"path:\s*['\"](.+?)['\"]")
+_TOCTREE_RE = re.compile(r'.. toctree::[\s\S]*?(?=\n\n|\n.. |\Z)')
+_SIDEBAR_RE = re.compile(r'sidebar:\s*\[([\s\S]*?)\]')
+_NUM_PREFIX_RE = re.compile(r'^\d+[-_]')
+_NUMBERED_FILE_RE = re.compile(r'^(\d+)[-_.]')
+
+# Priority of well-known page names (file stem, lowercased) per framework
+_DOCUSAURUS_PRIORITY = {
+    'index': 0, 'intro': 0, 'introduction': 0, 'getting-started': 0, 'quickstart': 0,
+    'installation': 5, 'setup': 5, 'configuration': 5, 'config': 5,
+    'api': 10, 'reference': 10, 'api-reference': 10,
+    'tutorial': 15, 'guide': 15, 'how-to': 15,
+}
+_MKDOCS_PRIORITY = {
+    'index': 0, 'home': 0,
+    'getting-started': 5, 'quickstart': 5, 'installation': 5,
+    'user-guide': 10, 'guide': 10, 'tutorial': 10,
+    'api': 15, 'reference': 15, 'api-reference': 15,
+    'configuration': 20, 'config': 20, 'settings': 20,
+}
+_SPHINX_PRIORITY = {
+    'index': 0,
+    'quickstart': 5, 'getting_started': 5, 'introduction': 5,
+    'installation': 10, 'install': 10, 'setup': 10,
+    'tutorial': 15, 'tutorials': 15, 'guide': 15,
+    'api': 20, 'reference': 20, 'api_reference': 20,
+    'configuration': 25, 'config': 25,
+}
+_STARLIGHT_PRIORITY = {
+    'index': 0, 'intro': 0, 'introduction': 0,
+    'getting-started': 5, 'quickstart': 5,
+    'installation': 10, 'setup': 10,
+    'configuration': 15, 'config': 15,
+}
+# Starlight groups by parent directory when the page name is not known
+_STARLIGHT_DIR_PRIORITY = {
+    'guides': 20, 'tutorials': 20,
+    'api': 25, 'reference': 25,
+}
+
+
+def _has_doc_files(path: Path) -> bool:
+    """Check for .rst or .md files directly in path, stopping at the first one."""
+    try:
+        with os.scandir(path) as entries:
+            return any(entry.name.endswith(('.rst', '.md')) for entry in entries)
+    except OSError:
+        return False
 
 
 class DocusaurusAdapter(FrameworkAdapter):
@@ -34,8 +87,7 @@ class DocusaurusAdapter(FrameworkAdapter):
                     try:
                         content = sidebar_path.read_text()
                         # Look for module.exports or export default
-                        import re
-                        match = re.search(r'(?:module\.exports|export\s+default)\s*=\s*({[\s\S]+});?', content)
+                        match = _EXPORT_RE.search(content)
                         if match:
                             # Try to parse as JSON-like structure
                             # Note: This is a simplified approach
@@ -47,19 +99,13 @@ class DocusaurusAdapter(FrameworkAdapter):
 
     def get_docs_paths(self, repo_path: Path) -> List[Path]:
         """Get documentation paths for Docusaurus."""
-        paths = []
-
         # Standard Docusaurus paths
-        standard_paths = [
-            repo_path / 'docs',
-            repo_path / 'website' / 'docs',
-            repo_path / 'src' / 'pages',
-            repo_path / 'blog'
-        ]
-
-        for path in standard_paths:
-            if path.exists() and path.is_dir():
-                paths.append(path)
+        paths = self.find_dirs(repo_path, [
+            'docs',
+            'website/docs',
+            'src/pages',
+            'blog'
+        ])
 
         # Check docusaurus.config for custom paths
         config_files = [
@@ -74,8 +120,7 @@ class DocusaurusAdapter(FrameworkAdapter):
                 try:
                     content = config_path.read_text()
                     # Look for docs path configuration
-                    import re
-                    match = re.search(r"path:\s*['\"](.+?)['\"]", content)
+                    match = _DOCS_PATH_RE.search(content)
                     if match:
                         custom_path = repo_path / match.group(1)
                         if custom_path.exists() and custom_path not in paths:
@@ -85,19 +130,19 @@ class DocusaurusAdapter(FrameworkAdapter):
 
         return paths if paths else [repo_path]
 
-    def get_page_priority(self, file_path: Path, nav_structure: Optional[Dict]) -> int:
+    def get_page_priority(
+        self,
+        file_path: Path,
+        nav_structure: Optional[Dict],
+        front_matter: Optional[Dict] = None
+    ) -> int:
         """Get page priority based on Docusaurus conventions."""
         filename = file_path.stem.lower()
 
         # High priority pages
-        if filename in ['index', 'intro', 'introduction', 'getting-started', 'quickstart']:
-            return 0
-        elif filename in ['installation', 'setup', 'configuration', 'config']:
-            return 5
-        elif filename in ['api', 'reference', 'api-reference']:
-            return 10
-        elif filename in ['tutorial', 'guide', 'how-to']:
-            return 15
+        priority = _DOCUSAURUS_PRIORITY.get(filename)
+        if priority is not None:
+            return priority
 
         # Check if it's in the sidebar structure
         if nav_structure:
@@ -105,8 +150,7 @@ class DocusaurusAdapter(FrameworkAdapter):
             return 20
 
         # Check for number prefixes (01-intro.md, etc.)
-        import re
-        if re.match(r'^\d+[-_]', filename):
+        if _NUM_PREFIX_RE.match(filename):
             return 25
 
         return 50
@@ -115,39 +159,65 @@ class DocusaurusAdapter(FrameworkAdapter):
 class MkDocsAdapter(FrameworkAdapter):
     """Adapter for MkDocs documentation framework."""
 
+    CONFIG_FILES = ['mkdocs.yml', 'mkdocs.yaml']
+
+    def __init__(self) -> None:
+        # Parsed mkdocs.yml per repository, shared by navigation and docs paths.
+        # Entries carry the config files' (st_mtime_ns, st_size) so an edited
+        # or replaced config is re-read by this long-lived adapter instance.
+        self._config_cache: Dict[Path, Tuple[Tuple, Optional[Dict]]] = {}
+
+    def _config_signature(self, repo_path: Path) -> Tuple:
+        """Stat the candidate config files; missing files yield None."""
+        signature = []
+        for config_file in self.CONFIG_FILES:
+            try:
+                st = os.stat(repo_path / config_file)
+            except OSError:
+                signature.append(None)
+            else:
+                signature.append((st.st_mtime_ns, st.st_size))
+        return tuple(signature)
+
+    def _load_config(self, repo_path: Path) -> Optional[Dict]:
+        """Read and parse the repository's mkdocs.yml once per version."""
+        cache_key = repo_path.resolve()
+        signature = self._config_signature(repo_path)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        config = None
+        for config_file, stat_info in zip(self.CONFIG_FILES, signature):
+            if stat_info is None:
+                continue
+            try:
+                with open(repo_path / config_file) as f:
+                    config = load_yaml(f)
+                break
+            except (OSError, yaml.YAMLError):
+                pass
+
+        if not isinstance(config, dict):
+            config = None
+        self._config_cache[cache_key] = (signature, config)
+        return config
+
     def get_navigation(self, repo_path: Path) -> Optional[Dict]:
         """Extract navigation from mkdocs.yml."""
-        config_files = ['mkdocs.yml', 'mkdocs.yaml']
-
-        for config_file in config_files:
-            config_path = repo_path / config_file
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        config = yaml.safe_load(f)
-                        return config.get('nav', config.get('pages'))
-                except yaml.YAMLError:
-                    pass
-
-        return None
+        config = self._load_config(repo_path)
+        if config is None:
+            return None
+        return config.get('nav', config.get('pages'))
 
     def get_docs_paths(self, repo_path: Path) -> List[Path]:
         """Get documentation paths for MkDocs."""
         # Read from mkdocs.yml
-        config_files = ['mkdocs.yml', 'mkdocs.yaml']
-
-        for config_file in config_files:
-            config_path = repo_path / config_file
-            if config_path.exists():
-                try:
-                    with open(config_path) as f:
-                        config = yaml.safe_load(f)
-                        docs_dir = config.get('docs_dir', 'docs')
-                        path = repo_path / docs_dir
-                        if path.exists():
-                            return [path]
-                except yaml.YAMLError:
-                    pass
+        config = self._load_config(repo_path)
+        if config is not None:
+            path = repo_path / config.get('docs_dir', 'docs')
+            if path.exists():
+                return [path]
 
         # Fallback to default
         default_path = repo_path / 'docs'
@@ -156,21 +226,19 @@ class MkDocsAdapter(FrameworkAdapter):
 
         return [repo_path]
 
-    def get_page_priority(self, file_path: Path, nav_structure: Optional[Dict]) -> int:
+    def get_page_priority(
+        self,
+        file_path: Path,
+        nav_structure: Optional[Dict],
+        front_matter: Optional[Dict] = None
+    ) -> int:
         """Get page priority based on MkDocs navigation."""
         filename = file_path.stem.lower()
 
         # High priority pages
-        if filename in ['index', 'home']:
-            return 0
-        elif filename in ['getting-started', 'quickstart', 'installation']:
-            return 5
-        elif filename in ['user-guide', 'guide', 'tutorial']:
-            return 10
-        elif filename in ['api', 'reference', 'api-reference']:
-            return 15
-        elif filename in ['configuration', 'config', 'settings']:
-            return 20
+        priority = _MKDOCS_PRIORITY.get(filename)
+        if priority is not None:
+            return priority
 
         # Check position in nav structure
         if nav_structure and isinstance(nav_structure, list):
@@ -216,9 +284,7 @@ class SphinxAdapter(FrameworkAdapter):
                 try:
                     content = index_path.read_text()
                     # Extract toctree entries
-                    import re
-                    toctree_pattern = r'.. toctree::[\s\S]*?(?=\n\n|\n.. |\Z)'
-                    matches = re.findall(toctree_pattern, content)
+                    matches = _TOCTREE_RE.findall(content)
 
                     if matches:
                         # Simplified extraction
@@ -230,44 +296,31 @@ class SphinxAdapter(FrameworkAdapter):
 
     def get_docs_paths(self, repo_path: Path) -> List[Path]:
         """Get documentation paths for Sphinx."""
-        paths = []
-
         # Common Sphinx paths
-        common_paths = [
-            repo_path / 'docs' / 'source',
-            repo_path / 'docs',
-            repo_path / 'source',
-            repo_path / 'doc' / 'source',
-            repo_path / 'doc'
-        ]
+        common_paths = self.find_dirs(repo_path, [
+            'docs/source',
+            'docs',
+            'source',
+            'doc/source',
+            'doc'
+        ])
 
-        for path in common_paths:
-            if path.exists() and path.is_dir():
-                # Check if it contains .rst or .md files
-                if any(path.glob('*.rst')) or any(path.glob('*.md')):
-                    paths.append(path)
+        # Keep those that contain .rst or .md files
+        paths = [path for path in common_paths if _has_doc_files(path)]
 
         return paths if paths else [repo_path]
 
-    def get_page_priority(self, file_path: Path, nav_structure: Optional[Dict]) -> int:
+    def get_page_priority(
+        self,
+        file_path: Path,
+        nav_structure: Optional[Dict],
+        front_matter: Optional[Dict] = None
+    ) -> int:
         """Get page priority for Sphinx documentation."""
         filename = file_path.stem.lower()
 
         # High priority pages
-        if filename == 'index':
-            return 0
-        elif filename in ['quickstart', 'getting_started', 'introduction']:
-            return 5
-        elif filename in ['installation', 'install', 'setup']:
-            return 10
-        elif filename in ['tutorial', 'tutorials', 'guide']:
-            return 15
-        elif filename in ['api', 'reference', 'api_reference']:
-            return 20
-        elif filename in ['configuration', 'config']:
-            return 25
-
-        return 50
+        return _SPHINX_PRIORITY.get(filename, 50)
 
 
 class StarlightAdapter(FrameworkAdapter):
@@ -287,8 +340,7 @@ class StarlightAdapter(FrameworkAdapter):
                 try:
                     content = config_path.read_text()
                     # Look for sidebar configuration
-                    import re
-                    sidebar_match = re.search(r'sidebar:\s*\[([\s\S]*?)\]', content)
+                    sidebar_match = _SIDEBAR_RE.search(content)
                     if sidebar_match:
                         # Simplified - would need proper JS parsing
                         return {'sidebar': []}
@@ -299,30 +351,29 @@ class StarlightAdapter(FrameworkAdapter):
 
     def get_docs_paths(self, repo_path: Path) -> List[Path]:
         """Get documentation paths for Starlight."""
-        paths = []
-
         # Standard Starlight content paths
-        standard_paths = [
-            repo_path / 'src' / 'content' / 'docs',
-            repo_path / 'src' / 'content',
-            repo_path / 'content' / 'docs',
-            repo_path / 'docs'
-        ]
-
-        for path in standard_paths:
-            if path.exists() and path.is_dir():
-                paths.append(path)
+        paths = self.find_dirs(repo_path, [
+            'src/content/docs',
+            'src/content',
+            'content/docs',
+            'docs'
+        ])
 
         return paths if paths else [repo_path]
 
-    def get_page_priority(self, file_path: Path, nav_structure: Optional[Dict]) -> int:
+    def get_page_priority(
+        self,
+        file_path: Path,
+        nav_structure: Optional[Dict],
+        front_matter: Optional[Dict] = None
+    ) -> int:
         """Get page priority for Starlight pages."""
         filename = file_path.stem.lower()
 
         # Check front matter for order
         try:
-            content = file_path.read_text(encoding='utf-8')
-            front_matter = self.extract_front_matter(content)
+            if front_matter is None:
+                front_matter = self.extract_front_matter_from_path(file_path)
 
             if 'order' in front_matter:
                 return int(front_matter['order'])
@@ -334,23 +385,12 @@ class StarlightAdapter(FrameworkAdapter):
             pass
 
         # High priority pages by name
-        if filename in ['index', 'intro', 'introduction']:
-            return 0
-        elif filename in ['getting-started', 'quickstart']:
-            return 5
-        elif filename in ['installation', 'setup']:
-            return 10
-        elif filename in ['configuration', 'config']:
-            return 15
+        priority = _STARLIGHT_PRIORITY.get(filename)
+        if priority is not None:
+            return priority
 
         # Check parent directory for grouping
-        parent = file_path.parent.name.lower()
-        if parent in ['guides', 'tutorials']:
-            return 20
-        elif parent in ['api', 'reference']:
-            return 25
-
-        return 50
+        return _STARLIGHT_DIR_PRIORITY.get(file_path.parent.name.lower(), 50)
 
 
 class GenericAdapter(FrameworkAdapter):
@@ -362,34 +402,23 @@ class GenericAdapter(FrameworkAdapter):
 
     def get_docs_paths(self, repo_path: Path) -> List[Path]:
         """Look for common documentation directories."""
-        paths = []
-
-        # Common documentation directory names
-        common_dirs = [
+        # Common documentation directory names, then src directories
+        paths = self.find_dirs(repo_path, [
             'docs', 'doc', 'documentation',
             'wiki', 'guide', 'guides',
-            'manual', 'help'
-        ]
-
-        for dir_name in common_dirs:
-            path = repo_path / dir_name
-            if path.exists() and path.is_dir():
-                paths.append(path)
-
-        # Also check src directories
-        src_docs = [
-            repo_path / 'src' / 'docs',
-            repo_path / 'source' / 'docs'
-        ]
-
-        for path in src_docs:
-            if path.exists() and path.is_dir():
-                paths.append(path)
+            'manual', 'help',
+            'src/docs', 'source/docs'
+        ])
 
         # If no specific docs directory, use repo root
         return paths if paths else [repo_path]
 
-    def get_page_priority(self, file_path: Path, nav_structure: Optional[Dict]) -> int:
+    def get_page_priority(
+        self,
+        file_path: Path,
+        nav_structure: Optional[Dict],
+        front_matter: Optional[Dict] = None
+    ) -> int:
         """Basic priority based on filename patterns."""
         filename = file_path.stem.lower()
 
@@ -412,11 +441,9 @@ class GenericAdapter(FrameworkAdapter):
             return 35
 
         # Check for numbered files
-        import re
-        if re.match(r'^\d+[-_.]', filename):
+        num_match = _NUMBERED_FILE_RE.match(filename)
+        if num_match:
             # Extract number and use as priority
-            num_match = re.match(r'^(\d+)', filename)
-            if num_match:
-                return min(40 + int(num_match.group(1)), 100)
+            return min(40 + int(num_match.group(1)), 100)
 
         return 50
\ No newline at end of file
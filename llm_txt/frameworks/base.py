@@ -1,8 +1,39 @@
 """Base class for framework adapters."""
 
+import os
+import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# YAML front matter block at the very start of a file
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_FRONT_MATTER_BYTES_RE = re.compile(rb'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+# Front matter sits at the head of a file, which is read in chunks of this
+# many bytes until the closing delimiter is found
+_FRONT_MATTER_READ_SIZE = 8192
+
+
+def load_yaml(stream) -> Any:
+    """Equivalent of yaml.safe_load using the libyaml-backed loader when available."""
+    return yaml.load(stream, Loader=_YamlLoader)
+
+
+def _child_dirs(path: Path) -> Set[str]:
+    """Names of the subdirectories of path, from a single directory scan."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
 
 
 class FrameworkAdapter(ABC):
@@ -29,17 +60,50 @@ class FrameworkAdapter(ABC):
         pass
 
     @abstractmethod
-    def get_page_priority(self, file_path: Path, nav_structure: Optional[Dict]) -> int:
+    def get_page_priority(
+        self,
+        file_path: Path,
+        nav_structure: Optional[Dict],
+        front_matter: Optional[Dict] = None
+    ) -> int:
         """
         Get the priority of a page based on its position in navigation.
 
-        Lower numbers = higher priority.
+        Lower numbers = higher priority. Callers that already parsed the
+        page's front matter pass it in so the file is not read again.
 
         Returns:
             Priority score (0-100)
         """
         pass
 
+    def find_dirs(self, repo_path: Path, candidates: List[str]) -> List[Path]:
+        """
+        Return the candidate directories that exist, in candidate order.
+
+        Candidates are '/'-separated paths relative to repo_path. Each
+        parent directory is listed once instead of stat-ing every candidate,
+        and nested parents are only listed when they exist.
+        """
+        listings: Dict[str, Set[str]] = {}
+
+        def listing(rel_dir: str) -> Set[str]:
+            if rel_dir not in listings:
+                parent, _, name = rel_dir.rpartition('/')
+                if rel_dir and name not in listing(parent):
+                    listings[rel_dir] = set()
+                else:
+                    listings[rel_dir] = _child_dirs(repo_path / rel_dir if rel_dir else repo_path)
+            return listings[rel_dir]
+
+        found = []
+        for candidate in candidates:
+            parent, _, name = candidate.rpartition('/')
+            if name in listing(parent):
+                found.append(repo_path / candidate)
+
+        return found
+
     def extract_front_matter(self, content: str) -> Dict:
         """
         Extract front matter from a markdown file.
@@ -47,21 +111,34 @@ class FrameworkAdapter(ABC):
         Returns:
             Dictionary of front matter fields
         """
-        import yaml
-        import re
-
         # Match YAML front matter
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
+        match = _FRONT_MATTER_RE.match(content)
 
         if match:
             try:
-                return yaml.safe_load(match.group(1)) or {}
+                return load_yaml(match.group(1)) or {}
             except yaml.YAMLError:
                 return {}
 
         return {}
 
+    def extract_front_matter_from_path(self, file_path: Path) -> Dict:
+        """
+        Extract front matter reading only the head of the file.
+
+        Returns:
+            Dictionary of front matter fields
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(_FRONT_MATTER_READ_SIZE)
+            # Long front matter: read on until its closing delimiter
+            while head.startswith(b'---') and not _FRONT_MATTER_BYTES_RE.match(head):
+                chunk = f.read(_FRONT_MATTER_READ_SIZE)
+                if not chunk:
+                    break
+                head += chunk
+        return self.extract_front_matter(head.decode('utf-8', errors='ignore'))
+
     def get_title_from_file(self, file_path: Path) -> Optional[str]:
         """
         Extract title from a documentation file.
@@ -77,8 +154,7 @@ class FrameworkAdapter(ABC):
                 return front_matter['title']
 
             # Look for first H1
-            import re
-            h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+            h1_match = _H1_RE.search(content)
             if h1_match:
                 return h1_match.group(1).strip()
 
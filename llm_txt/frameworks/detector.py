@@ -1,12 +1,184 @@
 """Framework detection for documentation repositories."""
 
 import json
+import logging
+import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path('~/.llmxt/detect.cache.json')
+
+# package.json files at least this large are streamed rather than loaded
+_STREAM_PACKAGE_JSON_SIZE = 16 * 1024
+# Case-insensitive needles, matched against raw file bytes so no
+# lowercased copy of the file is made
+_MKDOCS_RE = re.compile(rb'mkdocs', re.IGNORECASE)
+_SPHINX_RE = re.compile(rb'sphinx', re.IGNORECASE)
+
+# Top-level files whose presence alone identifies a framework
+_DOCUSAURUS_FILES = frozenset({
+    'docusaurus.config.js', 'docusaurus.config.ts', 'docusaurus.config.mjs',
+    'sidebars.js', 'sidebars.ts', 'sidebars.json'
+})
+_MKDOCS_FILES = frozenset({'mkdocs.yml', 'mkdocs.yaml'})
+# Files checked for a framework name in their contents
+_MKDOCS_MANIFESTS = frozenset({'requirements.txt', 'pyproject.toml'})
+_ASTRO_CONFIGS = frozenset({'astro.config.mjs', 'astro.config.ts', 'astro.config.js'})
+_SPHINX_CONFIG_PATHS = (
+    ('docs', 'conf.py'),
+    ('docs', 'source', 'conf.py'),
+    ('source', 'conf.py'),
+    ('doc', 'conf.py')
+)
+# Every top-level file a framework check looks at; a detection result
+# stays valid while none of these is added, removed or modified
+_SIGNATURE_FILES = (
+    _DOCUSAURUS_FILES | _MKDOCS_FILES | _MKDOCS_MANIFESTS | _ASTRO_CONFIGS
+    | {'package.json', 'Makefile'}
+)
+
+
+class _RepoFiles:
+    """Directory listings and file contents of a repository, each read at most once.
+
+    The framework checks probe many of the same files (package.json,
+    requirements.txt, ...); sharing one instance across them turns
+    repeated stat calls and reads into dictionary lookups.
+    """
+
+    def __init__(self, repo_path: Path) -> None:
+        # Paths are joined as plain strings; no Path objects per probe
+        self.root = os.fspath(repo_path)
+        self._listings: Dict[Tuple[str, ...], Dict[str, os.DirEntry]] = {}
+        self.entries = self.listing()
+        self._contents: Dict[str, Optional[bytes]] = {}
+        self._package_deps: Optional[Set[str]] = None
+
+    def listing(self, *parts: str) -> Dict[str, os.DirEntry]:
+        """Entries of the repository root or a directory below it, by name.
+
+        Each directory is scanned at most once, and only if its parent
+        listing shows it exists.
+        """
+        if parts not in self._listings:
+            entries: Dict[str, os.DirEntry] = {}
+            if parts:
+                parent = self.listing(*parts[:-1]).get(parts[-1])
+                exists = parent is not None and parent.is_dir()
+            else:
+                exists = True
+            if exists:
+                try:
+                    with os.scandir(os.path.join(self.root, *parts)) as it:
+                        entries = {entry.name: entry for entry in it}
+                except OSError:
+                    pass
+            self._listings[parts] = entries
+        return self._listings[parts]
+
+    def has_file(self, *parts: str) -> bool:
+        """Whether a file exists at the given path below the repository root."""
+        entry = self.listing(*parts[:-1]).get(parts[-1])
+        return entry is not None and entry.is_file()
+
+    def signature(self) -> List[List[Any]]:
+        """Path, mtime and size of each file detection depends on."""
+        paths = [(name,) for name in self.entries.keys() & _SIGNATURE_FILES]
+        paths.extend(parts for parts in _SPHINX_CONFIG_PATHS if self.has_file(*parts))
+        signature = []
+        for parts in sorted(paths):
+            try:
+                stat = self.listing(*parts[:-1])[parts[-1]].stat()
+            except OSError:
+                continue
+            signature.append(['/'.join(parts), stat.st_mtime_ns, stat.st_size])
+        return signature
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        """Contents of a top-level file, or None if missing or unreadable."""
+        if name not in self._contents:
+            data = None
+            if name in self.entries:
+                try:
+                    with open(os.path.join(self.root, name), 'rb') as f:
+                        data = f.read()
+                except Exception:
+                    pass
+            self._contents[name] = data
+        return self._contents[name]
+
+    def package_dependencies(self) -> Set[str]:
+        """Package names from package.json dependencies and devDependencies."""
+        if self._package_deps is None:
+            if ijson is not None and self._is_large('package.json'):
+                self._package_deps = self._stream_package_dependencies()
+            else:
+                deps: Set[str] = set()
+                content = self.read_bytes('package.json')
+                if content is not None:
+                    try:
+                        data = _json_loads(content)
+                        deps.update(data.get('dependencies', {}))
+                        deps.update(data.get('devDependencies', {}))
+                    except (ValueError, AttributeError, TypeError):
+                        pass
+                self._package_deps = deps
+        return self._package_deps
+
+    def _is_large(self, name: str) -> bool:
+        entry = self.entries.get(name)
+        try:
+            return entry is not None and entry.stat().st_size >= _STREAM_PACKAGE_JSON_SIZE
+        except OSError:
+            return False
+
+    def _stream_package_dependencies(self) -> Set[str]:
+        """Collect dependency names from a large package.json without loading it.
+
+        Only the keys of the two dependency maps are kept; the rest of the
+        document (scripts, workspaces, ...) is parsed and dropped.
+        """
+        deps: Set[str] = set()
+        try:
+            with open(os.path.join(self.root, 'package.json'), 'rb') as f:
+                for prefix, event, value in ijson.parse(f):
+                    if event == 'map_key' and prefix in ('dependencies', 'devDependencies'):
+                        deps.add(value)
+        except (OSError, ijson.JSONError):
+            # Same as the non-streaming path: a broken manifest has no dependencies
+            return set()
+        return deps
 
 
 class FrameworkDetector:
-    """Detect documentation framework used in a repository."""
+    """Detect documentation framework used in a repository.
+
+    Results are remembered in a JSON file (DEFAULT_CACHE_PATH unless
+    cache_path says otherwise; None disables it) keyed by the resolved
+    repository path. A result is reused while the files detection looks
+    at keep their mtimes and sizes; the least recently used entries are
+    dropped beyond MAX_CACHE_ENTRIES.
+    """
+
+    MAX_CACHE_ENTRIES = 256
+
+    def __init__(self, cache_path: Optional[Path] = DEFAULT_CACHE_PATH) -> None:
+        self.cache_path = Path(cache_path).expanduser() if cache_path is not None else None
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache()
 
     def detect(self, repo_path: Path) -> Optional[str]:
         """
@@ -15,153 +187,123 @@ class FrameworkDetector:
         Returns:
             Framework name ('docusaurus', 'mkdocs', 'sphinx', 'starlight') or None
         """
+        files = _RepoFiles(repo_path)
+        if self.cache_path is None:
+            return self._detect(files)
+
+        key = os.path.realpath(files.root)
+        signature = files.signature()
+        cached = self._cache.get(key)
+        if cached is not None and cached.get('signature') == signature:
+            framework = cached.get('framework')
+            # Move the entry to the most recently used end
+            if next(reversed(self._cache)) != key:
+                self._cache[key] = self._cache.pop(key)
+                self._save_cache()
+            return framework
+
+        framework = self._detect(files)
+        self._cache.pop(key, None)
+        self._cache[key] = {'signature': signature, 'framework': framework}
+        while len(self._cache) > self.MAX_CACHE_ENTRIES:
+            del self._cache[next(iter(self._cache))]
+        self._save_cache()
+        return framework
+
+    def _detect(self, files: _RepoFiles) -> Optional[str]:
         # Check for Docusaurus
-        if self._is_docusaurus(repo_path):
+        if self._is_docusaurus(files):
             return 'docusaurus'
 
         # Check for MkDocs
-        if self._is_mkdocs(repo_path):
+        if self._is_mkdocs(files):
             return 'mkdocs'
 
         # Check for Sphinx
-        if self._is_sphinx(repo_path):
+        if self._is_sphinx(files):
             return 'sphinx'
 
         # Check for Astro Starlight
-        if self._is_starlight(repo_path):
+        if self._is_starlight(files):
             return 'starlight'
 
         return None
 
-    def _is_docusaurus(self, repo_path: Path) -> bool:
-        """Check if the repository uses Docusaurus."""
-        # Check for docusaurus.config.js/ts
-        config_files = [
-            'docusaurus.config.js',
-            'docusaurus.config.ts',
-            'docusaurus.config.mjs'
-        ]
-
-        for config_file in config_files:
-            if (repo_path / config_file).exists():
-                return True
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Read the detection cache, oldest entries first."""
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cache = _json_loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable detection cache {self.cache_path}: {e}")
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {key: entry for key, entry in cache.items() if isinstance(entry, dict)}
 
-        # Check for sidebars.js/ts
-        sidebar_files = ['sidebars.js', 'sidebars.ts', 'sidebars.json']
-        for sidebar_file in sidebar_files:
-            if (repo_path / sidebar_file).exists():
-                return True
+    def _save_cache(self) -> None:
+        """Write the detection cache atomically."""
+        tmp_path = f"{self.cache_path}.tmp"
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write detection cache {self.cache_path}: {e}")
 
-        # Check package.json for @docusaurus/core
-        package_json = repo_path / 'package.json'
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    deps = data.get('dependencies', {})
-                    dev_deps = data.get('devDependencies', {})
-
-                    if '@docusaurus/core' in deps or '@docusaurus/core' in dev_deps:
-                        return True
-            except (json.JSONDecodeError, KeyError):
-                pass
+    def _is_docusaurus(self, files: _RepoFiles) -> bool:
+        """Check if the repository uses Docusaurus."""
+        # Check for docusaurus.config.* or sidebars.*
+        if files.entries.keys() & _DOCUSAURUS_FILES:
+            return True
 
-        return False
+        # Check package.json for @docusaurus/core
+        return '@docusaurus/core' in files.package_dependencies()
 
-    def _is_mkdocs(self, repo_path: Path) -> bool:
+    def _is_mkdocs(self, files: _RepoFiles) -> bool:
         """Check if the repository uses MkDocs."""
         # Check for mkdocs.yml
-        config_files = ['mkdocs.yml', 'mkdocs.yaml']
+        if files.entries.keys() & _MKDOCS_FILES:
+            return True
 
-        for config_file in config_files:
-            if (repo_path / config_file).exists():
+        # Check requirements.txt and pyproject.toml for mkdocs
+        for manifest in files.entries.keys() & _MKDOCS_MANIFESTS:
+            content = files.read_bytes(manifest)
+            if content is not None and _MKDOCS_RE.search(content) is not None:
                 return True
 
-        # Check for requirements.txt with mkdocs
-        requirements = repo_path / 'requirements.txt'
-        if requirements.exists():
-            try:
-                content = requirements.read_text()
-                if 'mkdocs' in content.lower():
-                    return True
-            except Exception:
-                pass
-
-        # Check pyproject.toml
-        pyproject = repo_path / 'pyproject.toml'
-        if pyproject.exists():
-            try:
-                content = pyproject.read_text()
-                if 'mkdocs' in content.lower():
-                    return True
-            except Exception:
-                pass
-
         return False
 
-    def _is_sphinx(self, repo_path: Path) -> bool:
+    def _is_sphinx(self, files: _RepoFiles) -> bool:
         """Check if the repository uses Sphinx."""
         # Check for conf.py in docs/source or docs/
-        config_paths = [
-            repo_path / 'docs' / 'conf.py',
-            repo_path / 'docs' / 'source' / 'conf.py',
-            repo_path / 'source' / 'conf.py',
-            repo_path / 'doc' / 'conf.py'
-        ]
-
-        for config_path in config_paths:
-            if config_path.exists():
+        for config_path in _SPHINX_CONFIG_PATHS:
+            if files.has_file(*config_path):
                 # Verify it's actually Sphinx conf.py
                 try:
-                    content = config_path.read_text()
-                    if 'sphinx' in content.lower() or 'extensions' in content:
+                    with open(os.path.join(files.root, *config_path), 'rb') as f:
+                        content = f.read()
+                    if _SPHINX_RE.search(content) is not None or b'extensions' in content:
                         return True
                 except Exception:
                     pass
 
         # Check for Makefile with sphinx-build
-        makefile = repo_path / 'Makefile'
-        if makefile.exists():
-            try:
-                content = makefile.read_text()
-                if 'sphinx-build' in content:
-                    return True
-            except Exception:
-                pass
+        content = files.read_bytes('Makefile')
+        return content is not None and b'sphinx-build' in content
 
-        return False
-
-    def _is_starlight(self, repo_path: Path) -> bool:
+    def _is_starlight(self, files: _RepoFiles) -> bool:
         """Check if the repository uses Astro Starlight."""
         # Check for astro.config.mjs/ts with starlight
-        config_files = [
-            'astro.config.mjs',
-            'astro.config.ts',
-            'astro.config.js'
-        ]
-
-        for config_file in config_files:
-            config_path = repo_path / config_file
-            if config_path.exists():
-                try:
-                    content = config_path.read_text()
-                    if '@astrojs/starlight' in content:
-                        return True
-                except Exception:
-                    pass
+        for config_file in files.entries.keys() & _ASTRO_CONFIGS:
+            content = files.read_bytes(config_file)
+            if content is not None and b'@astrojs/starlight' in content:
+                return True
 
         # Check package.json for @astrojs/starlight
-        package_json = repo_path / 'package.json'
-        if package_json.exists():
-            try:
-                with open(package_json) as f:
-                    data = json.load(f)
-                    deps = data.get('dependencies', {})
-                    dev_deps = data.get('devDependencies', {})
-
-                    if '@astrojs/starlight' in deps or '@astrojs/starlight' in dev_deps:
-                        return True
-            except (json.JSONDecodeError, KeyError):
-                pass
-
-        return False
\ No newline at end of file
+        return '@astrojs/starlight' in files.package_dependencies()
@@ -2,18 +2,54 @@
 
 import asyncio
 import json
+import os
 import time
 from pathlib import Path
 from typing import Dict, Optional
 import aiohttp
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class GitHubAuth:
-    """Handle GitHub device flow authentication."""
+    """Handle GitHub device flow authentication.
+
+    One HTTP session (and its pooled connections to GitHub) is shared by
+    every request the instance makes. Use it as an async context manager,
+    or call aclose(), so the session is closed on the loop that created it.
+    """
 
     def __init__(self):
         self.token_path = Path.home() / '.llmxt' / 'github.token'
         self.token_path.parent.mkdir(parents=True, exist_ok=True)
+        # Token file contents, reread only when its mtime changes
+        self._token: Optional[str] = None
+        self._token_mtime: Optional[float] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> 'GitHubAuth':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """The shared session, created on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared session, if one was opened."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def device_flow_login(self, client_id: str) -> bool:
         """
@@ -57,18 +93,18 @@ class GitHubAuth:
         headers = {'Accept': 'application/json'}
         data = {'client_id': client_id}
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, data=data, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        error_text = await response.text()
-                        print(f"Failed to get device code: {error_text}")
-                        return None
-            except aiohttp.ClientError as e:
-                print(f"Network error: {e}")
-                return None
+        session = self._get_session()
+        try:
+            async with session.post(url, data=data, headers=headers) as response:
+                if response.status == 200:
+                    return await response.json(loads=_json_loads)
+                else:
+                    error_text = await response.text()
+                    print(f"Failed to get device code: {error_text}")
+                    return None
+        except aiohttp.ClientError as e:
+            print(f"Network error: {e}")
+            return None
 
     async def _poll_for_token(
         self,
@@ -80,61 +116,88 @@ class GitHubAuth:
         url = 'https://github.com/login/oauth/access_token'
         headers = {'Accept': 'application/json'}
 
-        async with aiohttp.ClientSession() as session:
-            while True:
-                data = {
-                    'client_id': client_id,
-                    'device_code': device_code,
-                    'grant_type': 'urn:ietf:params:oauth:grant-type:device_code'
-                }
-
-                try:
-                    async with session.post(url, data=data, headers=headers) as response:
-                        result = await response.json()
-
-                        if 'access_token' in result:
-                            return result['access_token']
-
-                        error = result.get('error')
-
-                        if error == 'authorization_pending':
-                            # User hasn't authorized yet, keep polling
-                            await asyncio.sleep(interval)
-                            continue
-                        elif error == 'slow_down':
-                            # Polling too fast, increase interval
-                            interval += 5
-                            await asyncio.sleep(interval)
-                            continue
-                        elif error == 'expired_token':
-                            print("Device code expired. Please try again.")
-                            return None
-                        elif error == 'access_denied':
-                            print("Access denied by user.")
-                            return None
-                        else:
-                            print(f"Error: {error}")
-                            return None
-
-                except aiohttp.ClientError as e:
-                    print(f"Network error: {e}")
-                    await asyncio.sleep(interval)
-                    continue
+        session = self._get_session()
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time()
+        while True:
+            # Polls start `interval` seconds apart, so the request's own
+            # round trip counts toward the wait. Polling any faster only
+            # earns a slow_down, which lengthens the interval for good.
+            delay = next_poll - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            next_poll = loop.time() + interval
+
+            data = {
+                'client_id': client_id,
+                'device_code': device_code,
+                'grant_type': 'urn:ietf:params:oauth:grant-type:device_code'
+            }
+
+            try:
+                async with session.post(url, data=data, headers=headers) as response:
+                    result = await response.json(loads=_json_loads)
+            except aiohttp.ClientError as e:
+                print(f"Network error: {e}")
+                continue
+
+            if 'access_token' in result:
+                return result['access_token']
+
+            error = result.get('error')
+
+            if error == 'authorization_pending':
+                # User hasn't authorized yet, keep polling
+                continue
+            elif error == 'slow_down':
+                # Polling too fast; the interval grows by 5 seconds from now on
+                interval = max(interval + 5, result.get('interval', 0))
+                next_poll = loop.time() + interval
+                continue
+            elif error == 'expired_token':
+                print("Device code expired. Please try again.")
+                return None
+            elif error == 'access_denied':
+                print("Access denied by user.")
+                return None
+            else:
+                print(f"Error: {error}")
+                return None
 
     def _save_token(self, token: str):
         """Save the token to a secure location."""
-        self.token_path.write_text(token)
-        # Set file permissions to 600 (read/write for owner only)
-        self.token_path.chmod(0o600)
+        # Created with permissions 600 (read/write for owner only) from the
+        # start, then moved into place so readers never see a partial file
+        tmp_path = f"{self.token_path}.tmp"
+        # A leftover temp file would keep its own permissions, so it is
+        # removed and the new one created exclusively
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        try:
+            os.write(fd, token.encode())
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, self.token_path)
+        self._token_mtime = None
 
     def get_token(self) -> Optional[str]:
         """Retrieve the stored token."""
-        if self.token_path.exists():
+        try:
+            mtime = os.stat(self.token_path).st_mtime
+        except OSError:
+            self._token = self._token_mtime = None
+            return None
+
+        if mtime != self._token_mtime:
             try:
-                return self.token_path.read_text().strip()
+                self._token = self.token_path.read_text().strip()
             except Exception:
                 return None
-        return None
+            self._token_mtime = mtime
+        return self._token
 
     async def get_user(self) -> Optional[Dict]:
         """Get authenticated user information."""
@@ -149,21 +212,22 @@ class GitHubAuth:
             'Authorization': f'Bearer {token}'
         }
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    elif response.status == 401:
-                        print("Invalid or expired token")
-                        return None
-                    else:
-                        return None
-            except aiohttp.ClientError:
-                return None
+        session = self._get_session()
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 200:
+                    return await response.json(loads=_json_loads)
+                elif response.status == 401:
+                    print("Invalid or expired token")
+                    return None
+                else:
+                    return None
+        except aiohttp.ClientError:
+            return None
 
     def logout(self):
         """Remove stored token."""
         if self.token_path.exists():
             self.token_path.unlink()
+            self._token = self._token_mtime = None
             print("Logged out successfully")
\ No newline at end of file
@@ -1,14 +1,63 @@
 """GitHub PR creation and management."""
 
-import base64
+import asyncio
+import hashlib
 import json
+import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import aiohttp
 
 from .auth import GitHubAuth
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+# Blob uploads in flight at once when committing files
+_BLOB_UPLOADS_IN_FLIGHT = 8
+# Files up to this size are sent inline in the tree request instead of
+# being uploaded as separate blobs first
+_INLINE_CONTENT_LIMIT = 1024 * 1024
+# How long a repository's default branch is remembered on disk
+_DEFAULT_BRANCH_TTL = 24 * 60 * 60
+
+_PR_BODY_TEMPLATE = """## Summary
+
+This PR adds/updates the `llm.txt` file to provide AI-friendly documentation summaries.
+
+## Files Modified
+
+{file_list}
+
+## What is llm.txt?
+
+`llm.txt` is a standardized format for making documentation more accessible to AI language models. It provides a concise, structured summary of your project's documentation that:
+
+- Improves AI understanding of your project
+- Enhances code generation accuracy
+- Provides better context for AI-assisted development
+
+## Test Plan
+
+- [ ] Verify `llm.txt` is properly formatted
+- [ ] Check file size is within limits (<100KB)
+- [ ] Confirm no sensitive information is exposed
+- [ ] Validate links are working
+
+---
+Generated with [llmxt CLI](https://github.com/yourusername/llm-txt)
+"""
+
 
 class GitHubPR:
     """Manage GitHub pull requests for llm.txt updates."""
@@ -18,6 +67,8 @@ class GitHubPR:
         self.repo = repo
         self.auth = GitHubAuth()
         self.api_base = 'https://api.github.com'
+        self.repos_cache_path = Path.home() / '.llmxt' / 'repos.json'
+        self._default_branch: Optional[str] = None
 
     async def create_or_update_pr(
         self,
@@ -43,36 +94,12 @@ class GitHubPR:
 
         async with aiohttp.ClientSession(headers=headers) as session:
             try:
-                # Get default branch
-                default_branch = await self._get_default_branch(session)
-                if not default_branch:
-                    print("Failed to get default branch")
-                    return None
-
-                # Create or update branch
-                branch_name = 'llm-txt/update'
-                branch_created = await self._create_or_update_branch(
-                    session,
-                    branch_name,
-                    default_branch
-                )
-
-                if not branch_created:
-                    print("Failed to create/update branch")
-                    return None
-
-                # Get current user
-                user = await self._get_current_user(session)
-                if not user:
-                    print("Failed to get user information")
-                    return None
-
                 # Prepare files to commit
                 files_to_commit = []
 
                 # Add llm.txt
                 if llm_path.exists():
-                    content = llm_path.read_text(encoding='utf-8')
+                    content = llm_path.read_bytes()
                     files_to_commit.append({
                         'path': 'public/llm.txt',
                         'content': content
@@ -80,7 +107,7 @@ class GitHubPR:
 
                 # Add llms-full.txt if exists
                 if full_path and full_path.exists():
-                    content = full_path.read_text(encoding='utf-8')
+                    content = full_path.read_bytes()
                     files_to_commit.append({
                         'path': 'public/llms-full.txt',
                         'content': content
@@ -88,13 +115,54 @@ class GitHubPR:
 
                 # Add reports if directory exists
                 if reports_dir and reports_dir.exists():
-                    for report_file in reports_dir.glob('*.json'):
-                        content = report_file.read_text(encoding='utf-8')
+                    # Read the reports in worker threads, off the event loop
+                    report_files = sorted(reports_dir.glob('*.json'))
+                    contents = await asyncio.gather(
+                        *[asyncio.to_thread(report_file.read_bytes) for report_file in report_files]
+                    )
+                    for report_file, content in zip(report_files, contents):
                         files_to_commit.append({
                             'path': f'reports/{report_file.name}',
                             'content': content
                         })
 
+                # Independent lookups: default branch, current user, an open
+                # PR for the update branch and whether that branch already
+                # holds exactly these files. The last one must run before the
+                # branch is reset to the default branch below; it is the only
+                # comparison against the existing PR branch.
+                branch_name = 'llm-txt/update'
+                default_branch, user, existing_pr, up_to_date = await asyncio.gather(
+                    self._get_default_branch(session),
+                    self._get_current_user(session),
+                    self._find_existing_pr(session, branch_name),
+                    self._branch_has_files(session, branch_name, files_to_commit)
+                )
+                if not default_branch:
+                    print("Failed to get default branch")
+                    return None
+                if not user:
+                    print("Failed to get user information")
+                    return None
+
+                if existing_pr and up_to_date:
+                    # Re-running with identical output: leave the branch alone
+                    print("No changes to commit; pull request is already up to date")
+                    await self._update_pr(session, existing_pr['number'], files_to_commit)
+                    return existing_pr['html_url']
+
+                # Create or update branch; an existing branch is force-reset
+                # to the default branch tip, which the new commit builds on
+                branch_created = await self._create_or_update_branch(
+                    session,
+                    branch_name,
+                    default_branch
+                )
+
+                if not branch_created:
+                    print("Failed to create/update branch")
+                    return None
+
                 # Commit files
                 commit_sha = await self._commit_files(
                     session,
@@ -107,9 +175,6 @@ class GitHubPR:
                     print("Failed to commit files")
                     return None
 
-                # Check for existing PR
-                existing_pr = await self._find_existing_pr(session, branch_name)
-
                 if existing_pr:
                     pr_number = existing_pr['number']
                     pr_url = existing_pr['html_url']
@@ -132,22 +197,64 @@ class GitHubPR:
                 return None
 
     async def _get_default_branch(self, session: aiohttp.ClientSession) -> Optional[str]:
-        """Get the default branch of the repository."""
+        """Get the default branch of the repository.
+
+        The answer is kept for the lifetime of this instance and on disk
+        for _DEFAULT_BRANCH_TTL, since it almost never changes.
+        """
+        if self._default_branch:
+            return self._default_branch
+
+        repos = self._load_repos_cache()
+        cached = repos.get(f'{self.owner}/{self.repo}')
+        if (
+            isinstance(cached, dict)
+            and cached.get('default_branch')
+            and time.time() - cached.get('fetched_at', 0) < _DEFAULT_BRANCH_TTL
+        ):
+            self._default_branch = cached['default_branch']
+            return self._default_branch
+
         url = f'{self.api_base}/repos/{self.owner}/{self.repo}'
 
         async with session.get(url) as response:
             if response.status == 200:
-                data = await response.json()
-                return data.get('default_branch', 'main')
+                data = await response.json(loads=_json_loads)
+                self._default_branch = data.get('default_branch', 'main')
+                repos[f'{self.owner}/{self.repo}'] = {
+                    'default_branch': self._default_branch,
+                    'fetched_at': time.time()
+                }
+                self._save_repos_cache(repos)
+                return self._default_branch
             return None
 
+    def _load_repos_cache(self) -> Dict:
+        """Read the per-repository cache, or an empty one if unavailable."""
+        try:
+            repos = _json_loads(self.repos_cache_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return repos if isinstance(repos, dict) else {}
+
+    def _save_repos_cache(self, repos: Dict) -> None:
+        """Write the per-repository cache atomically; failures are ignored."""
+        tmp_path = f"{self.repos_cache_path}.tmp"
+        try:
+            self.repos_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(repos, f)
+            os.replace(tmp_path, self.repos_cache_path)
+        except OSError:
+            pass
+
     async def _get_current_user(self, session: aiohttp.ClientSession) -> Optional[Dict]:
         """Get current authenticated user."""
         url = f'{self.api_base}/user'
 
         async with session.get(url) as response:
             if response.status == 200:
-                return await response.json()
+                return await response.json(loads=_json_loads)
             return None
 
     async def _create_or_update_branch(
@@ -163,7 +270,7 @@ class GitHubPR:
         async with session.get(url) as response:
             if response.status != 200:
                 return False
-            data = await response.json()
+            data = await response.json(loads=_json_loads)
             base_sha = data['object']['sha']
 
         # Try to create branch
@@ -194,49 +301,75 @@ class GitHubPR:
         commit_message: str
     ) -> Optional[str]:
         """Commit files to a branch."""
-        # Get current tree
-        url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/refs/heads/{branch_name}'
-
-        async with session.get(url) as response:
-            if response.status != 200:
-                return None
-            data = await response.json()
-            current_sha = data['object']['sha']
-
-        # Get current commit
-        url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/commits/{current_sha}'
-
-        async with session.get(url) as response:
-            if response.status != 200:
-                return None
-            data = await response.json()
-            tree_sha = data['tree']['sha']
-
-        # Create blobs for each file
+        head = await self._get_branch_head(session, branch_name)
+        if not head:
+            return None
+        current_sha, tree_sha = head
+
+        # The branch was just reset to the base branch, so this deliberately
+        # compares against the base tree: the new commit is parented on the
+        # base tip and only needs the files that differ from it. Whether the
+        # existing PR branch already matched is decided before the reset, by
+        # _branch_has_files in create_or_update_pr.
+        # Files whose content is already in the tree keep their blob;
+        # small text files go inline in the tree request, which creates
+        # their blobs implicitly; the rest are uploaded as blobs concurrently
+        existing_shas = await self._get_tree_blob_shas(session, tree_sha)
         tree_items = []
+        unchanged = 0
+        blob_files = []
         for file_info in files:
-            # Create blob
-            url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/blobs'
-            blob_data = {
-                'content': base64.b64encode(file_info['content'].encode()).decode(),
-                'encoding': 'base64'
-            }
-
-            async with session.post(url, json=blob_data) as response:
-                if response.status != 201:
-                    continue
-                blob_response = await response.json()
-                blob_sha = blob_response['sha']
-
+            content = file_info['content']
+            blob_sha = _git_blob_sha(content)
+            if existing_shas.get(file_info['path']) == blob_sha:
+                unchanged += 1
                 tree_items.append({
                     'path': file_info['path'],
                     'mode': '100644',
                     'type': 'blob',
                     'sha': blob_sha
                 })
+                continue
+
+            text = None
+            if len(content) <= _INLINE_CONTENT_LIMIT:
+                try:
+                    text = content.decode('utf-8')
+                except UnicodeDecodeError:
+                    # Inline content must be text; binary goes up as a blob
+                    pass
+            if text is None:
+                blob_files.append(file_info)
+                continue
+            tree_items.append({
+                'path': file_info['path'],
+                'mode': '100644',
+                'type': 'blob',
+                'content': text
+            })
+
+        upload_slots = asyncio.Semaphore(_BLOB_UPLOADS_IN_FLIGHT)
+        results = await asyncio.gather(
+            *[self._create_blob(session, file_info, upload_slots) for file_info in blob_files],
+            return_exceptions=True
+        )
+        upload_failed = False
+        for file_info, result in zip(blob_files, results):
+            if isinstance(result, Exception) or not result:
+                print(f"Failed to upload {file_info['path']}: {result or 'unexpected response'}")
+                upload_failed = True
+            else:
+                tree_items.append(result)
+
+        # A partial commit would silently drop files; fail the whole commit
+        if upload_failed:
+            return None
 
         if not tree_items:
             return None
+        if unchanged == len(tree_items):
+            # Every file is already on the branch; an empty commit adds nothing
+            return current_sha
 
         # Create tree
         url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/trees'
@@ -248,7 +381,7 @@ class GitHubPR:
         async with session.post(url, json=tree_data) as response:
             if response.status != 201:
                 return None
-            tree_response = await response.json()
+            tree_response = await response.json(loads=_json_loads)
             new_tree_sha = tree_response['sha']
 
         # Create commit
@@ -262,7 +395,7 @@ class GitHubPR:
         async with session.post(url, json=commit_data) as response:
             if response.status != 201:
                 return None
-            commit_response = await response.json()
+            commit_response = await response.json(loads=_json_loads)
             new_commit_sha = commit_response['sha']
 
         # Update branch reference
@@ -275,6 +408,94 @@ class GitHubPR:
 
         return None
 
+    async def _get_branch_head(
+        self,
+        session: aiohttp.ClientSession,
+        branch_name: str
+    ) -> Optional[Tuple[str, str]]:
+        """Commit and tree SHA at the tip of a branch, or None if it is missing."""
+        # Get current commit
+        url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/refs/heads/{branch_name}'
+
+        async with session.get(url) as response:
+            if response.status != 200:
+                return None
+            data = await response.json(loads=_json_loads)
+            commit_sha = data['object']['sha']
+
+        # Get its tree
+        url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/commits/{commit_sha}'
+
+        async with session.get(url) as response:
+            if response.status != 200:
+                return None
+            data = await response.json(loads=_json_loads)
+            return commit_sha, data['tree']['sha']
+
+    async def _branch_has_files(
+        self,
+        session: aiohttp.ClientSession,
+        branch_name: str,
+        files: List[Dict]
+    ) -> bool:
+        """Whether the branch tip already holds every file with this exact content."""
+        if not files:
+            return False
+        head = await self._get_branch_head(session, branch_name)
+        if not head:
+            return False
+        existing_shas = await self._get_tree_blob_shas(session, head[1])
+        return all(
+            existing_shas.get(file_info['path']) == _git_blob_sha(file_info['content'])
+            for file_info in files
+        )
+
+    async def _get_tree_blob_shas(
+        self,
+        session: aiohttp.ClientSession,
+        tree_sha: str
+    ) -> Dict[str, str]:
+        """Map each blob path in a tree (recursively) to its SHA."""
+        url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/trees/{tree_sha}'
+
+        async with session.get(url, params={'recursive': '1'}) as response:
+            if response.status != 200:
+                return {}
+            data = await response.json(loads=_json_loads)
+
+        # A truncated listing just means fewer files are recognised as unchanged
+        return {
+            item['path']: item['sha']
+            for item in data.get('tree', [])
+            if item.get('type') == 'blob'
+        }
+
+    async def _create_blob(
+        self,
+        session: aiohttp.ClientSession,
+        file_info: Dict,
+        upload_slots: asyncio.Semaphore
+    ) -> Optional[Dict]:
+        """Upload one file as a blob and return its tree entry."""
+        url = f'{self.api_base}/repos/{self.owner}/{self.repo}/git/blobs'
+        blob_data = {
+            'content': b64encode(file_info['content']).decode('ascii'),
+            'encoding': 'base64'
+        }
+
+        async with upload_slots:
+            async with session.post(url, json=blob_data) as response:
+                if response.status != 201:
+                    return None
+                blob_response = await response.json(loads=_json_loads)
+
+        return {
+            'path': file_info['path'],
+            'mode': '100644',
+            'type': 'blob',
+            'sha': blob_response['sha']
+        }
+
     async def _find_existing_pr(
         self,
         session: aiohttp.ClientSession,
@@ -289,7 +510,7 @@ class GitHubPR:
 
         async with session.get(url, params=params) as response:
             if response.status == 200:
-                prs = await response.json()
+                prs = await response.json(loads=_json_loads)
                 if prs:
                     return prs[0]
         return None
@@ -316,7 +537,7 @@ class GitHubPR:
 
         async with session.post(url, json=data) as response:
             if response.status == 201:
-                pr_data = await response.json()
+                pr_data = await response.json(loads=_json_loads)
                 return pr_data['html_url']
         return None
 
@@ -337,32 +558,13 @@ class GitHubPR:
 
     def _generate_pr_body(self, files: List[Dict]) -> str:
         """Generate PR description body."""
-        file_list = '\n'.join([f"- `{f['path']}`" for f in files])
+        file_entry = '- `{}`'.format
+        file_list = '\n'.join([file_entry(f['path']) for f in files])
+        return _PR_BODY_TEMPLATE.format(file_list=file_list)
 
-        body = f"""## Summary
 
-This PR adds/updates the `llm.txt` file to provide AI-friendly documentation summaries.
-
-## Files Modified
-
-{file_list}
-
-## What is llm.txt?
-
-`llm.txt` is a standardized format for making documentation more accessible to AI language models. It provides a concise, structured summary of your project's documentation that:
-
-- Improves AI understanding of your project
-- Enhances code generation accuracy
-- Provides better context for AI-assisted development
-
-## Test Plan
-
-- [ ] Verify `llm.txt` is properly formatted
-- [ ] Check file size is within limits (<100KB)
-- [ ] Confirm no sensitive information is exposed
-- [ ] Validate links are working
-
----
-Generated with [llmxt CLI](https://github.com/yourusername/llm-txt)
-"""
-        return body
\ No newline at end of file
+def _git_blob_sha(content: bytes) -> str:
+    """SHA git assigns to a blob with the given content."""
+    digest = hashlib.sha1(b'blob %d\0' % len(content))
+    digest.update(content)
+    return digest.hexdigest()
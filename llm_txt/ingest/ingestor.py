@@ -1,11 +1,52 @@
 """Repository file ingestion and processing."""
 
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from fnmatch import fnmatch
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
+from fnmatch import translate
 
-from ..frameworks.base import FrameworkAdapter
+from ..frameworks.base import FrameworkAdapter, load_yaml
+
+# Supported documentation file extensions
+_DOC_EXTENSIONS = ('.md', '.mdx', '.rst')
+
+_FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_H1_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_H2_RE = re.compile(r'^##\s+(.+)$', re.MULTILINE)
+_NUM_PREFIX_RE = re.compile(r'^(\d+)[-_.]')
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+_HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+_CODE_FENCE_RE = re.compile(r'```(\w+)?\n')
+
+
+def _compile_globs(patterns: List[str]) -> Optional[Pattern[str]]:
+    """Combine fnmatch-style globs into one regex, or None if there are none."""
+    if not patterns:
+        return None
+    return re.compile('|'.join(translate(os.path.normcase(pattern)) for pattern in patterns))
+
+
+def _scan_doc_files(path: str) -> Iterator[str]:
+    """Yield documentation files below path in a single directory walk.
+
+    Directory entries carry their type, so telling files from directories
+    needs no extra stat calls. Symlinked directories are not followed.
+    """
+    try:
+        with os.scandir(path) as entries:
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(_DOC_EXTENSIONS) and entry.is_file():
+                    yield entry.path
+    except OSError:
+        # Missing or unreadable directory
+        return
+
+    for subdir in subdirs:
+        yield from _scan_doc_files(subdir)
 
 
 class Page:
@@ -61,6 +102,9 @@ class RepoIngestor:
         self.include_patterns = include_patterns
         self.exclude_patterns = exclude_patterns
         self.framework_adapter = framework_adapter
+        # Each pattern list is matched with a single regex per path
+        self._include_re = _compile_globs(include_patterns)
+        self._exclude_re = _compile_globs(exclude_patterns)
 
     def ingest(self, repo_path: Path) -> List[Page]:
         """
@@ -102,18 +146,7 @@ class RepoIngestor:
 
     def _find_files(self, path: Path) -> List[Path]:
         """Recursively find all documentation files."""
-        files = []
-
-        if not path.exists():
-            return files
-
-        # Supported extensions
-        extensions = ['.md', '.mdx', '.rst']
-
-        for ext in extensions:
-            files.extend(path.rglob(f'*{ext}'))
-
-        return files
+        return [Path(file_path) for file_path in _scan_doc_files(os.fspath(path))]
 
     def _should_include(self, file_path: Path, repo_path: Path) -> bool:
         """Check if a file should be included based on patterns."""
@@ -124,20 +157,16 @@ class RepoIngestor:
             # File is outside repo, include by default
             rel_path = file_path
 
-        rel_str = str(rel_path)
+        rel_str = os.path.normcase(str(rel_path))
+        # Also tried with a '**/' prefix so '**/...' patterns match top-level files
+        candidates = (rel_str, f'**/{rel_str}')
 
         # Check exclude patterns first
-        for pattern in self.exclude_patterns:
-            if fnmatch(rel_str, pattern) or fnmatch(f'**/{rel_str}', pattern):
-                return False
-
-        # Check include patterns
-        for pattern in self.include_patterns:
-            if fnmatch(rel_str, pattern) or fnmatch(f'**/{rel_str}', pattern):
-                return True
+        if self._exclude_re and any(self._exclude_re.match(c) for c in candidates):
+            return False
 
-        # Default to exclude if no include pattern matches
-        return False
+        # Check include patterns; default to exclude if none matches
+        return bool(self._include_re) and any(self._include_re.match(c) for c in candidates)
 
     def _process_file(
         self,
@@ -164,7 +193,9 @@ class RepoIngestor:
 
             # Get priority
             if self.framework_adapter:
-                priority = self.framework_adapter.get_page_priority(file_path, nav_structure)
+                priority = self.framework_adapter.get_page_priority(
+                    file_path, nav_structure, front_matter=metadata
+                )
             else:
                 priority = self._calculate_priority(file_path, metadata)
 
@@ -191,12 +222,11 @@ class RepoIngestor:
         import yaml
 
         # Match YAML front matter
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
+        match = _FRONT_MATTER_RE.match(content)
 
         if match:
             try:
-                metadata = yaml.safe_load(match.group(1)) or {}
+                metadata = load_yaml(match.group(1)) or {}
                 clean_content = content[match.end():]
                 return metadata, clean_content
             except yaml.YAMLError:
@@ -207,12 +237,12 @@ class RepoIngestor:
     def _extract_title(self, content: str, file_path: Path) -> Optional[str]:
         """Extract title from content."""
         # Look for first H1
-        h1_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+        h1_match = _H1_RE.search(content)
         if h1_match:
             return h1_match.group(1).strip()
 
         # Look for first H2 if no H1
-        h2_match = re.search(r'^##\s+(.+)$', content, re.MULTILINE)
+        h2_match = _H2_RE.search(content)
         if h2_match:
             return h2_match.group(1).strip()
 
@@ -268,7 +298,7 @@ class RepoIngestor:
                 return priority
 
         # Check for numbered files
-        num_match = re.match(r'^(\d+)[-_.]', filename)
+        num_match = _NUM_PREFIX_RE.match(filename)
         if num_match:
             return 50 + int(num_match.group(1))
 
@@ -277,13 +307,13 @@ class RepoIngestor:
     def _clean_content(self, content: str) -> str:
         """Clean and normalize content."""
         # Remove excessive blank lines
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = _BLANK_RUN_RE.sub('\n\n', content)
 
         # Remove HTML comments
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
+        content = _HTML_COMMENT_RE.sub('', content)
 
         # Normalize code blocks
-        content = re.sub(r'```(\w+)?\n', r'```\1\n', content)
+        content = _CODE_FENCE_RE.sub(r'```\1\n', content)
 
         # Remove trailing whitespace
         lines = content.split('\n')
@@ -3,9 +3,49 @@
 import asyncio
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Pattern, Tuple
 import aiohttp
 
+# Default secret patterns, used when no redact patterns are configured
+_DEFAULT_SECRET_PATTERNS = [
+    r'(api[_-]?key|apikey)["\']?\s*[:=]\s*["\']?[A-Za-z0-9+/=]{20,}',
+    r'(secret|token|password)["\']?\s*[:=]\s*["\']?[A-Za-z0-9+/=]{20,}',
+    r'Bearer\s+[A-Za-z0-9+/=]{20,}',
+    r'(aws_access_key_id|aws_secret_access_key)\s*=\s*[A-Za-z0-9+/=]{20,}',
+    r'-----BEGIN (RSA |EC )?PRIVATE KEY-----'
+]
+# Recommended sections, matched against the lowercased content
+_REQUIRED_SECTION_PATTERNS = [
+    'quickstart|getting.?started|introduction',
+    'installation|setup',
+    'configuration|config|options',
+    'api|reference|commands',
+    'error|troubleshoot|debug'
+]
+_REQUIRED_SECTION_RES = [
+    (pattern.split('|')[0], re.compile(pattern)) for pattern in _REQUIRED_SECTION_PATTERNS
+]
+
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE)
+_HEADING_START_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_MD_LINK_RE = re.compile(r'\[.*?\]\((https?://[^)]+)\)')
+_PLAIN_URL_RE = re.compile(r'(?<!\])\bhttps?://[^\s<>"\[\]]+')
+
+
+def _compile_secret_patterns(patterns: List[str]) -> List[Tuple[str, Pattern[str]]]:
+    """Compile secret patterns case-insensitively, skipping invalid ones."""
+    compiled = []
+    for pattern in patterns:
+        try:
+            compiled.append((pattern, re.compile(pattern, re.IGNORECASE)))
+        except re.error:
+            pass
+    return compiled
+
+
+_DEFAULT_SECRET_RES = _compile_secret_patterns(_DEFAULT_SECRET_PATTERNS)
+
 
 class LLMTxtLinter:
     """Validate llm.txt files against rules and requirements."""
@@ -19,6 +59,10 @@ class LLMTxtLinter:
         self.max_kb = max_kb
         self.blocked_paths = blocked_paths or []
         self.redact_patterns = redact_patterns or []
+        self._secret_res = (
+            _compile_secret_patterns(self.redact_patterns)
+            if self.redact_patterns else _DEFAULT_SECRET_RES
+        )
 
     async def lint(self, file_path: Path) -> Dict:
         """
@@ -107,23 +151,9 @@ class LLMTxtLinter:
         """Check for potential secrets in content."""
         found_secrets = []
 
-        # Default secret patterns if none provided
-        default_patterns = [
-            r'(api[_-]?key|apikey)["\']?\s*[:=]\s*["\']?[A-Za-z0-9+/=]{20,}',
-            r'(secret|token|password)["\']?\s*[:=]\s*["\']?[A-Za-z0-9+/=]{20,}',
-            r'Bearer\s+[A-Za-z0-9+/=]{20,}',
-            r'(aws_access_key_id|aws_secret_access_key)\s*=\s*[A-Za-z0-9+/=]{20,}',
-            r'-----BEGIN (RSA |EC )?PRIVATE KEY-----'
-        ]
-
-        patterns = self.redact_patterns if self.redact_patterns else default_patterns
-
-        for pattern in patterns:
-            try:
-                if re.search(pattern, content, re.IGNORECASE):
-                    found_secrets.append(pattern[:20] + '...')
-            except re.error:
-                pass
+        for pattern, secret_re in self._secret_res:
+            if secret_re.search(content):
+                found_secrets.append(pattern[:20] + '...')
 
         return found_secrets
 
@@ -132,22 +162,13 @@ class LLMTxtLinter:
         warnings = []
 
         # Check for required sections
-        required_sections = [
-            'quickstart|getting.?started|introduction',
-            'installation|setup',
-            'configuration|config|options',
-            'api|reference|commands',
-            'error|troubleshoot|debug'
-        ]
-
         content_lower = content.lower()
-        for section_pattern in required_sections:
-            if not re.search(section_pattern, content_lower):
-                section_name = section_pattern.split('|')[0]
+        for section_name, section_re in _REQUIRED_SECTION_RES:
+            if not section_re.search(content_lower):
                 warnings.append(f"Missing recommended section: {section_name}")
 
         # Check for proper heading structure
-        headings = re.findall(r'^(#{1,6})\s+(.+)$', content, re.MULTILINE)
+        headings = _HEADING_RE.findall(content)
         if not headings:
             warnings.append("No headings found in content")
         else:
@@ -160,12 +181,12 @@ class LLMTxtLinter:
                 prev_level = level
 
         # Check for code blocks
-        code_blocks = re.findall(r'```[\s\S]*?```', content)
+        code_blocks = _CODE_BLOCK_RE.findall(content)
         if len(code_blocks) > 20:
             warnings.append(f"Excessive code blocks: {len(code_blocks)} found")
 
         # Check for empty sections
-        sections = re.split(r'^#{1,6}\s+', content, flags=re.MULTILINE)[1:]
+        sections = _HEADING_START_RE.split(content)[1:]
         for section in sections:
             lines = section.strip().split('\n')
             if len(lines) <= 2:  # Just heading and maybe one line
@@ -177,8 +198,8 @@ class LLMTxtLinter:
     def _extract_links(self, content: str) -> List[str]:
         """Extract HTTP(S) links from content."""
         # Match markdown links and plain URLs
-        markdown_links = re.findall(r'\[.*?\]\((https?://[^)]+)\)', content)
-        plain_links = re.findall(r'(?<!\])\bhttps?://[^\s<>"\[\]]+', content)
+        markdown_links = _MD_LINK_RE.findall(content)
+        plain_links = _PLAIN_URL_RE.findall(content)
 
         all_links = list(set(markdown_links + plain_links))
 
@@ -0,0 +1,120 @@
+"""Tests for AsyncWebCrawler URL handling."""
+
+import asyncio
+
+import pytest
+
+from llm_txt.crawler.async_crawler import AsyncWebCrawler, _canonicalize, _dedupe_urls
+from llm_txt.crawler.models import CrawlConfig, PageContent
+
+
+def test_canonicalize_normalizes_equivalent_spellings():
+    assert _canonicalize('HTTPS://Docs.Example.com//guide//intro/?b=2&a=1#top') == (
+        'https://docs.example.com/guide/intro?a=1&b=2'
+    )
+    assert _canonicalize('https://docs.example.com') == 'https://docs.example.com/'
+    assert _canonicalize('https://docs.example.com/?q=') == 'https://docs.example.com/?q='
+
+
+def test_dedupe_urls_keeps_one_spelling_per_page():
+    urls = _dedupe_urls({
+        'https://docs.example.com/guide/',
+        'https://Docs.example.com/guide',
+        'https://docs.example.com/guide#install',
+        'https://docs.example.com//guide/',
+        'https://docs.example.com/search?b=2&a=1',
+        'https://docs.example.com/search?a=1&b=2',
+        'https://docs.example.com/other',
+    })
+
+    assert sorted(urls) == [
+        'https://docs.example.com/guide',
+        'https://docs.example.com/other',
+        'https://docs.example.com/search?a=1&b=2',
+    ]
+
+
+def test_dedupe_urls_keeps_trailing_slash_of_sole_spelling():
+    assert _dedupe_urls({'https://Docs.example.com/guide/#top'}) == {'https://docs.example.com/guide/'}
+
+
+def test_organize_urls_with_mixed_case_start_host():
+    crawler = AsyncWebCrawler()
+    urls = _dedupe_urls({
+        'https://Docs.Example.com/',
+        'https://docs.example.com/guide/intro',
+        'https://other.example.com/page',
+    })
+
+    by_depth = crawler._organize_urls_by_depth('https://Docs.Example.com/', urls)
+
+    assert by_depth == {
+        0: ['https://docs.example.com/'],
+        2: ['https://docs.example.com/guide/intro'],
+    }
+
+
+@pytest.mark.asyncio
+async def test_workers_overlap_fetches_to_one_host(monkeypatch):
+    urls = {f'https://docs.example.com/guide/p{i}' for i in range(8)}
+    # The default request_delay must not serialize requests to the host
+    crawler = AsyncWebCrawler(CrawlConfig(
+        max_pages=9, max_concurrency=4, per_host_limit=4, respect_robots=False
+    ))
+
+    async def discover_urls(start_url, session):
+        return set(urls)
+
+    in_flight = 0
+    peak = 0
+
+    async def fetch(session, url, depth):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return PageContent(
+            url=url, title='', content='', markdown='', depth=depth, timestamp=0.0,
+            status_code=200, content_type='text/html', links=[], metadata={}
+        )
+
+    monkeypatch.setattr(crawler.sitemap_parser, 'discover_urls', discover_urls)
+    monkeypatch.setattr(crawler, '_fetch_page_unbounded', fetch)
+
+    result = await crawler.crawl('https://docs.example.com/guide/')
+
+    assert len(result.pages) == 9
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_records_url(monkeypatch):
+    crawler = AsyncWebCrawler(CrawlConfig(respect_robots=False))
+
+    async def discover_urls(start_url, session):
+        return {'https://docs.example.com/broken'}
+
+    async def fetch(session, url, depth):
+        raise RuntimeError('boom')
+
+    monkeypatch.setattr(crawler.sitemap_parser, 'discover_urls', discover_urls)
+    monkeypatch.setattr(crawler, '_fetch_page_unbounded', fetch)
+
+    result = await crawler.crawl('https://docs.example.com/')
+
+    assert sorted(result.failed_urls) == ['https://docs.example.com/', 'https://docs.example.com/broken']
+
+
+@pytest.mark.asyncio
+async def test_robots_crawl_delay_spaces_requests(monkeypatch):
+    crawler = AsyncWebCrawler(CrawlConfig(request_delay=0.0))
+    monkeypatch.setattr(crawler.robots_checker, 'get_crawl_delay', lambda url: 0.05)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    await asyncio.gather(*[
+        crawler._respect_crawl_delay(f'https://docs.example.com/p{i}') for i in range(3)
+    ])
+
+    assert loop.time() - started >= 0.1
@@ -0,0 +1,121 @@
+"""Tests for LLMTxtComposer page ranking, truncation and output validation."""
+
+import pytest
+
+from llm_txt.composer.composer import LLMTxtComposer
+from llm_txt.crawler.models import PageContent
+
+
+@pytest.fixture
+def composer(monkeypatch):
+    monkeypatch.delenv('COHERE_API_KEY', raising=False)
+    return LLMTxtComposer(max_kb=100)
+
+
+def _page(url, title, content='', depth=1):
+    return PageContent(
+        url=url, title=title, content=content or f'Body of {url}', markdown='',
+        depth=depth, timestamp=1.0, status_code=200, content_type='text/html',
+        links=[], metadata={}
+    )
+
+
+def _pages():
+    return [
+        _page('https://example.com/blog/2024-01-01/news', 'Company news'),
+        _page('https://example.com/docs/installation', 'Installation'),
+        _page('https://example.com/docs/intro', 'Intro A'),
+        _page('https://example.com/docs/api', 'API reference'),
+        _page('https://example.com/docs/other', 'Intro B'),
+        _page('https://example.com/docs/guide', 'Usage guide'),
+    ]
+
+
+def test_top_k_matches_full_ranking_prefix(composer):
+    pages = _pages()
+    full = composer._prioritize_pages(pages)
+
+    for limit in range(1, len(pages) + 1):
+        assert composer._prioritize_pages(pages, limit=limit) == full[:limit]
+
+
+def test_ranking_orders_by_score_then_input_order(composer):
+    urls = [page.url for page in composer._prioritize_pages(_pages())]
+
+    assert urls == [
+        'https://example.com/docs/installation',
+        'https://example.com/docs/api',
+        'https://example.com/docs/guide',
+        'https://example.com/docs/intro',
+        'https://example.com/docs/other',
+        'https://example.com/blog/2024-01-01/news',
+    ]
+
+
+def test_ranking_drops_duplicate_content(composer):
+    pages = [_page('https://example.com/a', 'A', 'same text'), _page('https://example.com/b', 'B', 'same text')]
+
+    assert [page.url for page in composer._prioritize_pages(pages)] == ['https://example.com/a']
+
+
+def test_budget_candidates_continue_past_estimate(composer):
+    pages = [_page(f'https://example.com/docs/p{i:02}', f'Page {i}') for i in range(30)]
+    composer.max_kb = 1  # estimate falls back to the 20-page minimum
+
+    candidates = list(composer._iter_budget_candidates(pages))
+
+    assert candidates == composer._prioritize_pages(pages)
+
+
+def test_truncate_content_cuts_at_line_break(composer):
+    content = '\n'.join(f'line {i:03} ' + 'é' * 20 for i in range(100))
+
+    truncated = composer._truncate_content(content, 1000)
+
+    body, marker = truncated.split('\n\n[... content truncated due to size limits ...]')
+    assert marker == ''
+    assert len(body.encode('utf-8')) <= 900
+    assert content.startswith(body + '\n')
+
+
+def test_truncate_content_keeps_content_within_limit(composer):
+    assert composer._truncate_content('short\ntext', 1000) == 'short\ntext'
+
+
+def test_truncate_content_without_line_break_in_budget(composer):
+    truncated = composer._truncate_content('x' * 500, 200)
+
+    assert truncated == '\n\n[... content truncated due to size limits ...]'
+
+
+@pytest.mark.parametrize('content', [
+    '# Title\n\n## Section\n\n### Detail\n',
+    '# Title\n\n### Section directly under the title\n',
+    '## No title\n\n### Detail\n',
+    '# Title\n\n```\n## a\n#### inside code\n```\n',
+    b'# T\xc3\xa9\n\n## Section\n',
+])
+def test_validate_accepts_well_formed_output(composer, content):
+    assert composer._validate_output_quality(content) == (True, [])
+
+
+@pytest.mark.parametrize('content, issue', [
+    ('', 'Empty content'),
+    ('  \n', 'Empty content'),
+    ('# Title\n\n```python\nprint(1)\n', 'Unclosed fenced code block'),
+    ('# Title\n\n## Section\n\n#### Skipped\n', 'Header hierarchy skips levels'),
+    (b'## Section\n\n#### Skipped\n', 'Header hierarchy skips levels'),
+])
+def test_validate_reports_issues(composer, content, issue):
+    is_valid, issues = composer._validate_output_quality(content)
+
+    assert not is_valid
+    assert issues == [issue]
+
+
+def test_validate_measures_size_in_utf8_bytes(composer):
+    composer.max_kb = 1
+    accented = 'é' * 1500  # 1500 characters, 3000 bytes
+
+    assert composer._validate_output_quality(accented) == (False, ['Output exceeds 2x configured max_kb'])
+    assert composer._validate_output_quality('e' * 1500) == (True, [])
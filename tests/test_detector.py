@@ -0,0 +1,112 @@
+"""Tests for FrameworkDetector detection and its signature-keyed cache."""
+
+import json
+import os
+
+import pytest
+
+from llm_txt.frameworks.detector import FrameworkDetector
+
+
+@pytest.fixture
+def detect_calls(monkeypatch):
+    """Count the detections that actually inspect a repository."""
+    calls = []
+    original = FrameworkDetector._detect
+
+    def counting_detect(self, files):
+        calls.append(files.root)
+        return original(self, files)
+
+    monkeypatch.setattr(FrameworkDetector, '_detect', counting_detect)
+    return calls
+
+
+@pytest.mark.parametrize('files, framework', [
+    ({'docusaurus.config.js': ''}, 'docusaurus'),
+    ({'package.json': json.dumps({'devDependencies': {'@docusaurus/core': '3'}})}, 'docusaurus'),
+    ({'mkdocs.yml': 'site_name: x\n'}, 'mkdocs'),
+    ({'requirements.txt': 'MkDocs-Material\n'}, 'mkdocs'),
+    ({'docs/conf.py': "extensions = ['sphinx.ext.autodoc']\n"}, 'sphinx'),
+    ({'Makefile': 'html:\n\tsphinx-build -b html . _build\n'}, 'sphinx'),
+    ({'astro.config.mjs': "import starlight from '@astrojs/starlight'\n"}, 'starlight'),
+    ({'README.md': '# nothing\n'}, None),
+])
+def test_detects_framework(tmp_path, files, framework):
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    assert FrameworkDetector(cache_path=None).detect(tmp_path) == framework
+
+
+def test_large_package_json_dependencies(tmp_path):
+    package = {'description': 'x' * 20000, 'dependencies': {'@astrojs/starlight': '0.1'}}
+    (tmp_path / 'package.json').write_text(json.dumps(package))
+
+    assert FrameworkDetector(cache_path=None).detect(tmp_path) == 'starlight'
+
+
+def test_cached_result_reused_until_signature_changes(tmp_path, detect_calls):
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    (repo / 'requirements.txt').write_text('requests\n')
+    detector = FrameworkDetector(cache_path=tmp_path / 'detect.json')
+
+    assert detector.detect(repo) is None
+    assert detector.detect(repo) is None
+    assert len(detect_calls) == 1
+
+    # A changed manifest (size and mtime) invalidates the entry
+    (repo / 'requirements.txt').write_text('requests\nmkdocs\n')
+    os.utime(repo / 'requirements.txt', ns=(1, 1))
+    assert detector.detect(repo) == 'mkdocs'
+    assert len(detect_calls) == 2
+
+    # So does a newly added framework file
+    (repo / 'docusaurus.config.js').write_text('')
+    assert detector.detect(repo) == 'docusaurus'
+    assert len(detect_calls) == 3
+
+
+def test_cache_persists_between_detectors(tmp_path, detect_calls):
+    repo = tmp_path / 'repo'
+    repo.mkdir()
+    (repo / 'mkdocs.yml').write_text('site_name: x\n')
+    cache_path = tmp_path / 'detect.json'
+
+    assert FrameworkDetector(cache_path=cache_path).detect(repo) == 'mkdocs'
+    assert FrameworkDetector(cache_path=cache_path).detect(repo) == 'mkdocs'
+    assert len(detect_calls) == 1
+
+
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch, detect_calls):
+    monkeypatch.setattr(FrameworkDetector, 'MAX_CACHE_ENTRIES', 2)
+    repos = []
+    for name in ('a', 'b', 'c'):
+        repo = tmp_path / name
+        repo.mkdir()
+        repos.append(repo)
+    a, b, c = repos
+    detector = FrameworkDetector(cache_path=tmp_path / 'detect.json')
+
+    detector.detect(a)
+    detector.detect(b)
+    detector.detect(a)  # a becomes the most recently used
+    detector.detect(c)  # evicts b
+    assert len(detect_calls) == 3
+
+    detector.detect(a)
+    assert len(detect_calls) == 3
+    detector.detect(b)
+    assert len(detect_calls) == 4
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    cache_path = tmp_path / 'detect.json'
+    cache_path.write_text('{not json')
+    (tmp_path / 'mkdocs.yml').write_text('site_name: x\n')
+
+    assert FrameworkDetector(cache_path=cache_path).detect(tmp_path) == 'mkdocs'
+    assert json.loads(cache_path.read_text())
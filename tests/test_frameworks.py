@@ -0,0 +1,42 @@
+"""Tests for framework adapter front matter handling."""
+
+from llm_txt.frameworks.adapters import DocusaurusAdapter
+
+LONG_FRONT_MATTER = (
+    '---\n'
+    'title: Long Page\n'
+    'sidebar_position: 3\n'
+    f'description: "{"x" * 20000}"\n'
+    '---\n'
+    '# Heading\n'
+)
+
+
+def test_extract_front_matter_beyond_read_size():
+    front_matter = DocusaurusAdapter().extract_front_matter(LONG_FRONT_MATTER)
+
+    assert front_matter['title'] == 'Long Page'
+    assert front_matter['sidebar_position'] == 3
+
+
+def test_extract_front_matter_from_path_reads_until_closing_delimiter(tmp_path):
+    page = tmp_path / 'long.md'
+    page.write_text(LONG_FRONT_MATTER, encoding='utf-8')
+    adapter = DocusaurusAdapter()
+
+    assert adapter.extract_front_matter_from_path(page)['sidebar_position'] == 3
+    assert adapter.get_title_from_file(page) == 'Long Page'
+
+
+def test_extract_front_matter_from_path_without_front_matter(tmp_path):
+    page = tmp_path / 'plain.md'
+    page.write_text('# Plain\n' + 'text\n' * 5000, encoding='utf-8')
+
+    assert DocusaurusAdapter().extract_front_matter_from_path(page) == {}
+
+
+def test_unterminated_front_matter_is_ignored(tmp_path):
+    page = tmp_path / 'open.md'
+    page.write_text('---\ntitle: Open\n' + 'text\n' * 5000, encoding='utf-8')
+
+    assert DocusaurusAdapter().extract_front_matter_from_path(page) == {}
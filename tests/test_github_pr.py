@@ -0,0 +1,140 @@
+"""Tests for committing files through the GitHub git data API."""
+
+import base64
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from llm_txt.github import pr as pr_module
+from llm_txt.github.pr import GitHubPR, _git_blob_sha
+
+REPO = '/repos/owner/repo'
+
+
+def test_git_blob_sha_matches_git_hash_object():
+    assert _git_blob_sha(b'') == 'e69de29bb2d1d6434b8b29ae775ad8c2e48c5391'
+    assert _git_blob_sha(b'hello\n') == 'ce013625030ba8dba906f756967f9e9ca394464a'
+
+
+class FakeGitHub:
+    """In-memory git data API for one branch whose tree holds ``files``."""
+
+    def __init__(self, files, fail_blobs=False):
+        self.tree = {path: _git_blob_sha(content) for path, content in files.items()}
+        self.fail_blobs = fail_blobs
+        self.requests = []
+        self.posted_trees = []
+        self.ref = 'c1'
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get(REPO + '/git/refs/heads/{branch:.*}', self.get_ref)
+        app.router.add_patch(REPO + '/git/refs/heads/{branch:.*}', self.patch_ref)
+        app.router.add_get(REPO + '/git/commits/{sha}', self.get_commit)
+        app.router.add_post(REPO + '/git/commits', self.post_commit)
+        app.router.add_get(REPO + '/git/trees/{sha}', self.get_tree)
+        app.router.add_post(REPO + '/git/trees', self.post_tree)
+        app.router.add_post(REPO + '/git/blobs', self.post_blob)
+        return app
+
+    async def get_ref(self, request):
+        self.requests.append('GET ref')
+        return web.json_response({'object': {'sha': self.ref}})
+
+    async def patch_ref(self, request):
+        self.requests.append('PATCH ref')
+        self.ref = (await request.json())['sha']
+        return web.json_response({})
+
+    async def get_commit(self, request):
+        self.requests.append('GET commit')
+        return web.json_response({'tree': {'sha': 't1'}})
+
+    async def post_commit(self, request):
+        self.requests.append('POST commit')
+        return web.json_response({'sha': 'c2'}, status=201)
+
+    async def get_tree(self, request):
+        self.requests.append('GET tree')
+        items = [{'path': path, 'type': 'blob', 'sha': sha} for path, sha in self.tree.items()]
+        return web.json_response({'tree': items})
+
+    async def post_tree(self, request):
+        self.requests.append('POST tree')
+        self.posted_trees.append((await request.json())['tree'])
+        return web.json_response({'sha': 't2'}, status=201)
+
+    async def post_blob(self, request):
+        self.requests.append('POST blob')
+        if self.fail_blobs:
+            return web.json_response({}, status=500)
+        content = base64.b64decode((await request.json())['content'])
+        return web.json_response({'sha': _git_blob_sha(content)}, status=201)
+
+
+async def _commit(fake, files):
+    server = TestServer(fake.app())
+    await server.start_server()
+    try:
+        github_pr = GitHubPR('owner', 'repo')
+        github_pr.api_base = str(server.make_url('')).rstrip('/')
+        async with aiohttp.ClientSession() as session:
+            return await github_pr._commit_files(session, 'llm-txt/update', files, 'Update llm.txt')
+    finally:
+        await server.close()
+
+
+@pytest.fixture(autouse=True)
+def home(tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+
+
+@pytest.mark.asyncio
+async def test_unchanged_files_skip_the_commit():
+    fake = FakeGitHub({'public/llm.txt': b'# Docs\n'})
+
+    sha = await _commit(fake, [{'path': 'public/llm.txt', 'content': b'# Docs\n'}])
+
+    assert sha == 'c1'
+    assert 'POST tree' not in fake.requests and 'POST blob' not in fake.requests
+
+
+@pytest.mark.asyncio
+async def test_changed_files_inline_text_and_upload_binary(monkeypatch):
+    monkeypatch.setattr(pr_module, '_INLINE_CONTENT_LIMIT', 16)
+    fake = FakeGitHub({'public/llm.txt': b'# Docs\n'})
+    files = [
+        {'path': 'public/llm.txt', 'content': b'# Docs\n'},
+        {'path': 'public/llms-full.txt', 'content': '# Full é\n'.encode('utf-8')},
+        {'path': 'reports/large.json', 'content': b'{"x": "' + b'y' * 32 + b'"}'},
+        {'path': 'reports/binary.bin', 'content': b'\xff\xfe'},
+    ]
+
+    sha = await _commit(fake, files)
+
+    assert sha == 'c2'
+    assert fake.requests.count('POST blob') == 2
+    items = {item['path']: item for item in fake.posted_trees[0]}
+    assert items['public/llm.txt']['sha'] == _git_blob_sha(b'# Docs\n')
+    assert items['public/llms-full.txt']['content'] == '# Full é\n'
+    assert items['reports/large.json']['sha'] == _git_blob_sha(files[2]['content'])
+    assert items['reports/binary.bin']['sha'] == _git_blob_sha(b'\xff\xfe')
+    assert fake.ref == 'c2'
+
+
+@pytest.mark.asyncio
+async def test_failed_blob_upload_fails_the_commit(monkeypatch):
+    monkeypatch.setattr(pr_module, '_INLINE_CONTENT_LIMIT', 0)
+    fake = FakeGitHub({'public/llm.txt': b'# Docs\n'}, fail_blobs=True)
+    files = [
+        {'path': 'public/llm.txt', 'content': b'# Docs\n'},
+        {'path': 'public/llms-full.txt', 'content': b'# Full\n'},
+    ]
+
+    sha = await _commit(fake, files)
+
+    assert sha is None
+    assert 'POST tree' not in fake.requests and 'POST commit' not in fake.requests
+    assert fake.ref == 'c1'
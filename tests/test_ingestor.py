@@ -0,0 +1,93 @@
+"""Tests for documentation file discovery and include/exclude filtering."""
+
+import fnmatch
+import os
+from pathlib import Path
+
+import pytest
+
+from llm_txt.ingest.ingestor import RepoIngestor, _compile_globs, _scan_doc_files
+
+
+def test_compile_globs_without_patterns():
+    assert _compile_globs([]) is None
+
+
+@pytest.mark.parametrize('path', [
+    'docs/intro.md', 'docs/api/ref.mdx', 'README.md', 'node_modules/pkg/readme.md',
+    'docs/guide.rst', 'src/main.py',
+])
+def test_compile_globs_matches_like_fnmatch(path):
+    patterns = ['docs/**/*.md', '*.md', 'node_modules/*', 'docs/*.rst']
+    combined = _compile_globs(patterns)
+
+    expected = any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+    assert bool(combined.match(path)) == expected
+
+
+@pytest.fixture
+def repo(tmp_path):
+    for name in (
+        'README.md', 'docs/intro.md', 'docs/api/ref.mdx', 'docs/guide.rst',
+        'docs/notes.txt', 'node_modules/pkg/readme.md', 'docs/drafts/wip.md',
+    ):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f'# {path.stem}\n\nBody\n')
+    return tmp_path
+
+
+def test_should_include_applies_excludes_first(repo):
+    ingestor = RepoIngestor(['**/*.md', '**/*.mdx'], ['node_modules/**', '**/drafts/**'])
+
+    def included(name):
+        return ingestor._should_include(repo / name, repo)
+
+    assert included('README.md')  # '**/' patterns also match top-level files
+    assert included('docs/intro.md')
+    assert included('docs/api/ref.mdx')
+    assert not included('docs/guide.rst')
+    assert not included('node_modules/pkg/readme.md')
+    assert not included('docs/drafts/wip.md')
+
+
+def test_should_include_without_include_patterns(repo):
+    assert not RepoIngestor([], [])._should_include(repo / 'README.md', repo)
+
+
+def test_should_include_file_outside_repo(repo, tmp_path_factory):
+    outside = tmp_path_factory.mktemp('elsewhere') / 'page.md'
+
+    assert RepoIngestor(['*.md'], [])._should_include(outside, repo)
+
+
+def test_scan_doc_files_walks_nested_directories(repo):
+    found = sorted(os.path.relpath(path, repo) for path in _scan_doc_files(str(repo)))
+
+    assert found == sorted(os.path.normpath(name) for name in (
+        'README.md', 'docs/api/ref.mdx', 'docs/drafts/wip.md', 'docs/guide.rst',
+        'docs/intro.md', 'node_modules/pkg/readme.md',
+    ))
+
+
+def test_scan_doc_files_does_not_follow_directory_symlinks(repo, tmp_path_factory):
+    target = tmp_path_factory.mktemp('linked')
+    (target / 'linked.md').write_text('# Linked\n')
+    try:
+        os.symlink(target, repo / 'docs' / 'link', target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip('symlinks not supported')
+
+    found = {Path(path).name for path in _scan_doc_files(str(repo))}
+
+    assert 'linked.md' not in found
+
+
+def test_scan_doc_files_missing_directory(tmp_path):
+    assert list(_scan_doc_files(str(tmp_path / 'missing'))) == []
+
+
+def test_ingest_returns_included_pages(repo):
+    pages = RepoIngestor(['**/*.md'], ['node_modules/**', '**/drafts/**']).ingest(repo)
+
+    assert sorted(page.path.name for page in pages) == ['README.md', 'intro.md']
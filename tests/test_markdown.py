@@ -0,0 +1,73 @@
+"""Tests for the lxml markdown renderer and its html2text fallback."""
+
+from llm_txt.crawler.async_crawler import AsyncWebCrawler, _parse_html
+from llm_txt.crawler.markdown import count_words, tree_to_markdown
+
+
+def _main(body):
+    return _parse_html(f'<html><body><main>{body}</main></body></html>').find('.//main')
+
+
+def test_headings_and_inline_markup():
+    rendered = tree_to_markdown(_main(
+        '<h1>Title</h1><h3>Sub <em>section</em></h3>'
+        '<p>Hello <strong>big</strong>\n   world</p><h2>  </h2>'
+    ))
+
+    assert rendered.markdown == '# Title\n\n### Sub _section_\n\nHello **big** world'
+    assert rendered.text == 'Title Sub section Hello big world'
+    assert rendered.word_count == 6
+
+
+def test_code_blocks_keep_whitespace_and_language():
+    rendered = tree_to_markdown(_main(
+        '<p>Run <code>pip install x</code></p>'
+        '<pre><code class="language-python">def f():\n    return   1\n</code></pre>'
+    ))
+
+    assert rendered.markdown == (
+        'Run `pip install x`\n\n'
+        '```python\ndef f():\n    return   1\n```'
+    )
+
+
+def test_links_and_lists():
+    rendered = tree_to_markdown(_main(
+        '<p><a href="/guide">Guide</a> <a>bare</a></p>'
+        '<ul><li>one<ul><li>two</li></ul></li></ul>'
+        '<ol start="3"><li>a</li><li>b</li></ol>'
+    ))
+
+    assert rendered.markdown == (
+        '[Guide](/guide) bare\n\n'
+        '  * one\n    * two\n\n'
+        '  3. a\n  4. b'
+    )
+
+
+def test_skipped_elements_do_not_reach_output():
+    rendered = tree_to_markdown(_main(
+        '<p>Text<img src="a.png"><script>var x = 1;</script><button>Click</button></p>'
+    ))
+
+    assert rendered.markdown == 'Text'
+    assert rendered.word_count == 1
+
+
+def test_unsupported_markup_falls_back_to_html2text():
+    main = _main('<table><tr><th>Name</th></tr><tr><td>value</td></tr></table>')
+
+    assert tree_to_markdown(main) is None
+
+    crawler = AsyncWebCrawler()
+    markdown = crawler._html2text_markdown(main)
+    assert 'Name' in markdown and 'value' in markdown and '---' in markdown
+    # The converter goes back to the pool and is reused for the next page
+    assert len(crawler._h2t_pool) == 1
+    crawler._html2text_markdown(main)
+    assert len(crawler._h2t_pool) == 1
+
+
+def test_count_words():
+    assert count_words('  one two\nthree\t') == 3
+    assert count_words('') == 0
@@ -0,0 +1,93 @@
+"""Tests for RobotsChecker caching in memory and on disk."""
+
+import os
+import time
+from types import SimpleNamespace
+
+from llm_txt.crawler import robots
+from llm_txt.crawler.robots import RobotsChecker
+
+ROBOTS_TXT = 'User-agent: *\nDisallow: /private\nCrawl-delay: 2\n'
+
+
+def _checker(responses, **kwargs):
+    """RobotsChecker whose HTTP session serves the given (status, body) per call."""
+    checker = RobotsChecker(**kwargs)
+    calls = []
+
+    def get(url, timeout=None):
+        calls.append(url)
+        status, text = responses[min(len(calls), len(responses)) - 1]
+        return SimpleNamespace(status_code=status, text=text)
+
+    checker.session.get = get
+    return checker, calls
+
+
+def test_robots_rules_loaded_once_per_origin():
+    checker, calls = _checker([(200, ROBOTS_TXT)])
+
+    assert checker.can_fetch('https://example.com/docs')
+    assert not checker.can_fetch('https://example.com/private/x')
+    assert checker.get_crawl_delay('https://example.com/docs') == 2.0
+    assert calls == ['https://example.com/robots.txt']
+
+
+def test_memory_cache_expires_after_ttl(monkeypatch):
+    checker, calls = _checker([(200, ROBOTS_TXT), (404, '')], cache_ttl=60)
+    now = [1000.0]
+    monkeypatch.setattr(robots.time, 'time', lambda: now[0])
+
+    assert not checker.can_fetch('https://example.com/private/x')
+    now[0] += 59
+    assert not checker.can_fetch('https://example.com/private/x')
+    assert len(calls) == 1
+
+    now[0] += 2
+    # Reloaded; robots.txt is gone now, so everything is allowed
+    assert checker.can_fetch('https://example.com/private/x')
+    assert len(calls) == 2
+
+
+def test_disk_cache_shared_between_checkers(tmp_path):
+    first, first_calls = _checker([(200, ROBOTS_TXT)], cache_dir=str(tmp_path))
+    assert not first.can_fetch('https://example.com/private/x')
+
+    second, second_calls = _checker([(500, '')], cache_dir=str(tmp_path))
+    assert not second.can_fetch('https://example.com/private/x')
+    assert second.get_crawl_delay('https://example.com/') == 2.0
+    assert len(first_calls) == 1
+    assert second_calls == []
+
+
+def test_expired_disk_cache_is_refetched(tmp_path):
+    first, _ = _checker([(200, ROBOTS_TXT)], cache_dir=str(tmp_path), cache_ttl=60)
+    first.can_fetch('https://example.com/')
+    for name in os.listdir(tmp_path):
+        stale = time.time() - 120
+        os.utime(tmp_path / name, (stale, stale))
+
+    second, calls = _checker([(200, 'User-agent: *\nDisallow:\n')], cache_dir=str(tmp_path), cache_ttl=60)
+    assert second.can_fetch('https://example.com/private/x')
+    assert len(calls) == 1
+
+
+def test_missing_robots_txt_is_cached_as_allowed(tmp_path):
+    first, _ = _checker([(404, '')], cache_dir=str(tmp_path))
+    assert first.can_fetch('https://example.com/anything')
+
+    second, calls = _checker([(200, 'User-agent: *\nDisallow: /\n')], cache_dir=str(tmp_path))
+    assert second.can_fetch('https://example.com/anything')
+    assert calls == []
+
+
+def test_memory_cache_evicts_oldest_origin(monkeypatch):
+    monkeypatch.setattr(RobotsChecker, 'MAX_CACHE_ENTRIES', 2)
+    checker, calls = _checker([(404, '')])
+
+    for host in ('a.example.com', 'b.example.com', 'c.example.com'):
+        checker.can_fetch(f'https://{host}/')
+    assert set(checker._cache) == {('https', 'b.example.com'), ('https', 'c.example.com')}
+
+    checker.can_fetch('https://a.example.com/')
+    assert len(calls) == 4
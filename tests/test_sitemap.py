@@ -0,0 +1,146 @@
+"""Tests for sitemap discovery and streaming parsing."""
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from llm_txt.crawler.sitemap import SitemapParser
+
+URLSET = (
+    '<?xml version="1.0"?>'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{}</urlset>'
+)
+INDEX = (
+    '<?xml version="1.0"?>'
+    '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{}</sitemapindex>'
+)
+
+
+def _urls(*locs):
+    return URLSET.format(''.join(f'<url><loc>{loc}</loc></url>' for loc in locs))
+
+
+def _index(*locs):
+    return INDEX.format(''.join(f'<sitemap><loc>{loc}</loc></sitemap>' for loc in locs))
+
+
+async def _discover(routes, parser=None):
+    """Run discovery against a local server serving path -> (status, body).
+
+    ``{base}`` in a body is replaced with the server's origin. Returns the
+    discovered URLs and the number of requests per path.
+    """
+    hits = {}
+
+    async def handle(request):
+        hits[request.path] = hits.get(request.path, 0) + 1
+        status, body = routes.get(request.path, (404, ''))
+        body = body.replace('{base}', f'http://{request.host}')
+        return web.Response(status=status, text=body, content_type='application/xml')
+
+    app = web.Application()
+    app.router.add_route('GET', '/{tail:.*}', handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with aiohttp.ClientSession() as session:
+            urls = await (parser or SitemapParser()).discover_urls(str(server.make_url('/')), session)
+    finally:
+        await server.close()
+    return urls, hits
+
+
+@pytest.mark.asyncio
+async def test_streams_urlset_and_skips_invalid_locs():
+    urls, _ = await _discover({
+        '/sitemap.xml': (200, _urls(
+            'https://example.com/a', ' https://example.com/b ', 'ftp://example.com/c', 'not a url'
+        )),
+    })
+
+    assert urls == {'https://example.com/a', 'https://example.com/b'}
+
+
+@pytest.mark.asyncio
+async def test_conventional_sitemap_used_without_robots_declaration():
+    urls, hits = await _discover({
+        '/robots.txt': (200, 'User-agent: *\nDisallow:\n'),
+        '/sitemap/sitemap.xml': (200, _urls('https://example.com/docs/a')),
+    })
+
+    assert urls == {'https://example.com/docs/a'}
+    assert hits['/sitemap.xml'] == 1
+
+
+@pytest.mark.asyncio
+async def test_conventional_sitemap_probed_alongside_robots_declaration():
+    urls, hits = await _discover({
+        '/robots.txt': (200, 'Sitemap: {base}/declared.xml\nSitemap: {base}/sitemap.xml\n'),
+        '/declared.xml': (200, _urls('https://example.com/a')),
+        '/sitemap_index.xml': (200, _urls('https://example.com/b')),
+        '/sitemap.xml': (200, _urls('https://example.com/c')),
+    })
+
+    assert urls == {'https://example.com/a', 'https://example.com/b', 'https://example.com/c'}
+    # Declared and conventional locations are fetched once; the extra
+    # locations are only tried when robots.txt declares nothing
+    assert hits['/sitemap.xml'] == 1
+    assert '/sitemaps.xml' not in hits
+
+
+@pytest.mark.asyncio
+async def test_sitemap_index_cycle_fetches_each_sitemap_once():
+    urls, hits = await _discover({
+        '/sitemap.xml': (200, _index('{base}/a.xml', '{base}/b.xml')),
+        '/a.xml': (200, _index('{base}/b.xml', '{base}/sitemap.xml')),
+        '/b.xml': (200, _index('{base}/a.xml', '{base}/pages.xml')),
+        '/pages.xml': (200, _urls('https://example.com/page')),
+    })
+
+    assert urls == {'https://example.com/page'}
+    assert all(hits[path] == 1 for path in ('/sitemap.xml', '/a.xml', '/b.xml', '/pages.xml'))
+
+
+@pytest.mark.asyncio
+async def test_error_status_is_logged_as_warning(caplog):
+    urls, _ = await _discover({'/sitemap.xml': (503, '')})
+
+    assert urls == set()
+    assert any(
+        record.levelname == 'WARNING' and 'HTTP 503' in record.getMessage()
+        for record in caplog.records
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_sitemap_reused_on_not_modified(tmp_path):
+    etag = '"v1"'
+    served = {'count': 0}
+
+    async def handle(request):
+        if request.path != '/sitemap.xml':
+            return web.Response(status=404)
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304)
+        served['count'] += 1
+        return web.Response(
+            text=_urls('https://example.com/a'), content_type='application/xml',
+            headers={'ETag': etag}
+        )
+
+    app = web.Application()
+    app.router.add_route('GET', '/{tail:.*}', handle)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        async with aiohttp.ClientSession() as session:
+            results = [
+                await SitemapParser(cache_dir=str(tmp_path)).discover_urls(str(server.make_url('/')), session)
+                for _ in range(2)
+            ]
+    finally:
+        await server.close()
+
+    assert results == [{'https://example.com/a'}] * 2
+    assert served['count'] == 1